@@ -0,0 +1,194 @@
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import os
+import queue
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from utils import load_yolo_weights_config, save_runtime_config
+from .dataset import list_bundled_images
+
+
+def _parse_switch(value: str) -> Optional[bool]:
+    return {'on': True, 'off': False, 'default': None}[value]
+
+
+def _worker(settings: Dict[str, Any], image_paths: List[str], barrier: Any, results: Any) -> None:
+    """
+    Load one model pair with the given thread settings and time the pipeline stages over the images.
+
+    Runs in its own process, so torch and Paddle thread pools are sized independently of the parent.
+    Always puts one (images, seconds, error) tuple on 'results'.
+    """
+    try:
+        # Imported in the worker so the parent process never starts torch or Paddle thread pools
+        from ocr import load_ocr_model
+        from pipeline import run_detection_stage, run_ocr_stage, run_postprocessing_stage
+        from yolo_detection import load_model
+
+        yolo_model = load_model(load_yolo_weights_config(), num_threads=settings['torch_threads'])
+        ocr_model = load_ocr_model(cpu_threads=settings['ocr_cpu_threads'], enable_mkldnn=settings['ocr_enable_mkldnn'])
+
+        # Warm up before the timed run
+        run_ocr_stage(ocr_model, run_detection_stage(yolo_model, image_paths[0]))
+        error = None
+
+    except Exception as e:
+        error = str(e)
+
+    try:
+        barrier.wait(timeout=600)
+    except Exception:
+        error = error or "Another worker did not start."
+
+    if error is not None:
+        results.put((0, 0.0, error))
+        return
+
+    try:
+        start = time.perf_counter()
+        for image_path in image_paths:
+            crops = run_detection_stage(yolo_model, image_path)
+            run_postprocessing_stage(run_ocr_stage(ocr_model, crops))
+
+        results.put((len(image_paths), time.perf_counter() - start, None))
+
+    except Exception as e:
+        results.put((0, 0.0, str(e)))
+
+
+def _collect(processes: List[Any], results: Any, timeout: float) -> List[Tuple[int, float, Optional[str]]]:
+    # One outcome per worker, or an error as soon as a worker dies without reporting or time runs out
+    outcomes = []
+    deadline = time.monotonic() + timeout
+
+    while len(outcomes) < len(processes):
+        try:
+            outcomes.append(results.get(timeout=1.0))
+            continue
+        except queue.Empty:
+            pass
+
+        crashed = [process.exitcode for process in processes if process.exitcode not in (None, 0)]
+        if crashed:
+            outcomes.append((0, 0.0, f"A worker exited with code {crashed[0]}."))
+            break
+        if time.monotonic() >= deadline:
+            outcomes.append((0, 0.0, f"Workers did not finish within {timeout:.0f}s."))
+            break
+
+    # Workers still waiting at the barrier or running are stopped
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+    return outcomes
+
+
+def measure_throughput(settings: Dict[str, Any], image_paths: List[str], timeout: float = 3600.0) -> Dict[str, Any]:
+    """
+    Measure images/sec of 'workers' concurrent worker processes, each processing the whole sample.
+
+    Args:
+        settings (Dict[str, Any]): 'workers', 'torch_threads', 'ocr_cpu_threads' and 'ocr_enable_mkldnn'.
+        image_paths (List[str]): Sample images.
+        timeout (float): Longest time in seconds to wait for the workers before the measurement fails.
+
+    Returns:
+        Dict[str, Any]: The settings with 'images_per_second' (0.0 if a worker failed) and 'error'.
+    """
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(settings['workers'])
+    results = ctx.Queue()
+
+    processes = [ctx.Process(target=_worker, args=(settings, image_paths, barrier, results)) for _ in range(settings['workers'])]
+    for process in processes:
+        process.start()
+
+    outcomes = _collect(processes, results, timeout)
+
+    errors = [error for _, _, error in outcomes if error]
+    if errors:
+        return dict(settings, images_per_second=0.0, error=errors[0])
+
+    images = sum(count for count, _, _ in outcomes)
+    wall_time = max(elapsed for _, elapsed, _ in outcomes)
+
+    return dict(settings, images_per_second=images / wall_time if wall_time else 0.0, error=None)
+
+
+def build_grid(workers: List[int], torch_threads: List[int], ocr_threads: List[int], mkldnn: List[Optional[bool]],
+               cpu_count: int) -> List[Dict[str, Any]]:
+    """
+    Build every combination whose threads fit the machine (workers * max(threads) <= cpu_count).
+
+    Args:
+        workers (List[int]): Worker process counts.
+        torch_threads (List[int]): Torch intra-op thread counts.
+        ocr_threads (List[int]): OCR engine thread counts.
+        mkldnn (List[Optional[bool]]): Paddle MKL-DNN settings.
+        cpu_count (int): Number of CPU cores.
+
+    Returns:
+        List[Dict[str, Any]]: Settings to measure.
+    """
+    grid = []
+    for n_workers, n_torch, n_ocr, use_mkldnn in itertools.product(workers, torch_threads, ocr_threads, mkldnn):
+        if n_workers * max(n_torch, n_ocr) <= cpu_count:
+            grid.append({'workers': n_workers, 'torch_threads': n_torch, 'ocr_cpu_threads': n_ocr, 'ocr_enable_mkldnn': use_mkldnn})
+
+    return grid
+
+
+def main() -> None:
+    cpu_count = os.cpu_count() or 1
+    powers = [n for n in (1, 2, 4, 8, 16, 32) if n <= cpu_count]
+
+    parser = argparse.ArgumentParser(description="Sweep worker and thread settings for YOLO and OCR, and write the fastest to config.yaml.")
+    parser.add_argument('--workers', type=int, nargs='+', default=powers, help="Worker process counts to try.")
+    parser.add_argument('--torch-threads', type=int, nargs='+', default=powers[:3], help="Torch intra-op thread counts to try.")
+    parser.add_argument('--ocr-threads', type=int, nargs='+', default=powers[:3], help="OCR engine thread counts to try.")
+    parser.add_argument('--mkldnn', choices=['on', 'off', 'default'], nargs='+', default=['off', 'on'], help="Paddle MKL-DNN settings to try.")
+    parser.add_argument('--images', type=int, default=16, help="Number of bundled images each worker processes.")
+    parser.add_argument('--timeout', type=float, default=3600.0, help="Seconds to wait for the workers of one configuration.")
+    parser.add_argument('--report', default=None, help="Write all measurements to this JSON file.")
+    parser.add_argument('--dry-run', action='store_true', help="Do not write the best settings to config.yaml.")
+    args = parser.parse_args()
+
+    image_paths = list_bundled_images(splits=('valid', 'train'), limit=args.images)
+    grid = build_grid(args.workers, args.torch_threads, args.ocr_threads, [_parse_switch(v) for v in args.mkldnn], cpu_count)
+    print(f"{len(grid)} configurations, {len(image_paths)} images per worker, {cpu_count} CPUs")
+
+    measurements = []
+    for settings in grid:
+        measurement = measure_throughput(settings, image_paths, args.timeout)
+        measurements.append(measurement)
+        status = f"{measurement['images_per_second']:.2f} img/s" if not measurement['error'] else f"failed: {measurement['error']}"
+        print(f"  workers={settings['workers']} torch={settings['torch_threads']} ocr={settings['ocr_cpu_threads']} "
+              f"mkldnn={settings['ocr_enable_mkldnn']}: {status}")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(measurements, f, indent=4)
+
+    successful = [m for m in measurements if not m['error']]
+    if not successful:
+        print("No configuration completed.")
+        return
+
+    best = max(successful, key=lambda m: m['images_per_second'])
+
+    best_settings = {key: best[key] for key in ('torch_threads', 'ocr_cpu_threads', 'ocr_enable_mkldnn')}
+    print(f"Best: {best_settings} with {best['workers']} worker processes at {best['images_per_second']:.2f} img/s")
+    # Measured with one model pair per process; nothing in this repo starts worker processes, so the count is only reported
+    print(f"Run {best['workers']} CLI processes per host (e.g. on separate input shards) to match the measurement.")
+
+    if not args.dry_run:
+        save_runtime_config(best_settings)
+        print("Written to the 'runtime' section of configs/config.yaml")
+
+
+if __name__ == "__main__":
+    main()
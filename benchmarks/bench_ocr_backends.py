@@ -0,0 +1,119 @@
+import argparse
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Set
+from ocr import load_ocr_model
+from yolo_detection.utils import crop_bounding_box
+from .dataset import list_bundled_images, load_label_boxes
+
+
+# Benchmark variants: name -> (backend, backend options)
+VARIANTS = {
+    'paddle': ('paddle', {}),
+    'onnx': ('onnx', {'quantize_rec': False}),
+    'onnx-int8': ('onnx', {'quantize_rec': True}),
+}
+
+
+def load_table_crops(limit: Optional[int] = None) -> List[np.ndarray]:
+    """
+    Cut the labelled licence tables out of the bundled images, as grayscale like the pipeline's OCR input.
+
+    Args:
+        limit (Optional[int]): Maximum number of images to use.
+
+    Returns:
+        List[np.ndarray]: Grayscale table crops.
+    """
+    crops = []
+    for image_path in list_bundled_images(limit=limit):
+        image = cv2.imread(image_path)
+        boxes = load_label_boxes(image_path, image.shape)
+        region = crop_bounding_box(image, boxes[0]) if boxes else image
+        crops.append(cv2.cvtColor(region, cv2.COLOR_BGR2GRAY))
+
+    return crops
+
+
+def _texts(result: List[Any]) -> Set[str]:
+    return {text for _, (text, _) in (result[0] or [])}
+
+
+def benchmark_variant(name: str, crops: List[np.ndarray], cpu_threads: Optional[int] = None, warmup: int = 2) -> Dict[str, Any]:
+    """
+    Time one OCR backend variant over the table crops.
+
+    Args:
+        name (str): Key of VARIANTS.
+        crops (List[np.ndarray]): Grayscale table crops.
+        cpu_threads (Optional[int]): CPU threads for the backend.
+        warmup (int): Untimed runs before measuring.
+
+    Returns:
+        Dict[str, Any]: Load time, latency percentiles, throughput and recognized text sets.
+    """
+    backend, options = VARIANTS[name]
+
+    start = time.perf_counter()
+    ocr_model = load_ocr_model(cpu_threads=cpu_threads, backend=backend, **options)
+    load_seconds = time.perf_counter() - start
+
+    for crop in crops[:warmup]:
+        ocr_model.ocr(crop, cls=True)
+
+    latencies, texts = [], []
+    for crop in crops:
+        start = time.perf_counter()
+        result = ocr_model.ocr(crop, cls=True)
+        latencies.append(time.perf_counter() - start)
+        texts.append(_texts(result))
+
+    total = sum(latencies)
+    return {
+        'name': name,
+        'load_seconds': load_seconds,
+        'p50_ms': 1000 * float(np.percentile(latencies, 50)),
+        'p95_ms': 1000 * float(np.percentile(latencies, 95)),
+        'images_per_second': len(crops) / total if total else 0.0,
+        'texts': texts,
+    }
+
+
+def text_agreement(reference: List[Set[str]], candidate: List[Set[str]]) -> float:
+    """
+    Mean Jaccard similarity of the recognized text sets of two runs over the same images.
+    """
+    scores = [len(a & b) / len(a | b) if a | b else 1.0 for a, b in zip(reference, candidate)]
+    return float(np.mean(scores)) if scores else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare OCR backends on the bundled licence images.")
+    parser.add_argument('--variants', nargs='+', default=list(VARIANTS), choices=list(VARIANTS), help="Variants to run; the first one is the reference for agreement.")
+    parser.add_argument('--limit', type=int, default=None, help="Maximum number of images.")
+    parser.add_argument('--threads', type=int, default=None, help="CPU threads per backend.")
+    args = parser.parse_args()
+
+    crops = load_table_crops(args.limit)
+    print(f"{len(crops)} table crops")
+
+    reports = []
+    for name in args.variants:
+        try:
+            reports.append(benchmark_variant(name, crops, args.threads))
+        except Exception as e:
+            print(f"{name}: skipped ({e})")
+
+    if not reports:
+        return
+
+    reference = reports[0]['texts']
+    print(f"{'variant':<12}{'load s':>8}{'p50 ms':>9}{'p95 ms':>9}{'img/s':>8}{'agree':>8}")
+    for report in reports:
+        print(f"{report['name']:<12}{report['load_seconds']:>8.1f}{report['p50_ms']:>9.1f}{report['p95_ms']:>9.1f}"
+              f"{report['images_per_second']:>8.2f}{text_agreement(reference, report['texts']):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
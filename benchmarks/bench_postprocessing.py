@@ -0,0 +1,110 @@
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+from postprocessing import extract_required_text_fields, find_image_orientation, identify_rows
+from .synthetic_ocr import generate_ocr_results
+
+
+def run_benchmark(iterations: int, pool_size: int, seed: int = 0, orientation: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Measure postprocessing throughput over synthetic OCR results.
+
+    A pool of distinct samples is generated up front and cycled through, so generation cost
+    stays out of the measured time.
+
+    Args:
+        iterations (int): Number of samples to postprocess.
+        pool_size (int): Number of distinct synthetic samples.
+        seed (int): Random seed of the generator.
+        orientation (str): 'portrait', 'landscape' or None for a mix of both.
+
+    Returns:
+        Dict[str, Any]: Per-stage totals, throughput, feedback counts and accuracy against the generated rows.
+    """
+    pool = list(generate_ocr_results(pool_size, seed=seed, orientation=orientation))
+
+    stage_times = {'filter': 0.0, 'orientation': 0.0, 'rows': 0.0}
+    feedback_counts: Counter = Counter()
+    correct_orientation = 0
+    correct_rows = 0
+
+    start = time.perf_counter()
+
+    for i in range(iterations):
+        results, expected_rows, expected_orientation = pool[i % pool_size]
+
+        t0 = time.perf_counter()
+        categories, dates = extract_required_text_fields(results)
+        t1 = t2 = time.perf_counter()
+
+        try:
+            image_orientation, category_centers = find_image_orientation(categories)
+            t2 = time.perf_counter()
+            feedback_text, rows = identify_rows(dates, image_orientation, category_centers)
+        except Exception as e:
+            image_orientation, feedback_text, rows = None, f'Error: {type(e).__name__}', {}
+        t3 = time.perf_counter()
+
+        stage_times['filter'] += t1 - t0
+        stage_times['orientation'] += t2 - t1
+        stage_times['rows'] += t3 - t2
+
+        feedback_counts[feedback_text] += 1
+        correct_orientation += image_orientation == expected_orientation
+        correct_rows += rows == expected_rows
+
+    total = time.perf_counter() - start
+
+    return {
+        'iterations': iterations,
+        'total_seconds': total,
+        'samples_per_second': iterations / total if total else 0.0,
+        'stage_seconds': stage_times,
+        'feedback_counts': dict(feedback_counts),
+        'orientation_accuracy': correct_orientation / iterations if iterations else 0.0,
+        'exact_row_accuracy': correct_rows / iterations if iterations else 0.0,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    iterations = report['iterations']
+    print(f"{iterations} samples in {report['total_seconds']:.2f}s ({report['samples_per_second']:.0f} samples/s)")
+
+    for stage, seconds in report['stage_seconds'].items():
+        print(f"  {stage:<12} {seconds:8.2f}s  {1e6 * seconds / max(iterations, 1):9.1f} us/sample")
+
+    print(f"Orientation accuracy: {report['orientation_accuracy']:.3f}")
+    print(f"Exact row accuracy:   {report['exact_row_accuracy']:.3f}")
+
+    for feedback_text, count in sorted(report['feedback_counts'].items(), key=lambda kv: -kv[1]):
+        print(f"  {count:>9}  {feedback_text}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark postprocessing on synthetic PaddleOCR outputs.")
+    parser.add_argument('--iterations', type=int, default=1_000_000, help="Number of samples to postprocess.")
+    parser.add_argument('--pool', type=int, default=10_000, help="Number of distinct synthetic samples.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed of the generator.")
+    parser.add_argument('--orientation', choices=['portrait', 'landscape'], default=None, help="Only generate this orientation.")
+    parser.add_argument('--profile', action='store_true', help="Print a cProfile summary of the run.")
+    args = parser.parse_args()
+
+    pool_size = min(args.pool, args.iterations)
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        report = run_benchmark(args.iterations, pool_size, args.seed, args.orientation)
+        profiler.disable()
+        print_report(report)
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats('tottime').print_stats(20)
+    else:
+        print_report(run_benchmark(args.iterations, pool_size, args.seed, args.orientation))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import glob
+import os
+from typing import List, Optional, Sequence, Tuple
+
+
+DATASET_DIR = "models/finetuned_yolo/Finetuning script and data/Dataset/licenceData"
+
+
+def list_bundled_images(splits: Sequence[str] = ('train', 'valid'), limit: Optional[int] = None) -> List[str]:
+    """
+    List the licence images bundled with the YOLO finetuning dataset.
+
+    Args:
+        splits (Sequence[str]): Dataset splits to include ('train', 'valid').
+        limit (Optional[int]): Maximum number of images to return. All images if None.
+
+    Returns:
+        List[str]: Sorted image paths.
+    """
+    paths: List[str] = []
+    for split in splits:
+        paths.extend(sorted(glob.glob(os.path.join(DATASET_DIR, split, 'images', '*.jpg'))))
+
+    return paths[:limit] if limit is not None else paths
+
+
+def get_label_path(image_path: str) -> str:
+    """
+    Return the YOLO label file that belongs to a bundled image.
+
+    Args:
+        image_path (str): Path of an image inside a split's 'images' directory.
+
+    Returns:
+        str: Path of the matching file in the split's 'labels' directory.
+    """
+    image_dir, file_name = os.path.split(image_path)
+    label_dir = os.path.join(os.path.dirname(image_dir), 'labels')
+
+    return os.path.join(label_dir, os.path.splitext(file_name)[0] + '.txt')
+
+
+def load_label_boxes(image_path: str, image_shape: Tuple[int, ...], class_id: int = 0) -> List[List[float]]:
+    """
+    Read the labelled table boxes of a bundled image in pixel coordinates.
+
+    Args:
+        image_path (str): Path of the image.
+        image_shape (Tuple[int, ...]): Shape of the decoded image (height, width[, channels]).
+        class_id (int): Class to keep (0 is the licence table, 'chart').
+
+    Returns:
+        List[List[float]]: Boxes as [x1, y1, x2, y2]. Empty if the image has no label file.
+    """
+    label_path = get_label_path(image_path)
+    if not os.path.exists(label_path):
+        return []
+
+    height, width = image_shape[:2]
+    boxes = []
+
+    with open(label_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) != 5 or int(parts[0]) != class_id:
+                continue
+
+            cx, cy, w, h = (float(v) for v in parts[1:])
+            boxes.append([(cx - w / 2) * width, (cy - h / 2) * height, (cx + w / 2) * width, (cy + h / 2) * height])
+
+    return boxes
@@ -0,0 +1,245 @@
+import argparse
+import json
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from pipeline import (load_models, run_detection_stage, run_template_stage, run_rectify_stage, run_ocr_stage,
+                      run_postprocessing_stage, run_refinement_stage)
+from utils import override_config
+from .dataset import list_bundled_images, load_label_boxes
+
+
+# Named configurations: 'config' holds config.yaml overrides, 'cls' and 'ocr_max_side' the OCR call options
+CONFIGS = {
+    'baseline': {},
+    'no-angle-cls': {'cls': False},
+    'low-res': {'cls': False, 'ocr_max_side': 640},
+    'onnx': {'config': {'ocr_model': {'backend': 'onnx'}}},
+    'onnx-int8': {'config': {'ocr_model': {'backend': 'onnx', 'onnx': {'quantize_rec': True}}}},
+    'cascade': {'config': {'yolo_model': {'cascade': {'enabled': True}}}},
+    'rectify': {'config': {'rectify': {'enabled': True}}},
+    'template-grid': {'config': {'template_grid': {'enabled': True}}},
+    'refine': {'config': {'row_refinement': {'enabled': True}}},
+    'incremental': {'config': {'incremental_ocr': {'enabled': True}}},
+}
+
+
+def box_iou(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Intersection over union of two [x1, y1, x2, y2] boxes.
+    """
+    width = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+    height = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+    intersection = width * height
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+
+    return intersection / union if union > 0 else 0.0
+
+
+def _rows_to_pairs(rows: Dict[str, List[str]]) -> Set[Tuple[str, str, str]]:
+    return {(category, dates[0], dates[1]) for category, dates in rows.items()}
+
+
+def run_config(name: str, spec: Dict[str, Any], image_paths: List[str]) -> Dict[str, Any]:
+    """
+    Run the pipeline stages over the images under one named configuration.
+
+    Args:
+        name (str): Configuration name.
+        spec (Dict[str, Any]): 'config' overrides and the 'cls' / 'ocr_max_side' OCR options.
+        image_paths (List[str]): Labelled images.
+
+    Returns:
+        Dict[str, Any]: Load time, and per image the latency, table box, confidence, feedback and rows.
+    """
+    with override_config(spec.get('config', {})):
+        start = time.perf_counter()
+        yolo_model, ocr_model = load_models()
+        load_seconds = time.perf_counter() - start
+
+        images = []
+        for image_path in image_paths:
+            trace: Dict[str, Any] = {'timings': {}}
+            start = time.perf_counter()
+
+            crops = run_detection_stage(yolo_model, image_path, trace)
+            template_result = run_template_stage(ocr_model, crops, trace)
+
+            if template_result is not None:
+                feedback_text, rows = template_result
+            else:
+                crops = run_rectify_stage(ocr_model, crops, trace)
+
+                max_side = spec.get('ocr_max_side')
+                if max_side and max(crops.shape[:2]) > max_side:
+                    scale = max_side / max(crops.shape[:2])
+                    crops = cv2.resize(crops, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+                results = run_ocr_stage(ocr_model, crops, trace, cls=spec.get('cls', True))
+                feedback_text, rows = run_postprocessing_stage(results, trace)
+                feedback_text, rows = run_refinement_stage(ocr_model, crops, results, feedback_text, rows, trace)
+
+            images.append({
+                'image': image_path,
+                'latency': time.perf_counter() - start,
+                'yolo_box': trace.get('yolo_box'),
+                'yolo_conf': trace.get('yolo_conf'),
+                'table_found': trace.get('table_found'),
+                'feedback': feedback_text,
+                'rows': rows,
+            })
+
+    return {'name': name, 'load_seconds': load_seconds, 'images': images}
+
+
+def score_run(run: Dict[str, Any], reference: Dict[str, Any], label_boxes: List[List[List[float]]]) -> Dict[str, Any]:
+    """
+    Score one run: detection against the labels, extracted rows against the reference run, and speed.
+
+    Args:
+        run (Dict[str, Any]): Output of run_config.
+        reference (Dict[str, Any]): Output of run_config for the reference configuration, over the same images.
+        label_boxes (List[List[List[float]]]): Labelled table boxes of each image.
+
+    Returns:
+        Dict[str, Any]: Mean IoU and recall at IoU 0.5 of the accepted tables, row pair precision / recall / F1 and
+        exact-image agreement with the reference, latency percentiles and throughput.
+    """
+    ious, detected = [], []
+    for image, boxes in zip(run['images'], label_boxes):
+        if not boxes:
+            continue
+        iou = box_iou(image['yolo_box'], boxes[0]) if image['yolo_box'] is not None else 0.0
+        ious.append(iou)
+        detected.append(bool(image['table_found']) and iou >= 0.5)
+
+    matched = predicted = expected = exact = 0
+    for image, reference_image in zip(run['images'], reference['images']):
+        pairs, reference_pairs = _rows_to_pairs(image['rows']), _rows_to_pairs(reference_image['rows'])
+        matched += len(pairs & reference_pairs)
+        predicted += len(pairs)
+        expected += len(reference_pairs)
+        exact += pairs == reference_pairs
+
+    precision = matched / predicted if predicted else 1.0
+    recall = matched / expected if expected else 1.0
+    latencies = [image['latency'] for image in run['images']]
+
+    return {
+        'name': run['name'],
+        'images': len(run['images']),
+        'load_seconds': round(run['load_seconds'], 2),
+        'mean_iou': round(float(np.mean(ious)), 4) if ious else None,
+        'table_recall': round(float(np.mean(detected)), 4) if detected else None,
+        'pair_precision': round(precision, 4),
+        'pair_recall': round(recall, 4),
+        'pair_f1': round(2 * precision * recall / (precision + recall), 4) if precision + recall else 0.0,
+        'exact_agreement': round(exact / len(run['images']), 4) if run['images'] else 0.0,
+        'p50_ms': round(1000 * float(np.percentile(latencies, 50)), 1),
+        'p95_ms': round(1000 * float(np.percentile(latencies, 95)), 1),
+        'images_per_second': round(len(latencies) / sum(latencies), 3) if sum(latencies) else 0.0,
+    }
+
+
+def pareto_front(scores: List[Dict[str, Any]], accuracy: str = 'pair_f1', cost: str = 'p50_ms') -> List[str]:
+    """
+    Names of the configurations that no other configuration beats on both accuracy and cost.
+
+    Args:
+        scores (List[Dict[str, Any]]): Outputs of score_run.
+        accuracy (str): Score key where higher is better.
+        cost (str): Score key where lower is better.
+
+    Returns:
+        List[str]: Non-dominated configurations, fastest first.
+    """
+    front = []
+    for score in scores:
+        dominated = any(other[accuracy] >= score[accuracy] and other[cost] <= score[cost] and
+                        (other[accuracy] > score[accuracy] or other[cost] < score[cost]) for other in scores)
+        if not dominated:
+            front.append(score)
+
+    return [score['name'] for score in sorted(front, key=lambda s: s[cost])]
+
+
+def evaluate(config_names: List[str], configs: Dict[str, Dict[str, Any]], image_paths: List[str]) -> Dict[str, Any]:
+    """
+    Run and score every named configuration; the first one is the reference for row agreement.
+
+    Args:
+        config_names (List[str]): Configurations to run, reference first.
+        configs (Dict[str, Dict[str, Any]]): Named configuration specs.
+        image_paths (List[str]): Labelled images.
+
+    Returns:
+        Dict[str, Any]: 'reference', 'scores' per configuration, 'pareto_front', 'skipped' configurations with their errors, and 'runs'.
+    """
+    label_boxes = [load_label_boxes(path, cv2.imread(path).shape) for path in image_paths]
+
+    runs, skipped = [], {}
+    for name in config_names:
+        try:
+            runs.append(run_config(name, configs[name], image_paths))
+        except Exception as e:
+            skipped[name] = str(e)
+
+    if not runs:
+        return {'reference': None, 'scores': [], 'pareto_front': [], 'skipped': skipped, 'runs': []}
+
+    scores = [score_run(run, runs[0], label_boxes) for run in runs]
+
+    return {
+        'reference': runs[0]['name'],
+        'scores': scores,
+        'pareto_front': pareto_front(scores),
+        'skipped': skipped,
+        'runs': runs,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"Reference: {report['reference']}")
+    print(f"{'config':<16}{'IoU':>7}{'recall':>8}{'pairF1':>8}{'exact':>7}{'p50 ms':>9}{'p95 ms':>9}{'img/s':>7}  pareto")
+    for score in report['scores']:
+        iou = f"{score['mean_iou']:.3f}" if score['mean_iou'] is not None else '-'
+        recall = f"{score['table_recall']:.3f}" if score['table_recall'] is not None else '-'
+        front = '*' if score['name'] in report['pareto_front'] else ''
+        print(f"{score['name']:<16}{iou:>7}{recall:>8}{score['pair_f1']:>8.3f}{score['exact_agreement']:>7.3f}"
+              f"{score['p50_ms']:>9.1f}{score['p95_ms']:>9.1f}{score['images_per_second']:>7.2f}  {front}")
+    for name, error in report['skipped'].items():
+        print(f"{name}: skipped ({error})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare pipeline configurations on accuracy and speed over the labelled licence images.")
+    parser.add_argument('--configs', nargs='+', default=list(CONFIGS), help="Configurations to run; the first is the reference for row agreement.")
+    parser.add_argument('--config-file', default=None, help="JSON file with more named configurations in the same layout as CONFIGS.")
+    parser.add_argument('--split', default='valid', help="Dataset split with YOLO labels (default: valid).")
+    parser.add_argument('--limit', type=int, default=None, help="Maximum number of images.")
+    parser.add_argument('--report', default=None, help="Write scores and per-image results to this JSON file.")
+    args = parser.parse_args()
+
+    configs = dict(CONFIGS)
+    if args.config_file:
+        with open(args.config_file, 'r') as f:
+            configs.update(json.load(f))
+
+    unknown = [name for name in args.configs if name not in configs]
+    if unknown:
+        parser.error(f"unknown configurations: {', '.join(unknown)}")
+
+    image_paths = list_bundled_images(splits=(args.split,), limit=args.limit)
+    print(f"{len(image_paths)} images, {len(args.configs)} configurations")
+
+    report = evaluate(args.configs, configs, image_paths)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import math
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from utils import load_vehicle_cat_config
+
+
+# Upright table geometry in pixels (category column, then issued and expiry date columns)
+ROW_HEIGHT = 32.0
+TEXT_HEIGHT = 18.0
+TABLE_TOP = 40.0
+CATEGORY_X = 24.0
+ISSUED_X = 190.0
+EXPIRY_X = 380.0
+DATE_WIDTH = 130.0
+TABLE_WIDTH = 560.0
+
+NOISE_TEXTS = ['DRIVING LICENCE', 'SRI LANKA', 'Category', 'Date of issue', 'Date of expiry', 'Restrictions',
+               '9.', '10.', '11.', '12.', 'Notes', '*', 'B 1234567']
+
+# Category misreads seen from PaddleOCR on licence tables: table line read as a prefix, icon read as a suffix
+CATEGORY_PREFIXES = ['I', 'i', '1']
+CATEGORY_SUFFIXES = ['B', '1', '.', 'E']
+
+
+def _box(x: float, y: float, w: float, h: float) -> List[List[float]]:
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+
+def _rotate_box(box: List[List[float]], angle_deg: float, cx: float, cy: float) -> List[List[float]]:
+    theta = math.radians(angle_deg)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    return [[round(cx + (x - cx) * cos_t - (y - cy) * sin_t, 1), round(cy + (x - cx) * sin_t + (y - cy) * cos_t, 1)]
+            for x, y in box]
+
+
+def _random_date(rng: random.Random) -> str:
+    return f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(1995, 2035)}"
+
+
+def _misread_date(rng: random.Random, date: str) -> str:
+    choice = rng.random()
+    if choice < 0.4:
+        return date.replace('.', '', 1)     # Dropped separator, fixed by validate_dates
+    if choice < 0.7:
+        return date.replace('.', '..', 1)   # Doubled separator, rejected by validate_dates
+    return date.replace('0', 'O', 1)        # Letter for digit
+
+
+def _misread_category(rng: random.Random, category: str) -> str:
+    if rng.random() < 0.5:
+        return rng.choice(CATEGORY_PREFIXES) + category
+    return category + rng.choice(CATEGORY_SUFFIXES)
+
+
+def generate_ocr_result(rng: random.Random, orientation: Optional[str] = None, missing_rate: float = 0.1,
+                        misread_rate: float = 0.1, duplicate_rate: float = 0.05, noise_boxes: int = 4,
+                        categories: Optional[List[str]] = None) -> Tuple[List[Any], Dict[str, List[str]], str]:
+    """
+    Generate one synthetic PaddleOCR result for a licence table.
+
+    The table is laid out upright (categories stacked vertically, which the pipeline calls 'landscape')
+    and rotated by 0 or 180 degrees for 'landscape', or 90 or 270 degrees for 'portrait', with a few
+    degrees of jitter.
+
+    Args:
+        rng (random.Random): Random generator, seeded by the caller for reproducible samples.
+        orientation (Optional[str]): 'portrait', 'landscape' or None for a random choice.
+        missing_rate (float): Probability that a category or date box is missing from the OCR output.
+        misread_rate (float): Probability that a category or date is misread ('IDE', 'A1B', '0701.2019', ...).
+        duplicate_rate (float): Probability that a category box is detected twice.
+        noise_boxes (int): Maximum number of unrelated text boxes to add.
+        categories (Optional[List[str]]): Category order of the table. Read from config.yaml if None.
+
+    Returns:
+        Tuple:
+            - List[Any]: OCR output in the PaddleOCR shape [[[bbox, (text, confidence)], ...]].
+            - Dict[str, List[str]]: Expected rows, category mapped to [issued, expiry] as printed.
+            - str: Orientation of the generated sample.
+    """
+    if categories is None:
+        categories = load_vehicle_cat_config(is_to_sort=True)
+    if orientation is None:
+        orientation = rng.choice(['portrait', 'landscape'])
+
+    base_angle = rng.choice([0, 180]) if orientation == 'landscape' else rng.choice([90, 270])
+    angle = base_angle + rng.uniform(-3.0, 3.0)
+
+    table_height = TABLE_TOP + ROW_HEIGHT * len(categories)
+    cx, cy = TABLE_WIDTH / 2, table_height / 2
+
+    detections: List[Tuple[List[List[float]], str, float]] = []
+    expected_rows: Dict[str, List[str]] = {}
+
+    # Each licence holds a few categories; the other rows are printed without dates
+    licensed = set(rng.sample(categories, rng.randint(2, len(categories))))
+
+    for i, category in enumerate(categories):
+        y = TABLE_TOP + i * ROW_HEIGHT + rng.uniform(-1.5, 1.5)
+
+        if rng.random() >= missing_rate:
+            text = _misread_category(rng, category) if rng.random() < misread_rate else category
+            box = _box(CATEGORY_X + rng.uniform(-2, 2), y, 12.0 * len(text), TEXT_HEIGHT)
+            detections.append((box, text, rng.uniform(0.8, 0.99)))
+
+            if rng.random() < duplicate_rate:
+                dup_box = _box(CATEGORY_X + rng.uniform(40, 80), y, 12.0 * len(category), TEXT_HEIGHT)
+                detections.append((dup_box, category, rng.uniform(0.5, 0.95)))
+
+        if category in licensed:
+            issued, expiry = _random_date(rng), _random_date(rng)
+            expected_rows[category] = [issued, expiry]
+
+            for x, date in ((ISSUED_X, issued), (EXPIRY_X, expiry)):
+                if rng.random() < missing_rate:
+                    continue
+                text = _misread_date(rng, date) if rng.random() < misread_rate else date
+                detections.append((_box(x + rng.uniform(-3, 3), y, DATE_WIDTH, TEXT_HEIGHT), text, rng.uniform(0.75, 0.99)))
+
+    for _ in range(rng.randint(0, noise_boxes)):
+        text = rng.choice(NOISE_TEXTS)
+        box = _box(rng.uniform(0, TABLE_WIDTH - 100), rng.uniform(0, table_height), 9.0 * len(text), TEXT_HEIGHT)
+        detections.append((box, text, rng.uniform(0.2, 0.95)))
+
+    rng.shuffle(detections)
+    result = [[_rotate_box(box, angle, cx, cy), (text, round(conf, 4))] for box, text, conf in detections]
+
+    return [result], {cat: expected_rows[cat] for cat in categories if cat in expected_rows}, orientation
+
+
+def generate_ocr_results(count: int, seed: int = 0, **kwargs: Any) -> Iterator[Tuple[List[Any], Dict[str, List[str]], str]]:
+    """
+    Generate a reproducible stream of synthetic OCR results.
+
+    Args:
+        count (int): Number of samples.
+        seed (int): Random seed.
+        **kwargs: Passed to generate_ocr_result.
+
+    Yields:
+        Tuple[List[Any], Dict[str, List[str]], str]: OCR output, expected rows and orientation.
+    """
+    rng = random.Random(seed)
+    if 'categories' not in kwargs:
+        kwargs['categories'] = load_vehicle_cat_config(is_to_sort=True)
+
+    for _ in range(count):
+        yield generate_ocr_result(rng, **kwargs)
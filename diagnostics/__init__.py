@@ -0,0 +1 @@
+from .slow_requests import SlowRequestRecorder, load_case
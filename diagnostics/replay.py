@@ -0,0 +1,148 @@
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional
+from pipeline import load_models, run_detection_stage, _extract_from_crop
+from utils import get_deadline_planner
+from .slow_requests import load_case
+
+
+class _RecordedTensor:
+    """Minimal stand-in for a torch tensor as read by get_best_chart_box."""
+
+    def __init__(self, values: Any) -> None:
+        self._values = np.asarray([values], dtype=np.float32)
+
+    def cpu(self) -> "_RecordedTensor":
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self._values
+
+
+class _RecordedBox:
+    def __init__(self, xyxy: List[float], conf: float) -> None:
+        self.xyxy = _RecordedTensor(xyxy)
+        self.conf = _RecordedTensor(conf)
+        self.cls = _RecordedTensor(0.0)
+
+
+class _RecordedResult:
+    def __init__(self, orig_img: np.ndarray, boxes: List[_RecordedBox]) -> None:
+        self.orig_img = orig_img
+        self.boxes = boxes
+
+
+class _NullSink:
+    """Output sink that discards the rows, so a replay writes no CSV."""
+
+    def write(self, key: str, rows: Dict[str, List[str]], feedback: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class RecordedDetector:
+    """
+    Stand-in for the YOLO model that answers with the table box recorded in a captured case.
+    """
+
+    def __init__(self, box: Optional[List[float]], conf: Optional[float]) -> None:
+        self.box = box
+        self.conf = conf or 0.0
+
+    def __call__(self, image_path: str) -> List[_RecordedResult]:
+        image = cv2.imread(image_path)
+        boxes = [] if self.box is None else [_RecordedBox(self.box, self.conf)]
+        return [_RecordedResult(image, boxes)]
+
+
+class RecordedOCR:
+    """
+    Stand-in for the OCR model that answers with the raw OCR output recorded in a captured case.
+
+    It has no separate detect/recognize steps, so the template, text-box rectification, incremental OCR
+    and row refinement stages are skipped when replaying with it, as they are for any such backend.
+    """
+
+    def __init__(self, results: List[Any]) -> None:
+        self.results = results
+
+    def ocr(self, img: np.ndarray, cls: bool = True) -> List[Any]:
+        return self.results
+
+
+def replay_case(case_dir: str, stub_models: bool = False, sort_by: str = 'cumulative', top: int = 30,
+                profile_out: Optional[str] = None, deadline: Optional[float] = None) -> str:
+    """
+    Re-run a captured case through the pipeline with profiling enabled.
+
+    The case takes the same path as in detail_extraction_pipeline (template fast path, rectification,
+    OCR, postprocessing, row refinement and deadline degradation, as configured), but its rows are not written.
+
+    Args:
+        case_dir (str): Path of the captured case directory.
+        stub_models (bool): Answer model calls with the recorded outputs instead of loading YOLO and PaddleOCR.
+        sort_by (str): pstats sort key for the printed profile.
+        top (int): Number of profile entries to print.
+        profile_out (Optional[str]): If given, the new profile is also written to this path.
+        deadline (Optional[float]): Time budget of the replayed request in seconds. No degradation if None.
+
+    Returns:
+        str: Feedback message of the replayed run.
+
+    Raises:
+        ValueError: If models are stubbed but the case holds no OCR output.
+    """
+    case = load_case(case_dir)
+
+    if stub_models:
+        if 'ocr_results' not in case:
+            raise ValueError(f"Case has no recorded OCR output to stub the model with: {case_dir}")
+        yolo_model, ocr_model = RecordedDetector(case['yolo_box'], case['yolo_conf']), RecordedOCR(case['ocr_results'])
+    else:
+        yolo_model, ocr_model = load_models()
+
+    trace: Dict[str, Any] = {'timings': {}}
+    profiler = cProfile.Profile()
+
+    profiler.enable()
+    deadline_at = time.perf_counter() + deadline if deadline is not None else None
+    crops = run_detection_stage(yolo_model, case['image_path'], trace)
+    planner = get_deadline_planner() if deadline_at is not None else None
+    feedback_text = _extract_from_crop(ocr_model, crops, case['image_path'], trace, _NullSink(), deadline_at, planner)
+    profiler.disable()
+
+    print(f"Captured: {case['latency']:.3f}s, feedback '{case['feedback']}'")
+    print("  " + ", ".join(f"{stage}={t:.3f}s" for stage, t in case['timings'].items()))
+    print(f"Replayed: {sum(trace['timings'].values()):.3f}s, feedback '{feedback_text}'")
+    print("  " + ", ".join(f"{stage}={t:.3f}s" for stage, t in trace['timings'].items()))
+
+    if profile_out:
+        profiler.dump_stats(profile_out)
+
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats(sort_by).print_stats(top)
+
+    return feedback_text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a captured slow request with profiling enabled.")
+    parser.add_argument('case_dir', help="Captured case directory (see the 'diagnostics' section of config.yaml).")
+    parser.add_argument('--stub-models', action='store_true', help="Answer YOLO and OCR calls with the recorded outputs.")
+    parser.add_argument('--sort', default='cumulative', help="pstats sort key (default: cumulative).")
+    parser.add_argument('--top', type=int, default=30, help="Number of profile entries to print.")
+    parser.add_argument('--profile-out', default=None, help="Write the replay profile to this file.")
+    parser.add_argument('--deadline', type=float, default=None, help="Time budget of the replayed request in seconds.")
+    args = parser.parse_args()
+
+    replay_case(args.case_dir, args.stub_models, args.sort, args.top, args.profile_out, args.deadline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import cProfile
+import json
+import os
+import shutil
+import time
+import uuid
+import warnings
+import cv2
+import numpy as np
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from utils import load_diagnostics_config
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert OCR / YOLO outputs (numpy scalars and arrays, tuples) into JSON-serializable values.
+
+    Args:
+        value (Any): Value to convert.
+
+    Returns:
+        Any: Equivalent value built from lists, floats, ints, strings and None.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    return value
+
+
+class SlowRequestRecorder:
+    """
+    Opt-in recorder that profiles pipeline requests and captures the slow ones to disk.
+
+    A captured case is a directory holding the input image, the YOLO table box, the grayscale
+    crop, the raw OCR output, the stage timings and a cProfile trace ('profile.prof'). Cases can
+    be re-run offline with 'python -m diagnostics.replay <case_dir>'.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, capture_dir: Optional[str] = None, profile: bool = True) -> None:
+        """
+        Args:
+            threshold (Optional[float]): Latency in seconds above which a request is captured. Read from config.yaml if None.
+            capture_dir (Optional[str]): Directory receiving the captured cases. Read from config.yaml if None.
+            profile (bool): Whether to attach a cProfile trace to captured cases.
+        """
+        diagnostics = load_diagnostics_config()
+
+        self.threshold = threshold if threshold is not None else diagnostics.get('slow_request_threshold', 5.0)
+        self.capture_dir = capture_dir or diagnostics.get('capture_dir', 'outputs/slow_requests/')
+        self.profile = profile
+
+    def _start_profiler(self) -> Optional[cProfile.Profile]:
+        if not self.profile:
+            return None
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active (e.g. a concurrent request on Python 3.12+)
+            return None
+        return profiler
+
+    @contextmanager
+    def watch(self, img_file_path: str, trace: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Time (and profile) the enclosed pipeline run, capturing it if it exceeds the threshold.
+
+        Failed requests are captured as well when they are slow, with the error message stored in the case.
+
+        Args:
+            img_file_path (str): Path of the image being processed.
+            trace (Dict[str, Any]): Trace dictionary filled in by the pipeline stages.
+
+        Yields:
+            Dict[str, Any]: The same trace dictionary.
+        """
+        profiler = self._start_profiler()
+        start = time.perf_counter()
+        error = None
+
+        try:
+            yield trace
+
+        except Exception as e:
+            error = str(e)
+            raise
+
+        finally:
+            latency = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+
+            if latency >= self.threshold:
+                try:
+                    self.capture(img_file_path, trace, latency, profiler, error)
+                except Exception as e:
+                    warnings.warn(f"Failed to capture slow request for {img_file_path}: {e}")
+
+    def capture(self, img_file_path: str, trace: Dict[str, Any], latency: float,
+                profiler: Optional[cProfile.Profile] = None, error: Optional[str] = None) -> str:
+        """
+        Write one captured case to the capture directory.
+
+        Args:
+            img_file_path (str): Path of the processed image.
+            trace (Dict[str, Any]): Trace filled in by the pipeline stages.
+            latency (float): End-to-end latency in seconds.
+            profiler (Optional[cProfile.Profile]): Profiler that ran during the request.
+            error (Optional[str]): Error message if the request failed.
+
+        Returns:
+            str: Path of the created case directory.
+        """
+        stem = os.path.splitext(os.path.basename(img_file_path))[0]
+        case_name = f"{time.strftime('%Y%m%d-%H%M%S')}_{stem}_{uuid.uuid4().hex[:6]}"
+        case_dir = os.path.join(self.capture_dir, case_name)
+        os.makedirs(case_dir, exist_ok=True)
+
+        # Input image is copied byte for byte so replay decodes exactly the same pixels
+        image_file = 'image' + os.path.splitext(img_file_path)[1].lower()
+        shutil.copyfile(img_file_path, os.path.join(case_dir, image_file))
+
+        if trace.get('crop') is not None:
+            cv2.imwrite(os.path.join(case_dir, 'crop.png'), trace['crop'])
+
+        if 'ocr_results' in trace:
+            with open(os.path.join(case_dir, 'ocr.json'), 'w') as f:
+                json.dump(to_jsonable(trace['ocr_results']), f)
+
+        if profiler is not None:
+            profiler.dump_stats(os.path.join(case_dir, 'profile.prof'))
+
+        case = {
+            'source_path': img_file_path,
+            'image_file': image_file,
+            'latency': latency,
+            'threshold': self.threshold,
+            'timings': trace.get('timings', {}),
+            'yolo_box': trace.get('yolo_box'),
+            'yolo_conf': trace.get('yolo_conf'),
+            'feedback': trace.get('feedback'),
+            'error': error,
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        with open(os.path.join(case_dir, 'case.json'), 'w') as f:
+            json.dump(to_jsonable(case), f, indent=4)
+
+        return case_dir
+
+
+def load_case(case_dir: str) -> Dict[str, Any]:
+    """
+    Load a case written by SlowRequestRecorder.
+
+    Args:
+        case_dir (str): Path of the case directory.
+
+    Returns:
+        Dict[str, Any]: Case metadata, with 'image_path' and, when recorded, 'ocr_results' added.
+
+    Raises:
+        FileNotFoundError: If the directory is not a captured case.
+    """
+    case_path = os.path.join(case_dir, 'case.json')
+    if not os.path.exists(case_path):
+        raise FileNotFoundError(f"No captured case found in: {case_dir}")
+
+    with open(case_path, 'r') as f:
+        case = json.load(f)
+
+    case['image_path'] = os.path.join(case_dir, case['image_file'])
+
+    ocr_path = os.path.join(case_dir, 'ocr.json')
+    if os.path.exists(ocr_path):
+        with open(ocr_path, 'r') as f:
+            case['ocr_results'] = json.load(f)
+
+    return case
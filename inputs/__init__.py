@@ -0,0 +1,3 @@
+from .sources import collect_image_paths, read_manifest, is_image, is_archive, IMAGE_EXTENSIONS, ARCHIVE_EXTENSIONS
+from .archives import MEMBER_SEPARATOR, decode_image, iter_zip_buffers, iter_tar_buffers, iter_file_buffer, iter_archive_images, iter_inputs
+from .watch import FolderWatcher, move_file
\ No newline at end of file
@@ -0,0 +1,173 @@
+import mmap
+import os
+import struct
+import tarfile
+import zipfile
+import cv2
+import numpy as np
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple, Union
+from .sources import is_archive, is_image
+
+
+# Joins the archive path and member name in the result key of an archive member
+MEMBER_SEPARATOR = '::'
+
+# Fixed part of a zip local file header, ending with the file name and extra field lengths
+_ZIP_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def decode_image(buffer: Union[bytes, memoryview]) -> Optional[np.ndarray]:
+    """
+    Decode encoded image bytes into a BGR array without copying the encoded bytes.
+
+    Args:
+        buffer (Union[bytes, memoryview]): Encoded image (JPEG, PNG, ...).
+
+    Returns:
+        Optional[np.ndarray]: Decoded BGR image, or None if the bytes are not a decodable image.
+    """
+    # Empty files and members: imdecode raises on an empty buffer instead of returning None
+    if len(buffer) == 0:
+        return None
+
+    try:
+        return cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[mmap.mmap]:
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def _zip_data_offset(mapped: mmap.mmap, info: zipfile.ZipInfo) -> int:
+    header = _ZIP_LOCAL_HEADER.unpack_from(mapped, info.header_offset)
+    name_length, extra_length = header[-2], header[-1]
+    return info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+
+def iter_zip_buffers(archive_path: str) -> Iterator[Tuple[str, Union[bytes, memoryview]]]:
+    """
+    Yield (member name, encoded bytes) for every image in a zip archive.
+
+    Stored (uncompressed) members, the usual case for JPEGs, are returned as memoryviews into a
+    memory map of the archive, so no bytes are copied; compressed members are decompressed.
+    Each view is only valid until the next item is requested.
+
+    Args:
+        archive_path (str): Path to the zip file.
+
+    Yields:
+        Tuple[str, Union[bytes, memoryview]]: Member name and its bytes.
+    """
+    with zipfile.ZipFile(archive_path) as archive, _mapped(archive_path) as mapped:
+        for info in archive.infolist():
+            if info.is_dir() or not is_image(info.filename):
+                continue
+
+            if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+                start = _zip_data_offset(mapped, info)
+                with memoryview(mapped)[start:start + info.file_size] as view:
+                    yield info.filename, view
+            else:
+                yield info.filename, archive.read(info)
+
+
+def iter_tar_buffers(archive_path: str) -> Iterator[Tuple[str, Union[bytes, memoryview]]]:
+    """
+    Yield (member name, encoded bytes) for every image in a tar archive.
+
+    Members of uncompressed tars are memoryviews into a memory map of the archive (no copies);
+    compressed tars are read in streaming mode, one member at a time. Each view is only valid
+    until the next item is requested.
+
+    Args:
+        archive_path (str): Path to the tar file (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz).
+
+    Yields:
+        Tuple[str, Union[bytes, memoryview]]: Member name and its bytes.
+    """
+    if archive_path.lower().endswith('.tar'):
+        with tarfile.open(archive_path, 'r:') as archive, _mapped(archive_path) as mapped:
+            for member in archive:
+                if member.isfile() and is_image(member.name):
+                    with memoryview(mapped)[member.offset_data:member.offset_data + member.size] as view:
+                        yield member.name, view
+        return
+
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            if member.isfile() and is_image(member.name):
+                yield member.name, archive.extractfile(member).read()
+
+
+def iter_file_buffer(path: str) -> Iterator[Tuple[str, memoryview]]:
+    """
+    Yield a single image file as a memoryview into a memory map of it.
+
+    Args:
+        path (str): Image file.
+
+    Yields:
+        Tuple[str, memoryview]: The path and the file's bytes, valid until the next item is requested.
+    """
+    if os.path.getsize(path) == 0:
+        yield path, memoryview(b'')
+        return
+
+    with _mapped(path) as mapped, memoryview(mapped) as view:
+        yield path, view
+
+
+def iter_archive_images(archive_path: str) -> Iterator[Tuple[str, Optional[np.ndarray]]]:
+    """
+    Decode every image of a tar or zip archive without extracting it to disk.
+
+    Args:
+        archive_path (str): Path to the archive.
+
+    Yields:
+        Tuple[str, Optional[np.ndarray]]: Result key '<archive path>::<member name>', unique across archives and
+        plain files, and the decoded BGR image, None if it cannot be decoded.
+
+    Raises:
+        ValueError: If the file is not a supported archive.
+    """
+    if archive_path.lower().endswith('.zip'):
+        buffers = iter_zip_buffers(archive_path)
+    elif is_archive(archive_path):
+        buffers = iter_tar_buffers(archive_path)
+    else:
+        raise ValueError(f"Unsupported archive: {archive_path}")
+
+    for name, buffer in buffers:
+        yield f"{archive_path}{MEMBER_SEPARATOR}{name}", decode_image(buffer)
+
+
+def iter_inputs(paths: Iterable[str], mmap_files: bool = False) -> Iterator[Tuple[str, Union[str, np.ndarray, None]]]:
+    """
+    Turn collected input paths into (result key, image) items for the pipeline, streaming archive members.
+
+    Args:
+        paths (Iterable[str]): Image files and archives, e.g. from collect_image_paths.
+        mmap_files (bool): Decode plain image files through a memory map here instead of passing their paths on.
+
+    Yields:
+        Tuple[str, Union[str, np.ndarray, None]]: Result key and either the image path or the decoded image
+        (None if an archive member cannot be decoded). Archive members are keyed '<archive path>::<member name>'.
+    """
+    for path in paths:
+        if is_archive(path):
+            yield from iter_archive_images(path)
+        elif mmap_files:
+            for key, buffer in iter_file_buffer(path):
+                yield key, decode_image(buffer)
+        else:
+            yield path, path
@@ -0,0 +1,86 @@
+import glob
+import os
+from typing import Iterable, List, Optional
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp')
+ARCHIVE_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz', '.zip')
+
+
+def is_image(path: str) -> bool:
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def is_archive(path: str) -> bool:
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _scan_directory(directory: str) -> Iterable[str]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file_name in sorted(files):
+            if is_image(file_name) or is_archive(file_name):
+                yield os.path.join(root, file_name)
+
+
+def read_manifest(manifest_path: str) -> List[str]:
+    """
+    Read a manifest listing one input (file, directory or glob) per line. Blank lines and '#' comments are skipped.
+
+    Args:
+        manifest_path (str): Path to the manifest file.
+
+    Returns:
+        List[str]: Inputs listed in the manifest.
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def collect_image_paths(inputs: Iterable[str], manifest: Optional[str] = None) -> List[str]:
+    """
+    Expand files, directories (recursively) and glob patterns into a list of image and archive paths.
+
+    Args:
+        inputs (Iterable[str]): Files, directories or glob patterns ('**' is recursive).
+        manifest (Optional[str]): Manifest file with more inputs, one per line.
+
+    Returns:
+        List[str]: Image and archive (tar, zip) paths in input order, without duplicates.
+
+    Raises:
+        FileNotFoundError: If an input is neither an existing path nor a glob matching anything.
+    """
+    inputs = list(inputs) + (read_manifest(manifest) if manifest else [])
+
+    seen = set()
+    paths: List[str] = []
+
+    def add(path: str) -> None:
+        if path not in seen:
+            seen.add(path)
+            paths.append(path)
+
+    for item in inputs:
+        if os.path.isdir(item):
+            for path in _scan_directory(item):
+                add(path)
+
+        elif os.path.isfile(item):
+            add(item)
+
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"No files match: {item}")
+            for match in matches:
+                if os.path.isdir(match):
+                    for path in _scan_directory(match):
+                        add(path)
+                elif is_image(match) or is_archive(match):
+                    add(match)
+
+        else:
+            raise FileNotFoundError(f"Input not found: {item}")
+
+    return paths
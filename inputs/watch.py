@@ -0,0 +1,167 @@
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from .sources import is_image
+
+
+class FolderWatcher:
+    """
+    Reports image files dropped into a directory once they are completely written.
+
+    New files are noticed through inotify when the optional 'inotify_simple' package is available
+    (Linux), and otherwise by scanning the directory every 'poll_interval' seconds. Only the top
+    level of the directory is watched, and processed files are expected to be moved out of it,
+    so each scan only lists pending files. A file is ready once its size and modification time
+    have not changed for 'settle_seconds', which skips files that are still being copied in.
+    """
+
+    def __init__(self, directory: str, settle_seconds: float = 2.0, poll_interval: float = 2.0,
+                 use_inotify: Optional[bool] = None) -> None:
+        """
+        Args:
+            directory (str): Directory to watch.
+            settle_seconds (float): Time a file must stay unchanged before it is reported.
+            poll_interval (float): Seconds between directory scans when polling.
+            use_inotify (Optional[bool]): Force inotify on or off. Used when available if None.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            ImportError: If inotify is forced on but 'inotify_simple' is not installed.
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Watch directory not found: {directory}")
+
+        self.directory = directory
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+
+        # path -> ((size, mtime), time the file was first seen with that size and mtime)
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        # Reported files still in the directory (being processed), not to be reported again
+        self._reported: Set[str] = set()
+        self._inotify = None
+        self._flags = None
+
+        if use_inotify is not False:
+            try:
+                from inotify_simple import INotify, flags
+                self._inotify = INotify()
+                self._inotify.add_watch(directory, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.MOVED_FROM | flags.DELETE)
+                self._flags = flags
+            except ImportError:
+                if use_inotify:
+                    raise
+
+        # Files already waiting when the watcher starts
+        self._scan()
+        self._next_scan = time.monotonic() + poll_interval
+
+    @property
+    def backend(self) -> str:
+        """'inotify' or 'polling'."""
+        return 'inotify' if self._inotify is not None else 'polling'
+
+    def _track(self, path: str) -> None:
+        if path not in self._pending and path not in self._reported and is_image(path):
+            self._pending[path] = ((-1, -1), time.monotonic())
+
+    def _scan(self) -> None:
+        present = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    present.add(entry.path)
+                    self._track(entry.path)
+
+        # Reported files that were moved away can be reported again if a new file takes their name
+        self._reported &= present
+
+    def _read_events(self, timeout: float) -> None:
+        events = self._inotify.read(timeout=int(timeout * 1000))
+        for event in events:
+            if event.mask & self._flags.Q_OVERFLOW:
+                # Events were dropped, so fall back to one full scan
+                self._scan()
+            elif event.mask & (self._flags.MOVED_FROM | self._flags.DELETE):
+                self._reported.discard(os.path.join(self.directory, event.name))
+            elif event.name:
+                self._track(os.path.join(self.directory, event.name))
+
+    def _collect_ready(self) -> List[str]:
+        now = time.monotonic()
+        ready = []
+
+        for path, (signature, since) in list(self._pending.items()):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                del self._pending[path]
+                continue
+
+            current = (stat.st_size, stat.st_mtime_ns)
+            if current != signature:
+                self._pending[path] = (current, now)
+            elif stat.st_size > 0 and now - since >= self.settle_seconds:
+                ready.append(path)
+                self._reported.add(path)
+                del self._pending[path]
+
+        return sorted(ready)
+
+    def wait(self, timeout: float) -> List[str]:
+        """
+        Wait up to 'timeout' seconds for files to become ready. Each file is reported once.
+
+        Args:
+            timeout (float): Longest wait in seconds.
+
+        Returns:
+            List[str]: Paths of the files that became ready, possibly empty.
+        """
+        deadline = time.monotonic() + timeout
+        # Pending files are re-checked this often until they settle
+        check_interval = max(0.05, min(self.settle_seconds / 2, self.poll_interval))
+
+        while True:
+            ready = self._collect_ready()
+            remaining = deadline - time.monotonic()
+            if ready or remaining <= 0:
+                return ready
+
+            if self._inotify is not None:
+                self._read_events(min(remaining, check_interval) if self._pending else remaining)
+            else:
+                if time.monotonic() >= self._next_scan:
+                    self._scan()
+                    self._next_scan = time.monotonic() + self.poll_interval
+                time.sleep(min(remaining, check_interval, max(0.0, self._next_scan - time.monotonic())))
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+def move_file(path: str, target_dir: str) -> str:
+    """
+    Move a file into a directory, adding a numeric suffix if the name is taken.
+
+    Args:
+        path (str): File to move.
+        target_dir (str): Destination directory, created if missing.
+
+    Returns:
+        str: New path of the file.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+
+    stem, extension = os.path.splitext(os.path.basename(path))
+    target = os.path.join(target_dir, stem + extension)
+    counter = 1
+    while os.path.exists(target):
+        target = os.path.join(target_dir, f"{stem}_{counter}{extension}")
+        counter += 1
+
+    shutil.move(path, target)
+    return target
@@ -1,50 +1,247 @@
-import json
+import argparse
 import os
+import sys
 import time
-from pipeline import detail_extraction_pipeline, load_models
-    
-if __name__ == "__main__":
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from inputs import FolderWatcher, collect_image_paths, is_archive, iter_inputs, move_file
+from pipeline import RESUMABLE_STAGES, batch_extraction_pipeline, resume_batch_pipeline
+from serving import ModelRegistry
+from utils import ArtefactStore, RunSummary, create_sink, load_output_path_config, load_runtime_config, load_watch_config, load_yolo_cascade_config
+from yolo_detection import get_cascade_stats
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    runtime = load_runtime_config()
+
+    parser = argparse.ArgumentParser(description="Extract vehicle categories with issued and expiry dates from driving license images.")
+    parser.add_argument('inputs', nargs='*', help="Image files, tar/zip archives, directories (searched recursively) or glob patterns.")
+    parser.add_argument('--manifest', default=None, help="File listing more inputs, one per line.")
+    parser.add_argument('--watch', default=None, metavar='DIR', help="Run as a daemon processing images dropped into DIR until interrupted.")
+    parser.add_argument('--store', default=None, metavar='DIR', help="Artefact store: save the detection and OCR outputs of every image to DIR.")
+    parser.add_argument('--from-stage', choices=RESUMABLE_STAGES, default=None,
+                        help="Re-run from this stage over the images in --store, from their stored outputs, instead of reading inputs.")
+    parser.add_argument('--mmap', action='store_true', help="Decode image files through memory maps instead of letting YOLO read them.")
+    parser.add_argument('--batch-size', type=int, default=8, help="Images per batched YOLO call (default: 8).")
+    parser.add_argument('--workers', type=int, default=runtime.get('workers') or 1, help="Worker threads in this process, each with its own model pair (default: 'workers' in config.yaml).")
+    parser.add_argument('--sink', choices=['csv', 'jsonl'], default='csv', help="Output format: one CSV per image (default) or one JSON line per image.")
+    parser.add_argument('--output', default=None, help="Output directory for 'csv' (default: 'save_dir' in config.yaml) or output file for 'jsonl'.")
+    parser.add_argument('--summary', default=None, help="Summary report path (default: <save_dir>/results_summary/run_summary.json).")
+    parser.add_argument('--quiet', action='store_true', help="Do not print a line per image.")
+
+    args = parser.parse_args(argv)
+    if args.from_stage:
+        if not args.store:
+            parser.error("--from-stage needs the --store to resume from")
+        if args.inputs or args.manifest or args.watch:
+            parser.error("--from-stage reads its images from --store and does not take other inputs")
+    elif not args.inputs and not args.manifest and not args.watch:
+        parser.error("give at least one input, a --manifest or a --watch directory")
+    if args.watch and (args.inputs or args.manifest):
+        parser.error("--watch does not take other inputs")
+
+    return args
+
+
+def _batches(items: Iterable[Tuple[str, Any]], batch_size: int) -> Iterator[List[Tuple[str, Any]]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _print_trace(trace: Dict[str, Any], position: str, quiet: bool) -> None:
+    if not quiet:
+        outcome = trace.get('feedback') or f"FAILED: {trace.get('error')}"
+        print(f"[{position}] {trace['key']}: {outcome}", flush=True)
+
+
+def _run_batches(args: argparse.Namespace, items: Iterable[Tuple[str, Any]], total: Any,
+                 process: Callable[[List[Tuple[str, Any]]], List[Dict[str, Any]]], summary: RunSummary) -> None:
+    """
+    Process (key, item) pairs in batches, with a bounded number of batches in flight.
+    """
+    done = 0
+    batches = _batches(items, max(1, args.batch_size))
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # Keep a bounded number of batches in flight so huge runs do not decode every image up front
+        pending = {executor.submit(process, batch) for _, batch in zip(range(2 * args.workers), batches)}
+
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                for trace in future.result():
+                    done += 1
+                    summary.add(trace['key'], trace)
+                    _print_trace(trace, f"{done}/{total}", args.quiet)
+
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    pending.add(executor.submit(process, next_batch))
+
+
+def run_inputs(args: argparse.Namespace, process: Callable[[List[Tuple[str, Any]]], List[Dict[str, Any]]], summary: RunSummary) -> None:
+    """
+    Process every input given on the command line.
+    """
+    paths = collect_image_paths(args.inputs, args.manifest)
+
+    # Archive members are streamed, so their count is only known at the end
+    archives = sum(is_archive(path) for path in paths)
+    total = '?' if archives else len(paths)
+    print(f"{len(paths) - archives} images, {archives} archives, batch size {args.batch_size}, {args.workers} workers")
 
-    img_file_path = "C:/Users/ASUS/Downloads/New folder (3)/qvv1.jpg"# your image path here
+    _run_batches(args, iter_inputs(paths, mmap_files=args.mmap), total, process, summary)
 
-    #Load models  
-    yolo_model, ocr_model = load_models()
 
-    feedback_message = detail_extraction_pipeline(yolo_model, ocr_model, img_file_path)
+def run_stored(args: argparse.Namespace, store: ArtefactStore, process: Callable[[List[Tuple[str, Any]]], List[Dict[str, Any]]],
+               summary: RunSummary) -> None:
+    """
+    Re-run every image of the artefact store from --from-stage, using the outputs of the stage before it.
 
-    # if feed message is 'Detection Successful.' or 'Some rows are missing in the result.', then detected data is stored in 'outputs/' folder. Else only feedback message.
-    print(feedback_message)
+    Images with stored detection but no stored OCR output (read by the template fast path, or failed
+    in OCR) cannot be resumed from postprocessing; they are listed as skipped in the summary.
+    """
+    source_stage = 'detection' if args.from_stage == 'ocr' else 'ocr'
+    keys = store.keys(source_stage)
 
+    if args.from_stage == 'postprocessing':
+        stored = set(keys)
+        for key in store.keys('detection'):
+            if key not in stored:
+                summary.skip(key, "No stored OCR output (template fast path or failed OCR).")
+    print(f"{len(keys)} stored images, resuming from {args.from_stage}, batch size {args.batch_size}, {args.workers} workers")
 
+    _run_batches(args, store.read(source_stage, keys), len(keys), process, summary)
 
-#------------------------------------------------------
-#------------------------------------------------------
-################# FOR GIVEN IMAGES ####################
-############ CAN USE FOR MULTIPLE IMAGES ##############
-#------------------------------------------------------
-#------------------------------------------------------
 
+def run_watch(args: argparse.Namespace, process: Callable[[List[Tuple[str, Any]]], List[Dict[str, Any]]], summary: RunSummary) -> None:
+    """
+    Process images dropped into the watch directory until interrupted, moving each one out once its result is written.
 
-#     # Load models  
-#     yolo_model, ocr_model = load_models()
-#     folder_path = 'C:/Users/ASUS/Downloads/Images'
+    Ready files are grouped into batches of up to --batch-size; a smaller batch is started once its
+    first file has waited 'max_batch_wait' seconds, so a trickle of files is not held back. A file that
+    cannot be moved out is reported and left in place; watching continues.
+    """
+    watch_config = load_watch_config()
+    processed_dir = watch_config.get('processed_dir') or os.path.join(args.watch, 'processed')
+    failed_dir = watch_config.get('failed_dir') or os.path.join(args.watch, 'failed')
+    max_batch_wait = watch_config.get('max_batch_wait', 1.0)
+    batch_size = max(1, args.batch_size)
 
-#     processed_images_dict = {}
+    watcher = FolderWatcher(args.watch, watch_config.get('settle_seconds', 2.0), watch_config.get('poll_interval', 2.0))
+    print(f"Watching {args.watch} ({watcher.backend}), batch size {batch_size}, {args.workers} workers. Press Ctrl+C to stop.")
 
-#     for file in sorted(os.listdir(folder_path)):
-#         if file in a:
-#             img_file_path = folder_path + '/' + file
-#             feedback_message = detail_extraction_pipeline(yolo_model, ocr_model, img_file_path)
-#             print(feedback_message)
+    done = 0
+    waiting: List[str] = []
+    first_waiting_at = 0.0
+    in_flight: Set[Future] = set()
 
-#         if feedback_message in processed_images_dict:
-#             processed_images_dict[feedback_message][0] += 1
-#             processed_images_dict[feedback_message][1].append(file)
-#         else:
-#             processed_images_dict[feedback_message] = [1, [file]]
+    def collect(finished: Iterable[Future]) -> None:
+        nonlocal done
+        for future in finished:
+            for trace in future.result():
+                done += 1
+                summary.add(trace['key'], trace)
+                _print_trace(trace, str(done), args.quiet)
+                try:
+                    move_file(trace['key'], failed_dir if trace.get('error') is not None else processed_dir)
+                except OSError as e:
+                    # Left in place and not reported again until it is moved away by hand
+                    print(f"Could not move {trace['key']} out of the watch directory: {e}", flush=True)
 
-# with open("outputs/Sample Data/results_summary/output.json", "w") as f:
-#     json.dump(processed_images_dict, f, indent=4)
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            try:
+                while True:
+                    ready = watcher.wait(timeout=max_batch_wait / 2 if waiting else 1.0)
+                    if ready and not waiting:
+                        first_waiting_at = time.monotonic()
+                    waiting.extend(ready)
 
-#     print(time.time() - t)
+                    while waiting and (len(waiting) >= batch_size or time.monotonic() - first_waiting_at >= max_batch_wait):
+                        if len(in_flight) >= 2 * args.workers:
+                            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                            collect(finished)
 
+                        batch, waiting = waiting[:batch_size], waiting[batch_size:]
+                        in_flight.add(executor.submit(process, [(path, path) for path in batch]))
+                        first_waiting_at = time.monotonic()
+
+                    finished = {future for future in in_flight if future.done()}
+                    in_flight -= finished
+                    collect(finished)
+
+            except KeyboardInterrupt:
+                print("Stopping after the batches in progress...")
+                finished, in_flight = wait(in_flight)
+                collect(finished)
+
+    finally:
+        watcher.close()
+
+
+def _print_report(summary: RunSummary, summary_path: str) -> None:
+    report = summary.to_dict()
+    print(f"Processed {report['images']} images in {report['elapsed_seconds']:.1f}s ({report['images_per_second']:.2f} images/s)")
+    for message, (count, _) in sorted(report['feedback'].items(), key=lambda kv: -kv[1][0]):
+        print(f"  {count:>7}  {message}")
+    if report['failures']:
+        print(f"  {len(report['failures']):>7}  failed")
+    if report['skipped']:
+        print(f"  {len(report['skipped']):>7}  skipped")
+    print("  stage totals: " + ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in report['stage_seconds'].items()))
+    if load_yolo_cascade_config().get('enabled'):
+        cascade = get_cascade_stats().to_dict()
+        print(f"  detector cascade: {cascade['escalation_rate']:.1%} escalated, cheap tier {cascade['cheap_ms_per_image']:.1f} ms/image, "
+              f"full tier {cascade['full_ms_per_image']:.1f} ms/escalated image")
+    print(f"Summary written to {summary_path}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    registry = ModelRegistry(pool_size=args.workers)
+    sink = create_sink(args.sink, args.output)
+    summary = RunSummary()
+    summary_path = args.summary or os.path.join(load_output_path_config(), 'results_summary', 'run_summary.json')
+
+    store = ArtefactStore(args.store) if args.store else None
+
+    def process(batch: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+        if args.from_stage == 'postprocessing':
+            # Model-free: only the stored OCR output is needed
+            return resume_batch_pipeline(None, batch, args.from_stage, sink)
+
+        with registry.checkout() as (yolo_model, ocr_model):
+            if args.from_stage:
+                return resume_batch_pipeline(ocr_model, batch, args.from_stage, sink, store)
+
+            keys, images = zip(*batch)
+            return batch_extraction_pipeline(yolo_model, ocr_model, list(images), sink, keys=list(keys), store=store)
+
+    try:
+        if args.from_stage:
+            run_stored(args, store, process, summary)
+        elif args.watch:
+            run_watch(args, process, summary)
+        else:
+            run_inputs(args, process, summary)
+
+    finally:
+        sink.close()
+        summary.write(summary_path)
+
+    _print_report(summary, summary_path)
+
+    return 1 if summary.to_dict()['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
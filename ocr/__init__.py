@@ -1 +1,7 @@
-from .load_ocr_model import load_ocr_model
\ No newline at end of file
+from .load_ocr_model import load_ocr_model
+from .backend import OCRBackend, PaddleOCRBackend
+from .template_grid import extract_with_template
+from .rectify import rectify_table, find_quad_from_lines, find_quad_from_text_boxes, warp_quad
+from .row_refinement import refine_missing_rows, locate_missing_cells
+from .mosaic import mosaic_ocr, pack_crops, build_canvas, split_canvas_results
+from .incremental import incremental_ocr, category_candidates
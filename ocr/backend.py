@@ -0,0 +1,123 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+from .utils import to_bgr, sort_boxes, crop_text_region
+
+
+class OCRBackend(ABC):
+    """
+    Common interface of the OCR engines used by the pipeline.
+
+    ocr() returns the PaddleOCR result shape expected by extract_required_text_fields:
+    [[[box, (text, confidence)], ...]] for one image, where box is a list of four [x, y] points,
+    or [None] when no text was found. detect(), classify() and recognize() expose the
+    individual steps so callers can skip detection or recognize several regions in one batch.
+    """
+
+    # Recognitions below this confidence are dropped, as PaddleOCR does by default
+    drop_score: float = 0.5
+
+    @abstractmethod
+    def detect(self, image: np.ndarray) -> List[np.ndarray]:
+        """
+        Find text boxes in an image.
+
+        Args:
+            image (np.ndarray): BGR or grayscale image.
+
+        Returns:
+            List[np.ndarray]: Boxes of shape (4, 2), corners ordered top-left, top-right, bottom-right, bottom-left.
+        """
+
+    @abstractmethod
+    def recognize(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Read the text of already cropped, upright text images in one batch.
+
+        Args:
+            images (List[np.ndarray]): Text crops.
+
+        Returns:
+            List[Tuple[str, float]]: Text and confidence for each crop, in input order.
+        """
+
+    def classify(self, images: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Turn upside-down text crops upright. Backends without an angle classifier return the crops unchanged.
+
+        Args:
+            images (List[np.ndarray]): Text crops.
+
+        Returns:
+            List[np.ndarray]: Upright text crops, in input order.
+        """
+        return images
+
+    def ocr(self, image: np.ndarray, cls: bool = True) -> List[Any]:
+        """
+        Detect, optionally angle-correct, and recognize all text in an image.
+
+        Args:
+            image (np.ndarray): BGR or grayscale image.
+            cls (bool): Whether to run the angle classifier.
+
+        Returns:
+            List[Any]: OCR result in the PaddleOCR shape.
+        """
+        image = to_bgr(image)
+        boxes = self.detect(image)
+
+        if not boxes:
+            return [None]
+
+        boxes = sort_boxes(boxes)
+        crops = [crop_text_region(image, box) for box in boxes]
+
+        if cls:
+            crops = self.classify(crops)
+
+        recognized = self.recognize(crops)
+        lines = [[box.tolist(), (text, score)] for box, (text, score) in zip(boxes, recognized) if score >= self.drop_score]
+
+        return [lines]
+
+
+class PaddleOCRBackend(OCRBackend):
+    """
+    OCR backend running PaddleOCR (PP-OCR detection, angle classification and recognition).
+    """
+
+    def __init__(self, cpu_threads: Optional[int] = None, **kwargs: Any) -> None:
+        """
+        Args:
+            cpu_threads (Optional[int]): Number of CPU threads for the Paddle inference engine. PaddleOCR default if None.
+            **kwargs: Extra PaddleOCR options.
+        """
+        # Imported here so other backends do not pay for importing Paddle
+        from paddleocr import PaddleOCR
+
+        options = {'use_angle_cls': True, 'lang': 'en'}
+        if cpu_threads is not None:
+            options['cpu_threads'] = cpu_threads
+        options.update(kwargs)
+
+        self.model = PaddleOCR(**options)
+
+    def ocr(self, image: np.ndarray, cls: bool = True) -> List[Any]:
+        return self.model.ocr(image, cls=cls)
+
+    def detect(self, image: np.ndarray) -> List[np.ndarray]:
+        dt_boxes, _ = self.model.text_detector(to_bgr(image))
+        return [] if dt_boxes is None else [np.asarray(box, dtype=np.float32) for box in dt_boxes]
+
+    def classify(self, images: List[np.ndarray]) -> List[np.ndarray]:
+        if not getattr(self.model, 'use_angle_cls', False) or not images:
+            return images
+        images, _, _ = self.model.text_classifier([to_bgr(img) for img in images])
+        return images
+
+    def recognize(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        if not images:
+            return []
+        rec_res, _ = self.model.text_recognizer([to_bgr(img) for img in images])
+        return [(text, float(score)) for text, score in rec_res]
@@ -0,0 +1,116 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from postprocessing import extract_required_text_fields
+from .backend import OCRBackend
+from .utils import to_bgr, sort_boxes, crop_text_region
+
+
+# identify_rows needs more than one distinct category to place any row
+MIN_CATEGORIES = 2
+
+
+def category_candidates(boxes: Sequence[np.ndarray], image_shape: Tuple[int, ...], max_aspect: float = 4.5) -> List[int]:
+    """
+    Select the text boxes short enough to hold a category label, in the order they are most likely to be one.
+
+    Category labels are one to three characters, so their boxes are close to square while dates are
+    long and thin. The category column runs along the left edge of an upright table, or along the top
+    edge of a table turned sideways, so boxes closest to either edge come first.
+
+    Args:
+        boxes (Sequence[np.ndarray]): Text boxes of shape (4, 2).
+        image_shape (Tuple[int, ...]): Shape of the image the boxes were found in.
+        max_aspect (float): Largest ratio of the long to the short side of a box that may hold a category.
+
+    Returns:
+        List[int]: Indices of the candidate boxes, leftmost or topmost first.
+    """
+    if not len(boxes):
+        return []
+
+    points = np.asarray(boxes, dtype=np.float32)
+    low, high = points.min(axis=1), points.max(axis=1)
+    extents = high - low
+
+    aspect = extents.max(axis=1) / np.maximum(extents.min(axis=1), 1.0)
+    centers = (low + high) / 2
+    edge_distance = np.minimum(centers[:, 0] / max(image_shape[1], 1), centers[:, 1] / max(image_shape[0], 1))
+
+    order = np.argsort(edge_distance, kind='stable')
+    return [int(i) for i in order if aspect[i] <= max_aspect]
+
+
+def _lines(boxes: List[np.ndarray], recognized: Dict[int, Tuple[str, float]], drop_score: float) -> List[Any]:
+    return [[boxes[i].tolist(), recognized[i]] for i in range(len(boxes)) if i in recognized and recognized[i][1] >= drop_score]
+
+
+def _read(ocr_model: OCRBackend, image: np.ndarray, boxes: List[np.ndarray], indices: List[int], cls: bool) -> Dict[int, Tuple[str, float]]:
+    crops = [crop_text_region(image, boxes[i]) for i in indices]
+    if cls:
+        crops = ocr_model.classify(crops)
+    return dict(zip(indices, ocr_model.recognize(crops)))
+
+
+def incremental_ocr(ocr_model: OCRBackend, image: np.ndarray, incremental_config: Dict[str, Any],
+                    cls: bool = True) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Detect all text, but recognize the likely category labels first and stop when the image cannot be a licence table.
+
+    Category-sized boxes (see category_candidates) are recognized in small batches. After each batch the
+    texts read so far go through the same category filter as postprocessing. Once MIN_CATEGORIES distinct
+    valid categories are found, the remaining boxes are recognized and the output is the same as ocr().
+    Recognition only stops early when every category-sized box has been read and fewer than MIN_CATEGORIES
+    were found, since no other box can hold a category label. If 'max_probe' boxes were read without
+    reaching either outcome, the remaining boxes are recognized as well, so a licence with many small
+    boxes ahead of its category column is never rejected early.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend.
+        image (np.ndarray): BGR or grayscale image.
+        incremental_config (Dict[str, Any]): 'incremental_ocr' section of config.yaml.
+        cls (bool): Whether to run the angle classifier.
+
+    Returns:
+        Tuple[List[Any], Dict[str, Any]]: OCR result in the PaddleOCR shape (only the boxes read when stopped
+        early), and the number of detected 'boxes', boxes 'read', distinct valid 'categories' found and whether it 'aborted'.
+    """
+    image = to_bgr(image)
+    boxes = ocr_model.detect(image)
+
+    if not boxes:
+        return [None], {'boxes': 0, 'read': 0, 'categories': 0, 'aborted': False}
+
+    boxes = sort_boxes(boxes)
+    recognized: Dict[int, Tuple[str, float]] = {}
+
+    batch_size = max(int(incremental_config.get('batch_size', 8)), 1)
+    max_probe: Optional[int] = incremental_config.get('max_probe', 24)
+
+    candidates = category_candidates(boxes, image.shape, incremental_config.get('max_aspect', 4.5))
+    probe = candidates if max_probe is None else candidates[:max_probe]
+
+    found = 0
+    for start in range(0, len(probe), batch_size):
+        # Not enough candidates left to reach the minimum, read or not
+        if found + len(candidates) - start < MIN_CATEGORIES:
+            break
+
+        recognized.update(_read(ocr_model, image, boxes, probe[start:start + batch_size], cls))
+        categories, _ = extract_required_text_fields([_lines(boxes, recognized, ocr_model.drop_score)])
+        found = len(set(categories.texts.tolist()))
+
+        if found >= MIN_CATEGORIES:
+            break
+
+    # Stopping is only safe when no unread box could hold a category; a probe cut short by max_probe reads on
+    unread_candidates = [i for i in candidates if i not in recognized]
+    aborted = found < MIN_CATEGORIES and found + len(unread_candidates) < MIN_CATEGORIES
+    if not aborted:
+        unread = [i for i in range(len(boxes)) if i not in recognized]
+        if unread:
+            recognized.update(_read(ocr_model, image, boxes, unread, cls))
+
+    lines = _lines(boxes, recognized, ocr_model.drop_score)
+    details = {'boxes': len(boxes), 'read': len(recognized), 'categories': found, 'aborted': aborted}
+
+    return [lines], details
@@ -1,20 +1,44 @@
-from paddleocr import PaddleOCR
+from typing import Any, Optional
+from utils import load_ocr_backend_config
+from .backend import OCRBackend, PaddleOCRBackend
 
 
-def load_ocr_model() -> PaddleOCR:
+def load_ocr_model(cpu_threads: Optional[int] = None, backend: Optional[str] = None, enable_mkldnn: Optional[bool] = None, **kwargs: Any) -> OCRBackend:
     """
-    Load a PaddleOCR model with English language support and angle classification enabled.
+    Load the OCR backend selected in config.yaml ('paddle' by default: PaddleOCR with English language support and angle classification enabled).
+
+    Args:
+        cpu_threads (Optional[int]): Number of CPU threads the inference engine may use. Engine default if None.
+        backend (Optional[str]): 'paddle' or 'onnx', overriding the configured backend.
+        enable_mkldnn (Optional[bool]): Turn Paddle's MKL-DNN kernels on or off. PaddleOCR default if None, ignored by other backends.
+        **kwargs: Extra backend options, overriding the configured ones.
 
     Returns:
-        ocr (PaddleOCR): Loaded PaddleOCR model instance.
+        ocr (OCRBackend): Loaded OCR backend instance.
 
     Raises:
-        RuntimeError: If loading the PaddleOCR model fails.
+        RuntimeError: If loading the OCR model fails.
     """
     try:
+        ocr_config = load_ocr_backend_config()
+        backend = backend or ocr_config.get('backend', 'paddle')
+
         # Attempt to load the OCR model
-        ocr = PaddleOCR(use_angle_cls=True, lang='en')
+        if backend == 'paddle':
+            if enable_mkldnn is not None:
+                kwargs['enable_mkldnn'] = enable_mkldnn
+            ocr = PaddleOCRBackend(cpu_threads=cpu_threads, **kwargs)
+
+        elif backend == 'onnx':
+            from .onnx_backend import OnnxOCRBackend
+            options = dict(ocr_config.get('onnx') or {})
+            options.update(kwargs)
+            ocr = OnnxOCRBackend(cpu_threads=cpu_threads, **options)
+
+        else:
+            raise ValueError(f"Unknown OCR backend: {backend}")
+
         return ocr
     
     except Exception as e:
-        raise RuntimeError(f"Failed to load PaddleOCR model: {e}")
+        raise RuntimeError(f"Failed to load {backend} OCR model: {e}")
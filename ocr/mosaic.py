@@ -0,0 +1,153 @@
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+from .backend import OCRBackend
+
+
+# Position of one crop on a canvas: (crop index, x, y)
+Placement = Tuple[int, int, int]
+
+
+def pack_crops(shapes: Sequence[Tuple[int, ...]], max_side: int = 960, gutter: int = 32,
+               max_crops: int = 16) -> List[List[Placement]]:
+    """
+    Place crops on as few canvases as possible, in shelves of decreasing height.
+
+    Every crop is surrounded by at least 'gutter' pixels of blank canvas, so text boxes of two crops
+    are never merged by the detector. A crop too large for a 'max_side' canvas gets a canvas of its own.
+
+    Args:
+        shapes (Sequence[Tuple[int, ...]]): Shape of each crop.
+        max_side (int): Largest canvas width and height, ideally the detector's input size so no crop is shrunk.
+        gutter (int): Blank pixels around every crop.
+        max_crops (int): Most crops on one canvas.
+
+    Returns:
+        List[List[Placement]]: Placements of each canvas.
+    """
+    order = sorted(range(len(shapes)), key=lambda i: (-shapes[i][0], -shapes[i][1]))
+    canvases: List[List[Placement]] = []
+
+    placements: List[Placement] = []
+    x = y = gutter
+    shelf_height = 0
+
+    for index in order:
+        height, width = shapes[index][:2]
+
+        if width + 2 * gutter > max_side or height + 2 * gutter > max_side:
+            canvases.append([(index, gutter, gutter)])
+            continue
+
+        # Next shelf when the crop does not fit in the width left
+        if x + width + gutter > max_side:
+            x, y = gutter, y + shelf_height + gutter
+            shelf_height = 0
+
+        # Next canvas when it does not fit in the height left, or the canvas is full
+        if y + height + gutter > max_side or len(placements) >= max_crops:
+            canvases.append(placements)
+            placements = []
+            x = y = gutter
+            shelf_height = 0
+
+        placements.append((index, x, y))
+        x += width + gutter
+        shelf_height = max(shelf_height, height)
+
+    if placements:
+        canvases.append(placements)
+
+    return canvases
+
+
+def build_canvas(crops: Sequence[np.ndarray], placements: List[Placement], gutter: int = 32, fill: int = 255) -> np.ndarray:
+    """
+    Draw crops at their placements on a blank canvas just large enough to hold them.
+
+    Args:
+        crops (Sequence[np.ndarray]): Grayscale or BGR crops.
+        placements (List[Placement]): Placements from pack_crops.
+        gutter (int): Blank pixels kept after the right- and bottom-most crops.
+        fill (int): Gray level of the blank canvas (white paper by default).
+
+    Returns:
+        np.ndarray: Canvas with the channel layout of the first crop.
+    """
+    first = crops[placements[0][0]]
+    width = max(x + crops[i].shape[1] for i, x, _ in placements) + gutter
+    height = max(y + crops[i].shape[0] for i, _, y in placements) + gutter
+
+    canvas = np.full((height, width) + first.shape[2:], fill, dtype=first.dtype)
+    for index, x, y in placements:
+        crop = crops[index]
+        canvas[y:y + crop.shape[0], x:x + crop.shape[1]] = crop
+
+    return canvas
+
+
+def split_canvas_results(results: List[Any], crops: Sequence[np.ndarray], placements: List[Placement]) -> Dict[int, List[Any]]:
+    """
+    Route the text boxes found on a canvas back to their crops, in crop coordinates.
+
+    A box belongs to the crop containing its center; boxes centered in a gutter are dropped.
+
+    Args:
+        results (List[Any]): OCR output of the canvas in the PaddleOCR shape.
+        crops (Sequence[np.ndarray]): Crops drawn on the canvas.
+        placements (List[Placement]): Placements of the canvas.
+
+    Returns:
+        Dict[int, List[Any]]: OCR output in the PaddleOCR shape for each crop index of the canvas.
+    """
+    lines: Dict[int, List[Any]] = {index: [] for index, _, _ in placements}
+
+    for bbox, recognized in results[0] or []:
+        points = np.asarray(bbox, dtype=np.float32)
+        cx, cy = points.mean(axis=0)
+
+        for index, x, y in placements:
+            height, width = crops[index].shape[:2]
+            if x <= cx < x + width and y <= cy < y + height:
+                points = points - (x, y)
+                np.clip(points[:, 0], 0, width - 1, out=points[:, 0])
+                np.clip(points[:, 1], 0, height - 1, out=points[:, 1])
+                lines[index].append([points.tolist(), recognized])
+                break
+
+    return {index: [found or None] for index, found in lines.items()}
+
+
+def mosaic_ocr(ocr_model: OCRBackend, crops: Sequence[np.ndarray], mosaic_config: Dict[str, Any],
+               cls: bool = True) -> Tuple[List[List[Any]], List[int]]:
+    """
+    Run OCR over several crops with one call per canvas instead of one call per crop.
+
+    The crops are packed into canvases (see pack_crops), each canvas goes through detection,
+    angle classification and recognition once, and every text box is mapped back to the crop it came from.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend.
+        crops (Sequence[np.ndarray]): Table crops, possibly from different images.
+        mosaic_config (Dict[str, Any]): 'mosaic' section of config.yaml.
+        cls (bool): Whether to run the angle classifier.
+
+    Returns:
+        Tuple[List[List[Any]], List[int]]: OCR output in the PaddleOCR shape for each crop, in input
+        order, and the number of crops that shared the OCR call of each crop.
+    """
+    gutter = mosaic_config.get('gutter', 32)
+    canvases = pack_crops([crop.shape for crop in crops], mosaic_config.get('max_side', 960), gutter,
+                          mosaic_config.get('max_crops', 16))
+
+    results: List[List[Any]] = [[None] for _ in crops]
+    shared = [1] * len(crops)
+
+    for placements in canvases:
+        canvas = build_canvas(crops, placements, gutter, mosaic_config.get('fill', 255))
+        canvas_results = ocr_model.ocr(canvas, cls=cls)
+
+        for index, crop_results in split_canvas_results(canvas_results, crops, placements).items():
+            results[index] = crop_results
+            shared[index] = len(placements)
+
+    return results, shared
@@ -0,0 +1,234 @@
+import math
+import os
+import cv2
+import numpy as np
+from typing import Any, List, Optional, Tuple
+from .backend import OCRBackend
+from .utils import to_bgr, order_box_points
+
+
+def quantize_recognizer(model_path: str) -> str:
+    """
+    Create a dynamically INT8-quantized copy of an ONNX recognition model, next to the original.
+
+    The quantized file is reused if it already exists.
+
+    Args:
+        model_path (str): Path to the float32 ONNX model.
+
+    Returns:
+        str: Path to the quantized model ('<name>.int8.onnx').
+
+    Raises:
+        RuntimeError: If quantization fails.
+    """
+    quantized_path = os.path.splitext(model_path)[0] + '.int8.onnx'
+
+    if not os.path.exists(quantized_path):
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        except Exception as e:
+            raise RuntimeError(f"Failed to quantize recognizer '{model_path}': {e}")
+
+    return quantized_path
+
+
+class OnnxOCRBackend(OCRBackend):
+    """
+    OCR backend running PP-OCR detection, classification and recognition models exported to ONNX
+    (e.g. with paddle2onnx) on ONNX Runtime's CPU execution provider.
+
+    Pre- and postprocessing follow PaddleOCR's defaults: DB text detection on images limited to
+    960 px, CTC recognition at 48 px height.
+    """
+
+    det_limit_side_len = 960
+    det_thresh = 0.3
+    det_box_thresh = 0.6
+    det_unclip_ratio = 1.5
+    det_max_candidates = 1000
+    rec_image_height = 48
+    rec_image_width = 320
+    rec_batch_size = 6
+    cls_image_width = 192
+    cls_thresh = 0.9
+
+    def __init__(self, det_model_path: str, rec_model_path: str, rec_char_dict_path: str,
+                 cls_model_path: Optional[str] = None, quantize_rec: bool = False, cpu_threads: Optional[int] = None) -> None:
+        """
+        Args:
+            det_model_path (str): ONNX text detection (DB) model.
+            rec_model_path (str): ONNX text recognition (CTC) model.
+            rec_char_dict_path (str): Character dictionary of the recognizer, one character per line.
+            cls_model_path (Optional[str]): ONNX angle classification model. Classification is skipped if None.
+            quantize_rec (bool): Run a dynamically INT8-quantized copy of the recognizer.
+            cpu_threads (Optional[int]): Intra-op threads per ONNX Runtime session. Runtime default if None.
+
+        Raises:
+            FileNotFoundError: If a model or the character dictionary does not exist.
+        """
+        # Imported here so the Paddle backend does not require onnxruntime
+        import onnxruntime as ort
+
+        for path in (det_model_path, rec_model_path, rec_char_dict_path, cls_model_path):
+            if path is not None and not os.path.exists(path):
+                raise FileNotFoundError(f"OCR model file not found: {path}")
+
+        if quantize_rec:
+            rec_model_path = quantize_recognizer(rec_model_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if cpu_threads is not None:
+            options.intra_op_num_threads = cpu_threads
+            options.inter_op_num_threads = 1
+
+        def create_session(path: str) -> Any:
+            return ort.InferenceSession(path, sess_options=options, providers=['CPUExecutionProvider'])
+
+        self.det_session = create_session(det_model_path)
+        self.rec_session = create_session(rec_model_path)
+        self.cls_session = create_session(cls_model_path) if cls_model_path else None
+
+        # CTC blank first, space last, as in PaddleOCR's character dictionaries with use_space_char
+        with open(rec_char_dict_path, 'r', encoding='utf-8') as f:
+            self.characters = ['blank'] + [line.rstrip('\r\n') for line in f] + [' ']
+
+    def _det_preprocess(self, image: np.ndarray) -> np.ndarray:
+        h, w = image.shape[:2]
+        ratio = min(1.0, self.det_limit_side_len / max(h, w))
+        resize_h = max(32, int(round(h * ratio / 32)) * 32)
+        resize_w = max(32, int(round(w * ratio / 32)) * 32)
+
+        resized = cv2.resize(image, (resize_w, resize_h)).astype(np.float32) / 255.0
+        resized -= np.array([0.485, 0.456, 0.406], dtype=np.float32)
+        resized /= np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+        return resized.transpose(2, 0, 1)[np.newaxis]
+
+    @staticmethod
+    def _box_score(pred: np.ndarray, points: np.ndarray) -> float:
+        h, w = pred.shape
+        x_min = int(np.clip(np.floor(points[:, 0].min()), 0, w - 1))
+        x_max = int(np.clip(np.ceil(points[:, 0].max()), 0, w - 1))
+        y_min = int(np.clip(np.floor(points[:, 1].min()), 0, h - 1))
+        y_max = int(np.clip(np.ceil(points[:, 1].max()), 0, h - 1))
+
+        mask = np.zeros((y_max - y_min + 1, x_max - x_min + 1), dtype=np.uint8)
+        cv2.fillPoly(mask, [(points - [x_min, y_min]).astype(np.int32)], 1)
+
+        return cv2.mean(pred[y_min:y_max + 1, x_min:x_max + 1], mask)[0]
+
+    def _db_postprocess(self, pred: np.ndarray, src_h: int, src_w: int) -> List[np.ndarray]:
+        h, w = pred.shape
+        bitmap = (pred > self.det_thresh).astype(np.uint8)
+        contours, _ = cv2.findContours(bitmap, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        boxes = []
+        for contour in contours[:self.det_max_candidates]:
+            rect = cv2.minAreaRect(contour)
+            if min(rect[1]) < 3:
+                continue
+
+            if self._box_score(pred, cv2.boxPoints(rect)) < self.det_box_thresh:
+                continue
+
+            # Unclip: grow the shrunk text kernel back by area * ratio / perimeter on every side
+            (cx, cy), (rw, rh), angle = rect
+            distance = rw * rh * self.det_unclip_ratio / (2 * (rw + rh))
+            rect = ((cx, cy), (rw + 2 * distance, rh + 2 * distance), angle)
+            if min(rect[1]) < 5:
+                continue
+
+            points = cv2.boxPoints(rect)
+            points[:, 0] = np.clip(np.round(points[:, 0] * src_w / w), 0, src_w)
+            points[:, 1] = np.clip(np.round(points[:, 1] * src_h / h), 0, src_h)
+            points = order_box_points(points)
+
+            if np.linalg.norm(points[0] - points[1]) <= 3 or np.linalg.norm(points[0] - points[3]) <= 3:
+                continue
+            boxes.append(points)
+
+        return boxes
+
+    def detect(self, image: np.ndarray) -> List[np.ndarray]:
+        image = to_bgr(image)
+        inputs = {self.det_session.get_inputs()[0].name: self._det_preprocess(image)}
+        pred = self.det_session.run(None, inputs)[0][0, 0]
+
+        return self._db_postprocess(pred, image.shape[0], image.shape[1])
+
+    def _normalize_batch(self, images: List[np.ndarray], image_width: int, fixed_width: bool = False) -> np.ndarray:
+        """
+        Resize crops to the model height keeping their aspect ratio, normalize to [-1, 1] and right-pad into one batch.
+
+        The batch is 'image_width' wide, or as wide as the widest crop when 'fixed_width' is False.
+        """
+        height = self.rec_image_height
+        if fixed_width:
+            batch_width = image_width
+        else:
+            max_ratio = max([image_width / height] + [img.shape[1] / max(img.shape[0], 1) for img in images])
+            batch_width = int(math.ceil(height * max_ratio))
+
+        batch = np.zeros((len(images), 3, height, batch_width), dtype=np.float32)
+        for i, img in enumerate(images):
+            img = to_bgr(img)
+            resized_w = min(batch_width, int(math.ceil(height * img.shape[1] / max(img.shape[0], 1))))
+            resized = cv2.resize(img, (max(resized_w, 1), height)).astype(np.float32) / 255.0
+            batch[i, :, :, :resized.shape[1]] = ((resized - 0.5) / 0.5).transpose(2, 0, 1)
+
+        return batch
+
+    def classify(self, images: List[np.ndarray]) -> List[np.ndarray]:
+        if self.cls_session is None or not images:
+            return images
+
+        images = list(images)
+        input_name = self.cls_session.get_inputs()[0].name
+
+        for start in range(0, len(images), self.rec_batch_size):
+            batch = self._normalize_batch(images[start:start + self.rec_batch_size], self.cls_image_width, fixed_width=True)
+            probs = self.cls_session.run(None, {input_name: batch})[0]
+
+            for j, (label, score) in enumerate(zip(probs.argmax(axis=1), probs.max(axis=1))):
+                if label == 1 and score > self.cls_thresh:
+                    images[start + j] = cv2.rotate(images[start + j], cv2.ROTATE_180)
+
+        return images
+
+    def _ctc_decode(self, probs: np.ndarray) -> List[Tuple[str, float]]:
+        indices = probs.argmax(axis=2)
+        max_probs = probs.max(axis=2)
+
+        decoded = []
+        for idx_row, prob_row in zip(indices, max_probs):
+            keep = idx_row != 0
+            keep[1:] &= idx_row[1:] != idx_row[:-1]
+
+            text = ''.join(self.characters[i] for i in idx_row[keep] if i < len(self.characters))
+            score = float(prob_row[keep].mean()) if keep.any() else 0.0
+            decoded.append((text, score))
+
+        return decoded
+
+    def recognize(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        if not images:
+            return []
+
+        input_name = self.rec_session.get_inputs()[0].name
+        results: List[Tuple[str, float]] = [('', 0.0)] * len(images)
+
+        # Batch crops of similar aspect ratio together to limit padding
+        order = np.argsort([img.shape[1] / max(img.shape[0], 1) for img in images])
+
+        for start in range(0, len(order), self.rec_batch_size):
+            chunk = order[start:start + self.rec_batch_size]
+            batch = self._normalize_batch([images[i] for i in chunk], self.rec_image_width)
+            probs = self.rec_session.run(None, {input_name: batch})[0]
+
+            for i, result in zip(chunk, self._ctc_decode(probs)):
+                results[i] = result
+
+        return results
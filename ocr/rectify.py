@@ -0,0 +1,200 @@
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from .backend import OCRBackend
+from .utils import order_box_points
+
+
+def _binarize(gray: np.ndarray) -> np.ndarray:
+    """
+    Dark ink (rules, borders and text) as non-zero pixels.
+    """
+    return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 15, 10)
+
+
+def _line_segments(binary: np.ndarray, min_length: int) -> np.ndarray:
+    """
+    Find long straight segments (table rules and borders) as rows of x1, y1, x2, y2.
+    """
+    segments = cv2.HoughLinesP(binary, 1, np.pi / 180, threshold=max(10, min_length // 2),
+                               minLineLength=min_length, maxLineGap=max(3, min_length // 20))
+
+    return np.zeros((0, 4), dtype=np.float32) if segments is None else segments.reshape(-1, 4).astype(np.float32)
+
+
+def _outer_lines(segments: np.ndarray, angle: float, tolerance: float, content: np.ndarray,
+                 max_inset: float) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Of the segments running at the given angle, return the two outermost ones.
+
+    Insets are measured along the normal of the segments, against the extent of the ink in the crop
+    (content), not against the crop corners: on a tilted table the corners of a tight crop lie far
+    outside the real border. An outermost segment lying further than max_inset inside the content is
+    an inner rule (the table border was not found) and is replaced by a parallel line through the
+    outermost content, so no content is cut off.
+    """
+    directions = segments[:, 2:] - segments[:, :2]
+    angles = np.degrees(np.arctan2(directions[:, 1], directions[:, 0])) % 180
+    deviation = np.abs((angles - angle + 90) % 180 - 90)
+    family = segments[deviation < tolerance]
+
+    if len(family) < 2:
+        return None
+
+    direction = np.array([np.cos(np.radians(angle)), np.sin(np.radians(angle))], dtype=np.float32)
+    normal = np.array([-direction[1], direction[0]], dtype=np.float32)
+    offsets = ((family[:, :2] + family[:, 2:]) / 2) @ normal
+
+    # Extent of the ink across the lines, ignoring stray specks
+    content_low, content_high = np.percentile(content @ normal, [0.2, 99.8])
+    limit = max_inset * (content_high - content_low)
+
+    first, last = family[np.argmin(offsets)], family[np.argmax(offsets)]
+    if offsets.min() - content_low > limit:
+        point = content_low * normal
+        first = np.concatenate([point, point + direction])
+    if content_high - offsets.max() > limit:
+        point = content_high * normal
+        last = np.concatenate([point, point + direction])
+
+    return first, last
+
+
+def _intersect(a: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+    p, r = a[:2], a[2:] - a[:2]
+    q, s = b[:2], b[2:] - b[:2]
+    denominator = r[0] * s[1] - r[1] * s[0]
+    if abs(denominator) < 1e-6:
+        return None
+
+    t = ((q[0] - p[0]) * s[1] - (q[1] - p[1]) * s[0]) / denominator
+    return p + t * r
+
+
+def find_quad_from_lines(gray: np.ndarray, min_line_ratio: float = 0.3, max_inset: float = 0.1, tolerance: float = 15.0) -> Optional[np.ndarray]:
+    """
+    Estimate the table quadrilateral from its ruled lines.
+
+    Long segments are split into two families around the dominant line angle and its perpendicular;
+    the outermost segment of each family gives one side of the table.
+
+    Args:
+        gray (np.ndarray): Grayscale table crop.
+        min_line_ratio (float): Shortest accepted segment, relative to the shorter side of the crop.
+        max_inset (float): Furthest an outermost segment may lie inside the ink of the crop, relative to its extent, to be taken as the table border.
+        tolerance (float): Largest angle deviation (degrees) of a segment from its family.
+
+    Returns:
+        Optional[np.ndarray]: Corners of shape (4, 2) ordered top-left, top-right, bottom-right, bottom-left, or None if too few lines were found.
+    """
+    binary = _binarize(gray)
+    segments = _line_segments(binary, int(min_line_ratio * min(gray.shape[:2])))
+    if len(segments) < 4:
+        return None
+
+    ys, xs = np.nonzero(binary)
+    content = np.column_stack([xs, ys]).astype(np.float32)
+
+    # Dominant angle modulo 90 degrees, weighted by segment length
+    directions = segments[:, 2:] - segments[:, :2]
+    lengths = np.linalg.norm(directions, axis=1)
+    angles = np.arctan2(directions[:, 1], directions[:, 0])
+    dominant = np.degrees(np.angle(np.sum(lengths * np.exp(4j * angles))) / 4) % 180
+
+    first_family = _outer_lines(segments, dominant, tolerance, content, max_inset)
+    second_family = _outer_lines(segments, (dominant + 90) % 180, tolerance, content, max_inset)
+    if first_family is None or second_family is None:
+        return None
+
+    corners = [_intersect(a, b) for a in first_family for b in second_family]
+    if any(corner is None for corner in corners):
+        return None
+
+    return order_box_points(np.array(corners, dtype=np.float32))
+
+
+def find_quad_from_text_boxes(boxes: List[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    Estimate the table quadrilateral as the smallest rotated rectangle around all detected text boxes.
+
+    Args:
+        boxes (List[np.ndarray]): Text boxes of shape (4, 2), e.g. from OCRBackend.detect.
+
+    Returns:
+        Optional[np.ndarray]: Corners of shape (4, 2) ordered top-left, top-right, bottom-right, bottom-left, or None if there are too few boxes.
+    """
+    if len(boxes) < 3:
+        return None
+
+    points = np.concatenate([np.asarray(box, dtype=np.float32).reshape(-1, 2) for box in boxes])
+    return order_box_points(cv2.boxPoints(cv2.minAreaRect(points)))
+
+
+def _is_plausible(quad: np.ndarray, shape: Tuple[int, ...], min_area_ratio: float) -> bool:
+    height, width = shape[:2]
+    slack = 0.1 * max(height, width)
+
+    inside = np.all((quad >= -slack) & (quad <= np.array([width, height]) + slack))
+    area = cv2.contourArea(quad)
+
+    return bool(inside) and cv2.isContourConvex(quad.reshape(-1, 1, 2)) and area >= min_area_ratio * height * width
+
+
+def warp_quad(image: np.ndarray, quad: np.ndarray, margin: float = 0.0) -> np.ndarray:
+    """
+    Warp a quadrilateral region to an upright rectangle.
+
+    Args:
+        image (np.ndarray): Source image.
+        quad (np.ndarray): Corners ordered top-left, top-right, bottom-right, bottom-left.
+        margin (float): Outward growth of the quadrilateral around its center, relative to its size, to keep border text.
+
+    Returns:
+        np.ndarray: Rectified image, as wide and tall as the longer of the opposite sides.
+    """
+    quad = np.asarray(quad, dtype=np.float32)
+    quad = quad + margin * (quad - quad.mean(axis=0))
+
+    width = int(max(np.linalg.norm(quad[0] - quad[1]), np.linalg.norm(quad[2] - quad[3])))
+    height = int(max(np.linalg.norm(quad[0] - quad[3]), np.linalg.norm(quad[1] - quad[2])))
+    width, height = max(width, 1), max(height, 1)
+
+    target = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(quad, target)
+
+    return cv2.warpPerspective(image, matrix, (width, height), borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_LINEAR)
+
+
+def rectify_table(ocr_model: OCRBackend, crop: np.ndarray, rectify_config: Dict[str, Any]) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+    """
+    Warp a tilted or perspective-distorted table crop to an upright rectangle.
+
+    The table outline is taken from its ruled lines when they are found, else (if enabled) from the
+    text boxes of a detection-only pass. Outlines that are not convex or cover too little of the crop are rejected.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend, used for the text-box method.
+        crop (np.ndarray): Grayscale table crop.
+        rectify_config (Dict[str, Any]): 'rectify' section of config.yaml.
+
+    Returns:
+        Optional[Tuple[np.ndarray, Dict[str, Any]]]: Rectified crop and the method and quadrilateral used, or None to keep the crop as it is.
+    """
+    min_area_ratio = rectify_config.get('min_area_ratio', 0.4)
+    margin = rectify_config.get('margin', 0.02)
+
+    for method in rectify_config.get('methods', ['lines']):
+        if method == 'lines':
+            quad = find_quad_from_lines(crop, rectify_config.get('min_line_ratio', 0.3), rectify_config.get('max_inset', 0.1))
+        elif method == 'text_boxes':
+            # Backends without a detection-only pass cannot provide text boxes
+            if not hasattr(ocr_model, 'detect'):
+                continue
+            quad = find_quad_from_text_boxes(ocr_model.detect(crop))
+        else:
+            raise ValueError(f"Unknown rectification method: {method}")
+
+        if quad is not None and _is_plausible(quad, crop.shape, min_area_ratio):
+            return warp_quad(crop, quad, margin), {'method': method, 'quad': quad.tolist()}
+
+    return None
@@ -0,0 +1,181 @@
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple, Union
+from postprocessing import extract_required_text_fields, find_image_orientation
+from postprocessing.utils import (get_center_points, complete_categories, get_dates_center, get_bias, categorize_dates,
+                                  get_date_pairs, order_rows)
+from utils import OCRDetections
+from .backend import OCRBackend
+from .template_grid import _validate_date
+
+
+def _median_extents(dates: OCRDetections) -> np.ndarray:
+    """
+    Median (x, y) extent of the detected date boxes.
+    """
+    return np.median(dates.boxes.max(axis=1) - dates.boxes.min(axis=1), axis=0)
+
+
+def locate_missing_cells(dates: OCRDetections, orientation: str, categories: OCRDetections, rows: Dict[str, List[str]],
+                         padding: float = 0.25) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Predict where the missing partner date of every unmatched date should be.
+
+    Each unmatched date is placed in the row of its closest completed category, as get_rows does for
+    pairs. Rows that already hold a pair, and rows holding more than one unmatched date, are skipped:
+    their dates count as leftover and are never paired with each other here. The missing cell lies in the other date column,
+    on the same row, shifted by the median row offset between issued and expiry dates of the matched
+    pairs (table skew). Its size is the median date box size grown by 'padding', and no taller than
+    the row pitch.
+
+    Args:
+        dates (OCRDetections): Validated dates from extract_required_text_fields.
+        orientation (str): 'portrait' or 'landscape'.
+        categories (OCRDetections): Sorted categories from find_image_orientation.
+        rows (Dict[str, List[str]]): Rows found by identify_rows.
+        padding (float): Growth of the cell on each side, relative to the date box size.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Any]]: One target per missing row with its 'category', the known
+        'issued' / 'expiry' text (None for the cell to read) and the 'cells' to read as side -> (x1, y1, x2, y2);
+        and the layout: number of matched 'pairs', 'leftover' unmatched dates in skipped rows, and whether the issued column comes first along the date axis ('issued_first').
+    """
+    row_idx = 1 if orientation == 'landscape' else 0
+    date_idx = 1 - row_idx
+
+    date_centers = get_center_points(dates)
+    category_labels, completed = complete_categories(categories.texts, get_center_points(categories))
+
+    dates_center = get_dates_center(date_centers, orientation)
+    bias = get_bias(completed, orientation)
+    issued_dates, expiry_dates = categorize_dates(date_centers, dates_center, orientation, bias)
+
+    if not len(issued_dates) or not len(expiry_dates):
+        return [], {'pairs': 0, 'leftover': len(date_centers), 'issued_first': True}
+
+    date_pairs, unmatched_dates = get_date_pairs(date_centers, issued_dates, expiry_dates, orientation)
+
+    # Date columns, skew between them and row pitch
+    columns = {
+        'issued': float(np.median(date_centers[issued_dates, date_idx])),
+        'expiry': float(np.median(date_centers[expiry_dates, date_idx])),
+    }
+    shift = float(np.median(date_centers[date_pairs[:, 1], row_idx] - date_centers[date_pairs[:, 0], row_idx])) if len(date_pairs) else 0.0
+    pitch = float(np.median(np.abs(np.diff(completed[:, row_idx]))))
+
+    extents = _median_extents(dates) * (1 + 2 * padding)
+    extents[row_idx] = min(extents[row_idx], pitch)
+
+    layout = {'pairs': len(date_pairs), 'leftover': 0, 'issued_first': columns['issued'] < columns['expiry']}
+    unmatched_by_row: Dict[str, List[Tuple[str, int]]] = {}
+
+    for date in unmatched_dates:
+        side = 'issued' if date in issued_dates else 'expiry'
+        position = date_centers[date, row_idx]
+        # Row position at the category column, as in get_approx_category_position
+        row_pos = position - shift if side == 'issued' else position - 2 * shift
+        category = category_labels[int(np.argmin(np.abs(completed[:, row_idx] - row_pos)))]
+        unmatched_by_row.setdefault(category, []).append((side, date))
+
+    located = []
+    for category, found in unmatched_by_row.items():
+        # Rows already holding a pair, or several unmatched dates that get_date_pairs refused to pair, are not re-read
+        if category in rows or len(found) > 1:
+            layout['leftover'] += len(found)
+            continue
+
+        side, date = found[0]
+        anchor = float(date_centers[date, row_idx])
+        target = {'category': category, 'issued': None, 'expiry': None, 'cells': {}}
+        target[side] = str(dates.texts[date])
+
+        missing = 'expiry' if side == 'issued' else 'issued'
+        center = [0.0, 0.0]
+        center[date_idx] = columns[missing]
+        center[row_idx] = anchor + shift if missing == 'expiry' else anchor - shift
+
+        target['cells'][missing] = (center[0] - extents[0] / 2, center[1] - extents[1] / 2,
+                                    center[0] + extents[0] / 2, center[1] + extents[1] / 2)
+        located.append(target)
+
+    return located, layout
+
+
+def _cut_cell(image: np.ndarray, cell: Tuple[float, float, float, float], rotation: Optional[int], upscale: float) -> np.ndarray:
+    height, width = image.shape[:2]
+    x1, y1 = int(np.clip(cell[0], 0, width - 1)), int(np.clip(cell[1], 0, height - 1))
+    x2, y2 = int(np.clip(np.ceil(cell[2]), x1 + 1, width)), int(np.clip(np.ceil(cell[3]), y1 + 1, height))
+
+    cut = image[y1:y2, x1:x2]
+    if rotation is not None:
+        cut = cv2.rotate(cut, rotation)
+    if upscale != 1.0:
+        cut = cv2.resize(cut, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
+
+    return cut
+
+
+def _reading_rotation(orientation: str, issued_first: bool) -> Optional[int]:
+    """
+    Rotation that turns a cut date cell upright: the issued column is left of the expiry column in an upright table.
+    """
+    if orientation == 'landscape':
+        return None if issued_first else cv2.ROTATE_180
+    # Table turned clockwise when issued dates are above expiry dates
+    return cv2.ROTATE_90_COUNTERCLOCKWISE if issued_first else cv2.ROTATE_90_CLOCKWISE
+
+
+def refine_missing_rows(ocr_model: OCRBackend, crop: np.ndarray, ocr_results: Union[List[Any], OCRDetections], rows: Dict[str, List[str]],
+                        refine_config: Dict[str, Any]) -> Tuple[str, Dict[str, List[str]], Dict[str, Any]]:
+    """
+    Re-read only the cells of the rows identify_rows could not complete, instead of the whole table.
+
+    The missing cells (see locate_missing_cells) are cut out of the crop the OCR ran on, turned upright,
+    upscaled and recognized in one batch. A row is added when both of its dates are then valid.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend.
+        crop (np.ndarray): Image the full OCR ran on.
+        ocr_results (Union[List[Any], OCRDetections]): Raw OCR output of that image.
+        rows (Dict[str, List[str]]): Rows found by identify_rows.
+        refine_config (Dict[str, Any]): 'row_refinement' section of config.yaml.
+
+    Returns:
+        Tuple[str, Dict[str, List[str]], Dict[str, Any]]: Feedback message, rows, and the number of
+        targeted rows, cells read and recovered rows.
+
+    Raises:
+        RuntimeError: If the refinement fails.
+    """
+    try:
+        categories, dates = extract_required_text_fields(ocr_results)
+        orientation, sorted_categories = find_image_orientation(categories)
+
+        targets, layout = locate_missing_cells(dates, orientation, sorted_categories, rows, refine_config.get('padding', 0.25))
+
+        cells = [(target, side, cell) for target in targets for side, cell in target['cells'].items()]
+        details = {'targets': len(targets), 'cells': len(cells), 'recovered': 0}
+
+        if cells:
+            rotation = _reading_rotation(orientation, layout['issued_first'])
+            upscale = refine_config.get('upscale', 2.0)
+            recognized = ocr_model.recognize([_cut_cell(crop, cell, rotation, upscale) for _, _, cell in cells])
+
+            for (target, side, _), (text, confidence) in zip(cells, recognized):
+                target[side] = _validate_date(text, confidence, ocr_model.drop_score)
+
+        # A row is only recovered through a cell that was actually re-read
+        recovered = {target['category']: [target['issued'], target['expiry']] for target in targets
+                     if target['cells'] and target['issued'] and target['expiry']}
+        details['recovered'] = len(recovered)
+
+        merged = order_rows({**rows, **recovered})
+
+        # Same completeness rule as identify_rows: every pair placed in its own row, no date left over
+        complete = len(rows) == layout['pairs'] and not layout['leftover'] and len(recovered) == len(targets)
+        feedback_text = 'Detection Successful.' if complete else 'Some rows are missing in the result.'
+
+        return feedback_text, merged, details
+
+    except Exception as e:
+        raise RuntimeError(f"Error during row refinement: {e}")
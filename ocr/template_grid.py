@@ -0,0 +1,198 @@
+import re
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from postprocessing.filter_ocr import validate_vehicle_categories, validate_dates
+from .backend import OCRBackend
+from .utils import crop_text_region
+
+
+DATE_PATTERN = re.compile(r'^\d{2}\.\d{2}\.\d{4}$')
+
+ROTATIONS = {
+    0: None,
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+
+def _span(column: Sequence[float], width: int) -> Tuple[int, int]:
+    x1, x2 = int(column[0] * width), int(np.ceil(column[1] * width))
+    return max(0, x1), min(width, max(x2, x1 + 1))
+
+
+def _cut_cells(image: np.ndarray, column: Sequence[float], row_centers: np.ndarray, row_pitch: float) -> List[np.ndarray]:
+    """
+    Cut one cell per row out of a column of the upright table crop.
+    """
+    height, width = image.shape[:2]
+    x1, x2 = _span(column, width)
+    cells = []
+
+    for center in row_centers:
+        y1 = int(np.clip(center - row_pitch / 2, 0, height - 1))
+        y2 = int(np.clip(center + row_pitch / 2, y1 + 1, height))
+        cells.append(image[y1:y2, x1:x2])
+
+    return cells
+
+
+def _match_category(text: str, category: str) -> bool:
+    validated = validate_vehicle_categories([(None, text.strip(), category)])
+    return bool(validated) and validated[0][1] == category
+
+
+def _validate_date(text: str, confidence: float, drop_score: float) -> Optional[str]:
+    if confidence < drop_score:
+        return None
+    validated = validate_dates([(None, text.strip())])
+    if validated and DATE_PATTERN.match(validated[0][1]):
+        return validated[0][1]
+    return None
+
+
+def template_row_centers(height: int, categories: Sequence[str], rows_top: float, rows_bottom: float) -> Tuple[np.ndarray, float]:
+    """
+    Place the category rows evenly between the template's top and bottom edges.
+
+    Args:
+        height (int): Height of the upright table crop.
+        categories (Sequence[str]): Category order of the table.
+        rows_top (float): Relative y of the top edge of the first row.
+        rows_bottom (float): Relative y of the bottom edge of the last row.
+
+    Returns:
+        Tuple[np.ndarray, float]: Row center y coordinates and row pitch in pixels.
+    """
+    pitch = (rows_bottom - rows_top) * height / len(categories)
+    centers = rows_top * height + pitch * (np.arange(len(categories)) + 0.5)
+    return centers, pitch
+
+
+def fit_row_centers_from_anchors(ocr_model: OCRBackend, upright: np.ndarray, categories: Sequence[str],
+                                 category_column: Sequence[float], max_residual: float) -> Optional[Tuple[np.ndarray, float]]:
+    """
+    Fit the row positions to category labels detected in the category column only.
+
+    Text detection runs on a narrow strip around the category column; each recognized category gives
+    an anchor (row index, y center) and a least-squares line through the anchors gives every row.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend.
+        upright (np.ndarray): Upright table crop.
+        categories (Sequence[str]): Category order of the table.
+        category_column (Sequence[float]): Relative x span of the category column.
+        max_residual (float): Largest accepted anchor deviation from the fitted line, in row pitches.
+
+    Returns:
+        Optional[Tuple[np.ndarray, float]]: Row centers and pitch, or None if fewer than two anchors fit.
+    """
+    width = upright.shape[1]
+    col_width = category_column[1] - category_column[0]
+    x1, x2 = _span([category_column[0] - col_width / 2, category_column[1] + col_width / 2], width)
+    strip = upright[:, x1:x2]
+
+    boxes = ocr_model.detect(strip)
+    if len(boxes) < 2:
+        return None
+
+    recognized = ocr_model.recognize([crop_text_region(strip, box) for box in boxes])
+
+    # Longer labels first so 'A1' is not taken for 'A'
+    by_length = sorted(range(len(categories)), key=lambda i: -len(categories[i]))
+    anchors: Dict[int, float] = {}
+
+    for box, (text, confidence) in zip(boxes, recognized):
+        if confidence < ocr_model.drop_score:
+            continue
+        for index in by_length:
+            if index not in anchors and _match_category(text, categories[index]):
+                anchors[index] = float(np.mean(box[:, 1]))
+                break
+
+    if len(anchors) < 2:
+        return None
+
+    indices = np.array(list(anchors), dtype=np.float32)
+    centers_y = np.array(list(anchors.values()), dtype=np.float32)
+    pitch, intercept = np.polyfit(indices, centers_y, 1)
+
+    if pitch <= 0:
+        return None
+
+    residual = np.max(np.abs(intercept + pitch * indices - centers_y)) / pitch
+    if residual > max_residual:
+        return None
+
+    return intercept + pitch * np.arange(len(categories)), float(pitch)
+
+
+def extract_with_template(ocr_model: OCRBackend, crop: np.ndarray, categories: Sequence[str],
+                          grid_config: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, List[str]], Dict[str, Any]]]:
+    """
+    Read category, date rows by cutting the expected cells out of the table crop, without full-table text detection.
+
+    For each configured rotation the grid is placed from the table box alone ('box' mode) or fitted to
+    category labels found in the category column ('anchors' mode). The category cells are recognized
+    in one batch to check the fit; if enough of them read as their expected category, the issued and
+    expiry cells are recognized in a second batch.
+
+    Args:
+        ocr_model (OCRBackend): OCR backend.
+        crop (np.ndarray): Table crop from the detection stage.
+        categories (Sequence[str]): Category order of the table ('vehicle_categories_for_sort').
+        grid_config (Dict[str, Any]): 'template_grid' section of config.yaml.
+
+    Returns:
+        Optional[Tuple[str, Dict[str, List[str]], Dict[str, Any]]]: Feedback message, rows and fit details,
+        or None if the template does not fit and the full OCR path should be used.
+    """
+    category_column = grid_config['category_column']
+    min_score = grid_config.get('min_anchor_score', 0.6)
+
+    for rotation in grid_config.get('rotations', [0]):
+        upright = crop if ROTATIONS[rotation] is None else cv2.rotate(crop, ROTATIONS[rotation])
+        height = upright.shape[0]
+
+        if grid_config.get('mode', 'box') == 'anchors':
+            fitted = fit_row_centers_from_anchors(ocr_model, upright, categories, category_column, grid_config.get('max_residual', 0.35))
+            if fitted is None:
+                continue
+            row_centers, row_pitch = fitted
+        else:
+            row_centers, row_pitch = template_row_centers(height, categories, grid_config['rows_top'], grid_config['rows_bottom'])
+
+        # Check the fit on the category column
+        category_texts = ocr_model.recognize(_cut_cells(upright, category_column, row_centers, row_pitch))
+        matched = sum(_match_category(text, cat) for (text, _), cat in zip(category_texts, categories))
+        score = matched / len(categories)
+
+        if score < min_score:
+            continue
+
+        # Recognize issued and expiry cells of every row in one batch
+        date_cells = (_cut_cells(upright, grid_config['issued_column'], row_centers, row_pitch) +
+                      _cut_cells(upright, grid_config['expiry_column'], row_centers, row_pitch))
+        date_texts = ocr_model.recognize(date_cells)
+        issued_texts, expiry_texts = date_texts[:len(categories)], date_texts[len(categories):]
+
+        rows: Dict[str, List[str]] = {}
+        incomplete_rows = 0
+
+        for cat, issued, expiry in zip(categories, issued_texts, expiry_texts):
+            issued_date = _validate_date(*issued, ocr_model.drop_score)
+            expiry_date = _validate_date(*expiry, ocr_model.drop_score)
+
+            if issued_date and expiry_date:
+                rows[cat] = [issued_date, expiry_date]
+            elif issued_date or expiry_date:
+                incomplete_rows += 1
+
+        if not rows:
+            return None
+
+        feedback_text = 'Detection Successful.' if not incomplete_rows else 'Some rows are missing in the result.'
+        return feedback_text, rows, {'rotation': rotation, 'score': score}
+
+    return None
@@ -0,0 +1,91 @@
+import cv2
+import numpy as np
+from typing import List
+
+
+def to_bgr(image: np.ndarray) -> np.ndarray:
+    """
+    Convert a grayscale or BGRA image to 3-channel BGR, as expected by the OCR models.
+
+    Args:
+        image (np.ndarray): Input image.
+
+    Returns:
+        np.ndarray: 3-channel BGR image.
+    """
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+    return image
+
+
+def order_box_points(points: np.ndarray) -> np.ndarray:
+    """
+    Order the four corners of a quadrilateral as top-left, top-right, bottom-right, bottom-left.
+
+    Corners are taken clockwise by their angle around the centroid, starting from the one closest to
+    the image origin, so quadrilaterals turned by up to 45 degrees keep their sides together.
+
+    Args:
+        points (np.ndarray): Array of shape (4, 2).
+
+    Returns:
+        np.ndarray: Ordered float32 array of shape (4, 2).
+    """
+    points = np.asarray(points, dtype=np.float32)
+    offsets = points - points.mean(axis=0)
+    clockwise = points[np.argsort(np.arctan2(offsets[:, 1], offsets[:, 0]))]
+
+    start = int(np.argmin(clockwise.sum(axis=1)))
+    return np.roll(clockwise, -start, axis=0)
+
+
+def sort_boxes(boxes: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Sort text boxes top to bottom, then left to right within a line (same order as PaddleOCR).
+
+    Args:
+        boxes (List[np.ndarray]): Boxes of shape (4, 2).
+
+    Returns:
+        List[np.ndarray]: Sorted boxes.
+    """
+    sorted_boxes = sorted(boxes, key=lambda b: (b[0][1], b[0][0]))
+
+    for i in range(len(sorted_boxes) - 1):
+        for j in range(i, -1, -1):
+            if abs(sorted_boxes[j + 1][0][1] - sorted_boxes[j][0][1]) < 10 and sorted_boxes[j + 1][0][0] < sorted_boxes[j][0][0]:
+                sorted_boxes[j], sorted_boxes[j + 1] = sorted_boxes[j + 1], sorted_boxes[j]
+            else:
+                break
+
+    return sorted_boxes
+
+
+def crop_text_region(image: np.ndarray, box: np.ndarray) -> np.ndarray:
+    """
+    Cut a (possibly rotated) text box out of an image and warp it to an upright rectangle.
+
+    Tall crops are rotated by 90 degrees so the text runs horizontally for the recognizer.
+
+    Args:
+        image (np.ndarray): Source image.
+        box (np.ndarray): Text box corners ordered top-left, top-right, bottom-right, bottom-left.
+
+    Returns:
+        np.ndarray: Upright crop of the text.
+    """
+    box = np.asarray(box, dtype=np.float32)
+    width = int(max(np.linalg.norm(box[0] - box[1]), np.linalg.norm(box[2] - box[3])))
+    height = int(max(np.linalg.norm(box[0] - box[3]), np.linalg.norm(box[1] - box[2])))
+    width, height = max(width, 1), max(height, 1)
+
+    target = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(box, target)
+    crop = cv2.warpPerspective(image, matrix, (width, height), borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC)
+
+    if height / width >= 1.5:
+        crop = np.rot90(crop)
+
+    return crop
@@ -1,34 +1,64 @@
-from yolo_detection import load_model, detect_info_table
-from utils import save_csv, load_yolo_weights_config
-from ocr import load_ocr_model
+from yolo_detection import load_model, load_cascade, detect_info_table, detect_info_tables
+from utils import save_csv, load_yolo_weights_config, load_yolo_cascade_config, load_runtime_config, load_template_grid_config, load_rectify_config, load_row_refinement_config, load_mosaic_config, load_incremental_ocr_config, load_vehicle_cat_config, DeadlinePlanner, get_deadline_planner, ArtefactStore, OCRDetections
+from ocr import load_ocr_model, OCRBackend, extract_with_template, rectify_table, refine_missing_rows, mosaic_ocr, incremental_ocr
 from postprocessing import (extract_required_text_fields, find_image_orientation, identify_rows)
 import cv2
 import os
+import time
+import numpy as np
 from ultralytics import YOLO
-from paddleocr import PaddleOCR
-from typing import Any, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
-def load_models() -> Tuple[YOLO, PaddleOCR]:
+DEADLINE_FEEDBACK = 'Partial due to deadline.'
+CATEGORIES_FEEDBACK = 'Unable to identify categories properly.'
+
+# Stages resume_batch_pipeline can restart at, each from the stored outputs of the stage before it
+RESUMABLE_STAGES = ('ocr', 'postprocessing')
+
+def _thread_count(tuned: Optional[int], shared: Optional[int], budget: Optional[int]) -> Optional[int]:
+    # Tuned count first, capped by an explicit per-instance budget
+    threads = tuned or shared
+    return min(threads, budget) if threads and budget else threads
+
+
+def load_models(intra_op_threads: Optional[int] = None) -> Tuple[YOLO, OCRBackend]:
     """
     Load both YOLO and OCR models, ensuring robust exception handling.
 
+    Thread settings from the 'runtime' section of config.yaml (e.g. written by the autotune
+    command) are applied here: 'torch_threads' and 'ocr_cpu_threads' take precedence over
+    the shared 'intra_op_threads' of config.yaml, but never exceed an explicit intra_op_threads
+    (the per-instance budget of a ModelRegistry), and 'ocr_enable_mkldnn' switches Paddle's MKL-DNN kernels.
+    When the detector cascade is enabled, the returned YOLO model is a DetectorCascade,
+    which is called the same way.
+
     Args:
-        None
+        intra_op_threads (Optional[int]): CPU threads each model may use for a single inference. Read from config.yaml if None.
     
     Returns:
-        tuple: A tuple containing the loaded YOLO model and PaddleOCR model.
+        tuple: A tuple containing the loaded YOLO model and OCR backend.
     
     Raises:
         RuntimeError: If the loading of either the YOLO or OCR model fails.
     """
     try:
+        runtime = load_runtime_config()
+        shared_threads = intra_op_threads or runtime.get('intra_op_threads')
+
         # Load YOLO model 
         finetuned_weights_path = load_yolo_weights_config()
-        yolo_model = load_model(finetuned_weights_path)
+        torch_threads = _thread_count(runtime.get('torch_threads'), shared_threads, intra_op_threads)
+        cascade_config = load_yolo_cascade_config()
+
+        if cascade_config.get('enabled'):
+            yolo_model = load_cascade(finetuned_weights_path, cascade_config, num_threads=torch_threads)
+        else:
+            yolo_model = load_model(finetuned_weights_path, num_threads=torch_threads)
 
         # Load OCR model
-        ocr_model = load_ocr_model()
+        ocr_model = load_ocr_model(cpu_threads=_thread_count(runtime.get('ocr_cpu_threads'), shared_threads, intra_op_threads),
+                                   enable_mkldnn=runtime.get('ocr_enable_mkldnn'))
 
         return yolo_model, ocr_model
     
@@ -38,7 +68,406 @@ def load_models() -> Tuple[YOLO, PaddleOCR]:
 
 
 
-def detail_extraction_pipeline(yolo_model: YOLO, ocr_model: PaddleOCR, img_file_path: str) -> str:
+def _record_stage_time(trace: Optional[Dict[str, Any]], stage: str, start: float) -> None:
+    """
+    Store the elapsed time of a pipeline stage in the trace, if tracing is enabled.
+    """
+    if trace is not None:
+        trace.setdefault('timings', {})[stage] = time.perf_counter() - start
+
+
+def run_detection_stage(yolo_model: YOLO, img_file_path: Union[str, np.ndarray], trace: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Detect the information table of a license image and return it as a grayscale crop.
+
+    Args:
+        yolo_model (YOLO): Pre-loaded YOLO object detection model.
+        img_file_path (Union[str, np.ndarray]): Path to the image file, or the decoded BGR image.
+        trace (Optional[Dict[str, Any]]): If given, receives the table box, its confidence, the crop and the stage time.
+
+    Returns:
+        np.ndarray: Grayscale crop of the table, or of the whole image if no table was found.
+    """
+    start = time.perf_counter()
+
+    # Detect information table and crop
+    crops = detect_info_table(yolo_model, img_file_path, trace)
+
+    # Convert to grayscale for better OCR
+    crops = cv2.cvtColor(crops, cv2.COLOR_BGR2GRAY)
+
+    if trace is not None:
+        trace['crop'] = crops
+    _record_stage_time(trace, 'detection', start)
+
+    return crops
+
+
+def run_template_stage(ocr_model: OCRBackend, crops: np.ndarray, trace: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, Dict[str, List[str]]]]:
+    """
+    Try the template-grid fast path: read the date cells at their expected table positions without full-table text detection.
+
+    Only used when enabled in config.yaml and the table was found by YOLO.
+
+    Args:
+        ocr_model (OCRBackend): Pre-loaded OCR model.
+        crops (np.ndarray): Grayscale table crop from run_detection_stage.
+        trace (Optional[Dict[str, Any]]): Trace of the request; receives the fit details and the stage time.
+
+    Returns:
+        Optional[Tuple[str, Dict[str, List[str]]]]: Feedback message and rows, or None to continue with the full OCR path.
+    """
+    grid_config = load_template_grid_config()
+
+    if not grid_config.get('enabled') or not (trace or {}).get('table_found') or not hasattr(ocr_model, 'recognize'):
+        return None
+
+    start = time.perf_counter()
+
+    categories = load_vehicle_cat_config(is_to_sort=True)
+    extracted = extract_with_template(ocr_model, crops, categories, grid_config)
+
+    _record_stage_time(trace, 'template', start)
+
+    if extracted is None:
+        return None
+
+    feedback_text, cat_date_pairs, fit = extracted
+    if trace is not None:
+        trace['template_fit'] = fit
+
+    return feedback_text, cat_date_pairs
+
+
+def run_rectify_stage(ocr_model: OCRBackend, crops: np.ndarray, trace: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Warp a tilted or perspective-distorted table crop to an upright rectangle before full OCR.
+
+    Only used when enabled in config.yaml and the table was found by YOLO. The crop is returned
+    unchanged when no plausible table outline is found.
+
+    Args:
+        ocr_model (OCRBackend): Pre-loaded OCR model, used when the outline is taken from text boxes.
+        crops (np.ndarray): Grayscale table crop from run_detection_stage.
+        trace (Optional[Dict[str, Any]]): Trace of the request; receives the outline used and the stage time.
+
+    Returns:
+        np.ndarray: Rectified table crop, or the input crop.
+    """
+    rectify_config = load_rectify_config()
+
+    if not rectify_config.get('enabled') or not (trace or {}).get('table_found'):
+        return crops
+
+    start = time.perf_counter()
+
+    rectified = rectify_table(ocr_model, crops, rectify_config)
+
+    if trace is not None and rectified is not None:
+        trace['rectify'] = rectified[1]
+    _record_stage_time(trace, 'rectify', start)
+
+    return crops if rectified is None else rectified[0]
+
+
+def run_ocr_stage(ocr_model: OCRBackend, crops: np.ndarray, trace: Optional[Dict[str, Any]] = None, cls: bool = True) -> List[Any]:
+    """
+    Perform OCR on the cropped table.
+
+    With incremental OCR enabled in config.yaml (and a backend exposing the separate OCR steps), the
+    likely category labels are recognized first and recognition stops when no licence table can be found.
+
+    Args:
+        ocr_model (OCRBackend): Pre-loaded OCR model.
+        crops (np.ndarray): Grayscale crop from run_detection_stage.
+        trace (Optional[Dict[str, Any]]): If given, receives the raw OCR output, the incremental OCR counts and the stage time.
+        cls (bool): Whether to run the angle classifier.
+
+    Returns:
+        List[Any]: Raw OCR output in the PaddleOCR shape.
+    """
+    start = time.perf_counter()
+
+    incremental_config = load_incremental_ocr_config()
+
+    if incremental_config.get('enabled') and hasattr(ocr_model, 'detect'):
+        results, details = incremental_ocr(ocr_model, crops, incremental_config, cls=cls)
+        if trace is not None:
+            trace['incremental_ocr'] = details
+    else:
+        results = ocr_model.ocr(crops, cls=cls)
+
+    if trace is not None:
+        trace['ocr_results'] = results
+    _record_stage_time(trace, 'ocr', start)
+
+    return results
+
+
+def run_mosaic_ocr_stage(ocr_model: OCRBackend, crops: List[np.ndarray], traces: List[Dict[str, Any]],
+                         mosaic_config: Dict[str, Any]) -> List[List[Any]]:
+    """
+    Perform OCR on the table crops of several images with one call per packed canvas.
+
+    Args:
+        ocr_model (OCRBackend): Pre-loaded OCR model.
+        crops (List[np.ndarray]): Grayscale crops, one per image.
+        traces (List[Dict[str, Any]]): One trace per crop; each receives its raw OCR output, the number of
+            crops that shared its OCR call under 'mosaic', and an equal share of the stage time.
+        mosaic_config (Dict[str, Any]): 'mosaic' section of config.yaml.
+
+    Returns:
+        List[List[Any]]: Raw OCR output in the PaddleOCR shape for each crop, in crop coordinates.
+    """
+    start = time.perf_counter()
+
+    results, shared = mosaic_ocr(ocr_model, crops, mosaic_config)
+
+    share = (time.perf_counter() - start) / max(len(crops), 1)
+    for crop_results, sharing, trace in zip(results, shared, traces):
+        trace['ocr_results'] = crop_results
+        trace['mosaic'] = sharing
+        trace.setdefault('timings', {})['ocr'] = share
+
+    return results
+
+
+def run_postprocessing_stage(results: Union[List[Any], OCRDetections], trace: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, List[str]]]:
+    """
+    Turn raw OCR output into category, date rows.
+
+    Args:
+        results (Union[List[Any], OCRDetections]): Raw PaddleOCR output, or the detections of one image.
+        trace (Optional[Dict[str, Any]]): If given, receives the stage time. Results of an incremental OCR stage that stopped early are not processed.
+
+    Returns:
+        Tuple[str, Dict[str, List[str]]]: Feedback message and mapping of category to [issued, expiry] dates.
+    """
+    start = time.perf_counter()
+
+    detections = OCRDetections.from_ocr_results(results)
+
+    if (trace or {}).get('incremental_ocr', {}).get('aborted'):
+        # The OCR stage already found too few categories and did not read the rest
+        feedback_text, cat_date_pairs = CATEGORIES_FEEDBACK, {}
+
+    elif len(detections):
+
+        # Extract dates and categories from OCR output
+        categories, dates = extract_required_text_fields(detections)
+
+        # Determine orientation and sort categories
+        image_orientation, sorted_categories = find_image_orientation(categories)
+
+        # Get category, date pairs of the license
+        feedback_text, cat_date_pairs = identify_rows(dates, image_orientation, sorted_categories)
+
+    else:
+        feedback_text, cat_date_pairs = 'No output from OCR.', {}
+
+    _record_stage_time(trace, 'postprocessing', start)
+
+    return feedback_text, cat_date_pairs
+
+
+def run_refinement_stage(ocr_model: OCRBackend, crops: np.ndarray, results: Union[List[Any], OCRDetections], feedback_text: str,
+                         cat_date_pairs: Dict[str, List[str]], trace: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, List[str]]]:
+    """
+    Re-read only the missing rows of a table when postprocessing reports some rows missing.
+
+    Only used when enabled in config.yaml and the backend can recognize cut regions. The cells
+    where the missing dates should be are cut from the OCR input, upscaled and recognized in one batch.
+
+    Args:
+        ocr_model (OCRBackend): Pre-loaded OCR model.
+        crops (np.ndarray): Image the OCR stage ran on.
+        results (Union[List[Any], OCRDetections]): Raw OCR output of that image.
+        feedback_text (str): Feedback message from run_postprocessing_stage.
+        cat_date_pairs (Dict[str, List[str]]): Rows from run_postprocessing_stage.
+        trace (Optional[Dict[str, Any]]): Trace of the request; receives the refinement counts and the stage time.
+
+    Returns:
+        Tuple[str, Dict[str, List[str]]]: Feedback message and rows, with the recovered rows merged in.
+    """
+    refine_config = load_row_refinement_config()
+
+    if (feedback_text != 'Some rows are missing in the result.' or not refine_config.get('enabled')
+            or not hasattr(ocr_model, 'recognize')):
+        return feedback_text, cat_date_pairs
+
+    start = time.perf_counter()
+
+    feedback_text, cat_date_pairs, details = refine_missing_rows(ocr_model, crops, results, cat_date_pairs, refine_config)
+
+    if trace is not None:
+        trace['row_refinement'] = details
+    _record_stage_time(trace, 'refinement', start)
+
+    return feedback_text, cat_date_pairs
+
+
+def run_batch_detection_stage(yolo_model: YOLO, img_file_paths: List[Union[str, np.ndarray]], traces: List[Dict[str, Any]]) -> List[np.ndarray]:
+    """
+    Detect the information tables of several images with one batched YOLO call and return grayscale crops.
+
+    Args:
+        yolo_model (YOLO): Pre-loaded YOLO object detection model.
+        img_file_paths (List[Union[str, np.ndarray]]): Paths to the image files or decoded BGR images.
+        traces (List[Dict[str, Any]]): One trace per image; each receives its table box, crop and an equal share of the batch time.
+
+    Returns:
+        List[np.ndarray]: Grayscale crop for each image, in input order.
+    """
+    start = time.perf_counter()
+
+    crops = detect_info_tables(yolo_model, img_file_paths, traces)
+    crops = [cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) for crop in crops]
+
+    share = (time.perf_counter() - start) / max(len(crops), 1)
+    for crop, trace in zip(crops, traces):
+        trace['crop'] = crop
+        trace.setdefault('timings', {})['detection'] = share
+
+    return crops
+
+
+def _write_output(sink: Optional[Any], img_file_path: str, cat_date_pairs: Dict[str, List[str]], feedback_text: str) -> None:
+    if sink is not None:
+        sink.write(img_file_path, cat_date_pairs, feedback_text)
+
+    # Save output to CSV if found
+    elif cat_date_pairs:
+        save_csv(cat_date_pairs, img_file_path)
+
+
+def _run_degraded_ocr(ocr_model: OCRBackend, crops: np.ndarray, trace: Dict[str, Any], deadline_at: float,
+                      planner: DeadlinePlanner) -> Tuple[str, Dict[str, List[str]]]:
+    level = planner.choose(deadline_at - time.perf_counter(), crops.shape, bool(trace.get('table_found')))
+    trace['degradation'] = level
+
+    if level in ('no_fallback', 'partial'):
+        return DEADLINE_FEEDBACK, {}
+
+    cls = level == 'full'
+    scale = planner.low_res_scale(crops.shape) if level == 'low_res' else 1.0
+    ocr_input = crops if scale == 1.0 else cv2.resize(crops, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    results = run_ocr_stage(ocr_model, ocr_input, trace, cls=cls)
+    # An early stop says nothing about the cost of reading a whole table
+    if not trace.get('incremental_ocr', {}).get('aborted'):
+        planner.observe(trace['timings']['ocr'], crops.shape, cls, scale)
+
+    feedback_text, cat_date_pairs = run_postprocessing_stage(results, trace)
+
+    if time.perf_counter() < deadline_at:
+        feedback_text, cat_date_pairs = run_refinement_stage(ocr_model, ocr_input, results, feedback_text, cat_date_pairs, trace)
+
+    return feedback_text, cat_date_pairs
+
+
+def _extract_from_crop(ocr_model: OCRBackend, crops: np.ndarray, img_file_path: str, trace: Dict[str, Any], sink: Optional[Any],
+                       deadline_at: Optional[float] = None, planner: Optional[DeadlinePlanner] = None) -> str:
+    # Fast path for well-framed tables, full OCR otherwise
+    template_result = None
+    if deadline_at is None or time.perf_counter() < deadline_at:
+        template_result = run_template_stage(ocr_model, crops, trace)
+
+    if template_result is not None:
+        feedback_text, cat_date_pairs = template_result
+        if deadline_at is not None:
+            trace['degradation'] = 'full'
+    else:
+        # Straighten the table so OCR sees fewer pixels and level text lines
+        crops = run_rectify_stage(ocr_model, crops, trace)
+
+        if deadline_at is None:
+            results = run_ocr_stage(ocr_model, crops, trace)
+            feedback_text, cat_date_pairs = run_postprocessing_stage(results, trace)
+
+            # Re-read only the rows that could not be completed
+            feedback_text, cat_date_pairs = run_refinement_stage(ocr_model, crops, results, feedback_text, cat_date_pairs, trace)
+        else:
+            # Cheaper OCR as the remaining budget shrinks
+            feedback_text, cat_date_pairs = _run_degraded_ocr(ocr_model, crops, trace, deadline_at, planner)
+
+    # Budget overrun by OCR or postprocessing: keep the rows read, but report them as deadline-limited
+    if deadline_at is not None and time.perf_counter() >= deadline_at:
+        trace['deadline_exceeded'] = True
+        feedback_text = DEADLINE_FEEDBACK
+
+    if planner is not None:
+        planner.record(trace['degradation'])
+
+    return _finish_request(sink, img_file_path, trace, feedback_text, cat_date_pairs)
+
+
+def _finish_request(sink: Optional[Any], img_file_path: str, trace: Dict[str, Any], feedback_text: str,
+                    cat_date_pairs: Dict[str, List[str]]) -> str:
+    _write_output(sink, img_file_path, cat_date_pairs, feedback_text)
+    trace['feedback'] = feedback_text
+    return feedback_text
+
+
+def _extract_with_mosaic(ocr_model: OCRBackend, crops: List[np.ndarray], traces: List[Dict[str, Any]], sink: Optional[Any],
+                         mosaic_config: Dict[str, Any]) -> None:
+    # Template fast path and deskew per crop, then one OCR call for the crops left
+    pending = []
+    for crop, trace in zip(crops, traces):
+        try:
+            template_result = run_template_stage(ocr_model, crop, trace)
+            if template_result is not None:
+                _finish_request(sink, trace['key'], trace, *template_result)
+            else:
+                pending.append((run_rectify_stage(ocr_model, crop, trace), trace))
+        except Exception as e:
+            trace['error'] = f"Failed to complete detail extraction pipeline: {e}"
+
+    if not pending:
+        return
+
+    try:
+        results = run_mosaic_ocr_stage(ocr_model, [crop for crop, _ in pending], [trace for _, trace in pending], mosaic_config)
+    except Exception as e:
+        for _, trace in pending:
+            trace['error'] = f"Failed to complete detail extraction pipeline: {e}"
+        return
+
+    for (crop, trace), crop_results in zip(pending, results):
+        try:
+            feedback_text, cat_date_pairs = run_postprocessing_stage(crop_results, trace)
+            feedback_text, cat_date_pairs = run_refinement_stage(ocr_model, crop, crop_results, feedback_text, cat_date_pairs, trace)
+            _finish_request(sink, trace['key'], trace, feedback_text, cat_date_pairs)
+        except Exception as e:
+            trace['error'] = f"Failed to complete detail extraction pipeline: {e}"
+
+
+def _extract_from_crops(ocr_model: OCRBackend, crops: List[np.ndarray], traces: List[Dict[str, Any]], sink: Optional[Any]) -> None:
+    # Batch counterpart of _extract_from_crop: errors are reported per image in its trace
+    mosaic_config = load_mosaic_config()
+
+    if mosaic_config.get('enabled') and len(crops) > 1:
+        _extract_with_mosaic(ocr_model, crops, traces, sink, mosaic_config)
+    else:
+        for crop, trace in zip(crops, traces):
+            try:
+                _extract_from_crop(ocr_model, crop, trace['key'], trace, sink)
+            except Exception as e:
+                trace['error'] = f"Failed to complete detail extraction pipeline: {e}"
+
+    # Crops are large and no longer needed once the images are done
+    for trace in traces:
+        trace.pop('crop', None)
+
+
+def _extract_details(yolo_model: YOLO, ocr_model: OCRBackend, img_file_path: str, trace: Dict[str, Any], sink: Optional[Any],
+                     deadline_at: Optional[float] = None) -> str:
+    crops = run_detection_stage(yolo_model, img_file_path, trace)
+    planner = get_deadline_planner() if deadline_at is not None else None
+    return _extract_from_crop(ocr_model, crops, img_file_path, trace, sink, deadline_at, planner)
+
+
+def detail_extraction_pipeline(yolo_model: YOLO, ocr_model: OCRBackend, img_file_path: str, recorder: Optional[Any] = None,
+                               sink: Optional[Any] = None, deadline: Optional[float] = None) -> str:
     """
     Extract details from a license image using a YOLO model and OCR model.
 
@@ -46,10 +475,19 @@ def detail_extraction_pipeline(yolo_model: YOLO, ocr_model: PaddleOCR, img_file_
     extracts necessary text fields (categories and dates), identifies the correct image
     orientation, pairs categories with dates, and saves the results to a CSV file.
 
+    With a deadline, the OCR step is degraded to fit the time left after detection: no angle
+    classifier, then a lower OCR resolution, then no whole-image OCR when the table was not found.
+    If the budget is spent before OCR, 'Partial due to deadline.' is returned without rows; if OCR or
+    postprocessing overruns it, 'Partial due to deadline.' is returned with the rows read (trace 'deadline_exceeded').
+    Requests per degradation level are reported by utils.get_deadline_planner().stats().
+
     Args:
         yolo_model (YOLO): Pre-loaded YOLO object detection model.
-        ocr_model (PaddleOCR): Pre-loaded OCR model.
+        ocr_model (OCRBackend): Pre-loaded OCR model.
         img_file_path (str): Path to the image file.
+        recorder (Optional[SlowRequestRecorder]): If given, the request is profiled and its artefacts are captured when it is slow.
+        sink (Optional[Any]): Output sink (see utils.output_sinks) receiving the rows and feedback. CSV in the configured output directory if None.
+        deadline (Optional[float]): Time budget of the request in seconds. No degradation if None.
 
     Returns:
         str : Feedback message
@@ -63,35 +501,126 @@ def detail_extraction_pipeline(yolo_model: YOLO, ocr_model: PaddleOCR, img_file_
     if not os.path.exists(img_file_path):
         raise FileNotFoundError(f"Image file is not in the specified path: {img_file_path}")
 
+    trace: Dict[str, Any] = {'timings': {}}
+    deadline_at = time.perf_counter() + deadline if deadline is not None else None
+
     try:
-        # Detect information table and crop
-        crops = detect_info_table(yolo_model, img_file_path)
+        if recorder is None:
+            return _extract_details(yolo_model, ocr_model, img_file_path, trace, sink, deadline_at)
 
-         # Convert to grayscale for better OCR
-        crops = cv2.cvtColor(crops, cv2.COLOR_BGR2GRAY)
+        with recorder.watch(img_file_path, trace):
+            return _extract_details(yolo_model, ocr_model, img_file_path, trace, sink, deadline_at)
 
-        # Step 2: Perform OCR on cropped image
-        results = ocr_model.ocr(crops, cls=True)
+    except Exception as e:
+        raise RuntimeError(f"Failed to complete detail extraction pipeline: {e}")
 
-        if bool(results[0]):
 
-            # Extract dates and categories from OCR output
-            categories, dates = extract_required_text_fields(results)
+def batch_extraction_pipeline(yolo_model: YOLO, ocr_model: OCRBackend, img_file_paths: List[Union[str, np.ndarray, None]],
+                              sink: Optional[Any] = None, keys: Optional[List[str]] = None,
+                              store: Optional[ArtefactStore] = None) -> List[Dict[str, Any]]:
+    """
+    Extract details from several license images, detecting all information tables with one YOLO call.
 
-            # Determine orientation and category positions
-            image_orientation, category_centers = find_image_orientation(categories)
+    Unlike detail_extraction_pipeline, a failing image does not stop the batch: its error is
+    reported in its trace and the other images are still processed. Images may be given as
+    paths or as already decoded arrays (e.g. streamed from an archive, see inputs.iter_inputs).
+    With 'mosaic' enabled in config.yaml, the table crops of the batch are packed into shared
+    canvases so the OCR detector runs once per canvas instead of once per image.
 
-            # Get category, date pairs of the license
-            feedback_text, cat_date_pairs = identify_rows(dates, image_orientation, category_centers)
+    Args:
+        yolo_model (YOLO): Pre-loaded YOLO object detection model.
+        ocr_model (OCRBackend): Pre-loaded OCR model.
+        img_file_paths (List[Union[str, np.ndarray, None]]): Paths to the image files or decoded BGR images; None marks an image that could not be decoded.
+        sink (Optional[Any]): Output sink receiving the rows and feedback. CSV in the configured output directory if None.
+        keys (Optional[List[str]]): Result key of each image, used for outputs and traces. Defaults to the paths; required for decoded images.
+        store (Optional[ArtefactStore]): If given, receives the detection and raw OCR outputs of the batch, so
+            later stages can be re-run with resume_batch_pipeline.
 
-            # Save output to CSV if found
-            if cat_date_pairs:
-                save_csv(cat_date_pairs, img_file_path)
+    Returns:
+        List[Dict[str, Any]]: One trace per image, in input order, holding 'key', 'timings' and either 'feedback' or 'error'.
 
-            return feedback_text
+    Raises:
+        ValueError: If a decoded image is given without a key.
+    """
+    if keys is None:
+        if not all(isinstance(image, str) for image in img_file_paths):
+            raise ValueError("Keys are required when images are passed as arrays.")
+        keys = list(img_file_paths)
 
+    traces: List[Dict[str, Any]] = [{'key': key, 'timings': {}} for key in keys]
+
+    existing = []
+    for image, trace in zip(img_file_paths, traces):
+        if image is None:
+            trace['error'] = f"Image could not be decoded: {trace['key']}"
+        elif isinstance(image, str) and not os.path.exists(image):
+            trace['error'] = f"Image file is not in the specified path: {image}"
         else:
-            return 'No output from OCR.'
+            existing.append((image, trace))
 
+    try:
+        crops = run_batch_detection_stage(yolo_model, [image for image, _ in existing], [trace for _, trace in existing])
     except Exception as e:
-        raise RuntimeError(f"Failed to complete detail extraction pipeline: {e}")
+        for _, trace in existing:
+            trace['error'] = str(e)
+        return traces
+
+    if store is not None:
+        store.write_detection([trace for _, trace in existing])
+
+    _extract_from_crops(ocr_model, crops, [trace for _, trace in existing], sink)
+
+    if store is not None:
+        store.write_ocr(traces)
+
+    return traces
+
+
+def resume_batch_pipeline(ocr_model: Optional[OCRBackend], records: List[Tuple[str, Dict[str, Any]]], from_stage: str,
+                          sink: Optional[Any] = None, store: Optional[ArtefactStore] = None) -> List[Dict[str, Any]]:
+    """
+    Re-run the pipeline of several images from stored stage outputs instead of from the images.
+
+    From 'ocr', the stored table crops go through the template, deskew, OCR and postprocessing
+    stages again, without YOLO. From 'postprocessing', only postprocessing runs on the stored raw
+    OCR output, without any model: this is how changes to the text threshold, the category lists
+    or the row logic are checked over a whole corpus in seconds. The missing-row refinement needs
+    the crop and the OCR model, so it is skipped from 'postprocessing'. As in batch_extraction_pipeline,
+    a failing image does not stop the batch.
+
+    Args:
+        ocr_model (Optional[OCRBackend]): Pre-loaded OCR model. Not used, and may be None, from 'postprocessing'.
+        records (List[Tuple[str, Dict[str, Any]]]): Image key and artefacts, as read by ArtefactStore.read:
+            'detection' artefacts to resume from 'ocr', 'ocr' artefacts to resume from 'postprocessing'.
+        from_stage (str): 'ocr' or 'postprocessing'.
+        sink (Optional[Any]): Output sink receiving the rows and feedback. CSV in the configured output directory if None.
+        store (Optional[ArtefactStore]): If given and resuming from 'ocr', receives the new raw OCR outputs.
+
+    Returns:
+        List[Dict[str, Any]]: One trace per image, in input order, holding 'key', 'timings' and either 'feedback' or 'error'.
+
+    Raises:
+        ValueError: If the stage cannot be resumed from.
+    """
+    if from_stage not in RESUMABLE_STAGES:
+        raise ValueError(f"Cannot resume from stage '{from_stage}', expected one of {', '.join(RESUMABLE_STAGES)}.")
+
+    traces: List[Dict[str, Any]] = [{'key': key, 'timings': {}} for key, _ in records]
+
+    if from_stage == 'ocr':
+        for (_, artefacts), trace in zip(records, traces):
+            trace.update({name: artefacts[name] for name in ('yolo_box', 'yolo_conf', 'table_found')})
+
+        _extract_from_crops(ocr_model, [artefacts['crop'] for _, artefacts in records], traces, sink)
+
+        if store is not None:
+            store.write_ocr(traces)
+    else:
+        for (key, artefacts), trace in zip(records, traces):
+            try:
+                feedback_text, cat_date_pairs = run_postprocessing_stage(artefacts['ocr_results'], trace)
+                _finish_request(sink, key, trace, feedback_text, cat_date_pairs)
+            except Exception as e:
+                trace['error'] = f"Failed to complete detail extraction pipeline: {e}"
+
+    return traces
@@ -1,6 +1,7 @@
 import re
-from typing import List, Tuple, Any
-from utils import load_vehicle_cat_config, load_ocr_text_thresh_config
+import numpy as np
+from typing import List, Tuple, Any, Union
+from utils import load_vehicle_cat_config, load_ocr_text_thresh_config, OCRDetections
 
 
 def validate_vehicle_categories(filtered_list: List[Tuple[Any, str, str]]) -> List[Tuple[Any, str]]:
@@ -74,25 +75,25 @@ def validate_dates(filtered_dates: List[Tuple[Any, str]]) -> List[Tuple[Any, str
     return final_dates_list
 
 
-def extract_required_text_fields(ocr_results: List[Any]) -> Tuple[List[Tuple[Any, str]], List[Tuple[Any, str]]]:
+def extract_required_text_fields(ocr_results: Union[List[Any], OCRDetections]) -> Tuple[OCRDetections, OCRDetections]:
     """
     Extract vehicle categories and valid dates from OCR results based on confidence and pattern rules.
 
     Args:
-        ocr_results (List[Any]): Raw OCR output from PaddleOCR.
+        ocr_results (Union[List[Any], OCRDetections]): Raw OCR output from PaddleOCR, or the detections of one image.
 
     Returns:
         Tuple:
-            - List[Tuple[bbox, category]]: Validated vehicle category texts.
-            - List[Tuple[bbox, date]]: Validated date texts.
+            - OCRDetections: Validated vehicle category detections, texts replaced by the category labels.
+            - OCRDetections: Validated date detections, texts formatted as dates where possible.
 
     Raises:
         RuntimeError: If config files cannot be loaded.
         ValueError: If ocr results are not in format.
     """
 
-    filtered_categories: List[Tuple[Any, str, str]] = []
-    filtered_dates: List[Tuple[Any, str]] = []
+    filtered_categories: List[Tuple[int, str, str]] = []
+    filtered_dates: List[Tuple[int, str]] = []
 
     try:
         # Load from config.yaml
@@ -101,36 +102,31 @@ def extract_required_text_fields(ocr_results: List[Any]) -> Tuple[List[Tuple[Any
 
     except Exception as e:
         raise RuntimeError(f"Failed to load configuration files: {e}")
-    
 
-    # Seperate dates and category values
-    for detection in ocr_results[0]:
-        try:
-            bbox, (text, confidence) = detection
-        except Exception:
-            raise ValueError(f"Malformed outputs from model: {e}")
+    try:
+        detections = OCRDetections.from_ocr_results(ocr_results)
+    except Exception as e:
+        raise ValueError(f"Malformed outputs from model: {e}")
 
-        if confidence > confidence_threshold:
-            text_clean = text.strip()
+    # Seperate dates and category values; detections are referred to by index, not copied
+    texts = detections.texts.tolist()
+    for index in np.flatnonzero(detections.confidences > confidence_threshold).tolist():
+        text_clean = texts[index].strip()
 
-            # Primary category detection
-            if len(text_clean) <= 5:
-                for cat in vehicle_categories:
-                    if cat in text_clean and cat != 'CE':
-                        filtered_categories.append((bbox, text_clean, cat))
-                        break
+        # Primary category detection
+        if len(text_clean) <= 5:
+            for cat in vehicle_categories:
+                if cat in text_clean and cat != 'CE':
+                    filtered_categories.append((index, text_clean, cat))
+                    break
 
-            # Primary date detection
-            elif not re.search(r'(.*[a-zA-Z].*){3,}', text_clean):
-                filtered_dates.append((bbox, text_clean))
+        # Primary date detection
+        elif not re.search(r'(.*[a-zA-Z].*){3,}', text_clean):
+            filtered_dates.append((index, text_clean))
 
     # Validate and filter with additional criteria
     categories = validate_vehicle_categories(filtered_categories)
     dates = validate_dates(filtered_dates)
 
-    return categories, dates
-
-
-
-
-
+    return (detections.take([index for index, _ in categories], [text for _, text in categories]),
+            detections.take([index for index, _ in dates], [text for _, text in dates]))
@@ -1,19 +1,20 @@
-from typing import List, Tuple
+from typing import Tuple
+from utils import OCRDetections
 from .utils import (get_center_points, sort_by_category, get_category_centers_list, get_adjecent_difference_sum)
 
 
-def find_image_orientation(category_list: List[str]) -> Tuple[str, List[Tuple[str, Tuple[float, float]]]]:
+def find_image_orientation(categories: OCRDetections) -> Tuple[str, OCRDetections]:
     """
     Determines the orientation (portrait or landscape) of an image
     based on the alignment of category text center points.
 
     Args:
-        category_list (List[str]): List of category names or detected text labels.
+        categories (OCRDetections): Category detections, texts holding the category labels.
 
     Returns:
-        Tuple[str, List[Tuple[str, Tuple[float, float]]]]:
+        Tuple[str, OCRDetections]:
             - Orientation as 'portrait' or 'landscape'.
-            - Sorted list of tuples containing category names and their center coordinates.
+            - Category detections sorted by category order.
     
     Raises:
         ValueError: If category list is empty or invalid.
@@ -22,14 +23,14 @@ def find_image_orientation(category_list: List[str]) -> Tuple[str, List[Tuple[st
     # if not category_list:
     #     raise ValueError("Category list is empty or invalid.")
 
-    # Get center points for each category text
-    centers_list = get_center_points(category_list)
+    # Sort categories by label
+    sorted_categories = categories.take(sort_by_category(categories.texts))
 
-    # Sort centers by category label
-    sorted_centers = sort_by_category(centers_list)
+    # Get center points for each category text
+    centers = get_center_points(sorted_categories)
 
-    # Extract separate lists for x and y center coordinates
-    x_centers, y_centers = get_category_centers_list(sorted_centers)
+    # Extract separate x and y center coordinates
+    x_centers, y_centers = get_category_centers_list(centers)
 
     # Calculate adjacent difference sums for both x and y directions
     sum_x = get_adjecent_difference_sum(x_centers)
@@ -38,11 +39,4 @@ def find_image_orientation(category_list: List[str]) -> Tuple[str, List[Tuple[st
     # Determine orientation: if variation along x-axis is higher, it's portrait (vertical list)
     orientation = 'portrait' if sum_x > sum_y else 'landscape'
 
-    return orientation, sorted_centers
-
-
-
-
-
-
-
+    return orientation, sorted_categories
@@ -1,209 +1,184 @@
-from utils import get_y_center, get_x_center, load_vehicle_cat_config
+from utils import load_vehicle_cat_config, OCRDetections
 import numpy as np
-from scipy.interpolate import interp1d
-from collections import defaultdict
-from typing import List, Tuple, Union, Dict
+from typing import List, Tuple, Dict, Sequence
 
 
-def get_center_points(items: List[Tuple[List[Union[int, float]], str]]) -> List[Tuple[str, List[float]]]:
+def get_center_points(detections: OCRDetections) -> np.ndarray:
     """
-    Calculates the center (x, y) point for each text region in the list.
+    Calculates the center (x, y) point for each text region.
 
     Args:
-        items (List[Tuple[bbox, str]]): List of tuples containing bounding boxes and text labels.
+        detections (OCRDetections): Detections of one image.
 
     Returns:
-        List[Tuple[str, List[float]]]: List of text labels with their corresponding center coordinates.
+        np.ndarray: Center coordinates of each detection, shape (N, 2).
     """
-    centers_list = []
+    return detections.centers()
 
-    for bbox, text in items:
-        x_center = get_x_center(bbox)
-        y_center = get_y_center(bbox)
-        centers_list.append((text, [x_center, y_center]))
 
-    return centers_list
-
-
-def sort_by_category(items: List[Tuple[str, List[float]]]) -> List[Tuple[str, List[float]]]:
+def sort_by_category(labels: Sequence[str]) -> np.ndarray:
     """
-    Sorts category items based on a predefined vehicle category order.
+    Orders category items based on a predefined vehicle category order.
 
     Args:
-        items (List[Tuple[str, List[float]]]): List of category labels with coordinates.
+        labels (Sequence[str]): Category labels.
 
     Returns:
-        List[Tuple[str, List[float]]]: Sorted list based on vehicle category priority.
+        np.ndarray: Indices of the labels in vehicle category priority (unknown labels last, input order kept on ties).
     """
     category_order = load_vehicle_cat_config(is_to_sort=True)
     category_priority = {cat: i for i, cat in enumerate(category_order)}
-    
-    sorted_items = sorted(items, key=lambda x: category_priority.get(x[0], float('inf')))
-    return sorted_items
+
+    priorities = np.array([category_priority.get(str(label), len(category_order)) for label in labels], dtype=np.int64)
+    return np.argsort(priorities, kind='stable')
 
 
-def get_category_centers_list(items: List[Tuple[str, List[float]]]) -> Tuple[List[float], List[float]]:
+def get_category_centers_list(centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Extracts separate lists of x and y center coordinates from category data.
+    Extracts separate x and y center coordinates from category centers.
 
     Args:
-        items (List[Tuple[str, List[float]]]): List of category labels and center coordinates.
+        centers (np.ndarray): Category center coordinates, shape (N, 2).
 
     Returns:
-        Tuple[List[float], List[float]]: Lists of x and y center coordinates respectively.
+        Tuple[np.ndarray, np.ndarray]: x and y center coordinates respectively (views).
     """
-    x_centers = [coords[0] for _, coords in items]
-    y_centers = [coords[1] for _, coords in items]
-    return x_centers, y_centers
+    return centers[:, 0], centers[:, 1]
 
 
-def get_adjecent_difference_sum(values: List[float]) -> float:
+def get_adjecent_difference_sum(values: np.ndarray) -> float:
     """
     Calculates the sum of absolute differences between adjacent elements.
 
     Args:
-        values (List[float]): A list of numeric values.
+        values (np.ndarray): Numeric values.
 
     Returns:
         float: Sum of absolute differences between adjacent elements.
     """
-    total = 0.0
-    for i in range(len(values) - 1):
-        total += abs(values[i + 1] - values[i])
-    return total
-
-
-def deduplicate_categories(category_list, index):
-
-    # Step 1: Group all values by label
-    label_to_coords = defaultdict(list)
-    for label, coords in category_list:
-        label_to_coords[label].append(coords)
-
-    # Step 2: Compute mean using only labels that appear once
-    unique_values = [
-        coords[index] for label, coords_list in label_to_coords.items()
-        if len(coords_list) == 1
-        for coords in coords_list
-    ]
-    mean_ = np.mean(unique_values)
-
-    # Step 3: For duplicates, keep the one with closest to mean_
-    final_coords = {}
-    for label, coords_list in label_to_coords.items():
-        if len(coords_list) == 1:
-            final_coords[label] = coords_list[0]
-        else:
-            # Choose the one with smallest distance to mean_
-            closest_coords = min(coords_list, key=lambda c: abs(c[index] - mean_))
-            final_coords[label] = closest_coords
-
-    # Step 4: Return as list
-    return list(final_coords.items())
-
-
-def complete_categories(category_list: List[Tuple[str, List[float]]]) -> List[Tuple[str, List[float]]]:
+    return float(np.abs(np.diff(values)).sum())
+
+
+def deduplicate_categories(labels: Sequence[str], centers: np.ndarray, index: int) -> np.ndarray:
+    """
+    Keeps one detection per category label: for labels found more than once, the one closest
+    along 'index' to the mean position of the labels found once.
+
+    Args:
+        labels (Sequence[str]): Category labels.
+        centers (np.ndarray): Category center coordinates, shape (N, 2).
+        index (int): Axis of the positions compared.
+
+    Returns:
+        np.ndarray: Indices of the kept detections, in order of first appearance of their label.
+    """
+    rows_by_label: Dict[str, List[int]] = {}
+    for row, label in enumerate(labels):
+        rows_by_label.setdefault(str(label), []).append(row)
+
+    unique_rows = [rows[0] for rows in rows_by_label.values() if len(rows) == 1]
+    mean_ = np.mean(centers[unique_rows, index])
+
+    return np.array([rows[0] if len(rows) == 1 else rows[int(np.argmin(np.abs(centers[rows, index] - mean_)))]
+                     for rows in rows_by_label.values()], dtype=np.intp)
+
+
+def complete_categories(labels: Sequence[str], centers: np.ndarray) -> Tuple[List[str], np.ndarray]:
     """
     Fills in missing vehicle category coordinates by performing linear interpolation and extrapolation.
 
     Args:
-        category_list (List[Tuple[str, List[float]]]): A list of tuples where each tuple contains a category label and its (x, y) center coordinates.
+        labels (Sequence[str]): Detected category labels.
+        centers (np.ndarray): Their (x, y) center coordinates, shape (N, 2).
 
     Returns:
-        List[Tuple[str, List[float]]]:A list of all expected vehicle categories with interpolated or extrapolated center coordinates.
+        Tuple[List[str], np.ndarray]: All expected vehicle categories in order, and their interpolated or
+        extrapolated center coordinates, shape (K, 2).
 
     Raises:
-        RuntimeError: If any error occurs during the interpolation or extrapolation process, such as issues with input data or interpolation failure.
+        RuntimeError: If any error occurs during the interpolation or extrapolation process, such as an unknown label or fewer than two distinct categories.
     """
     try:
         # Get predefined order of all category labels
         cat_order: List[str] = load_vehicle_cat_config(is_to_sort=True)
+        label_indices: Dict[str, int] = {label: i for i, label in enumerate(cat_order)}
 
-        # Map input labels to their coordinates
-        label_to_coords: dict[str, List[float]] = {label: coords for label, coords in category_list}
-        label_indices: dict[str, int] = {label: i for i, label in enumerate(cat_order)}
-
-        # Extract known indices and coordinates
-        known_indices: List[int] = [label_indices[label] for label in label_to_coords]
-        known_coords: np.ndarray = np.array([label_to_coords[label] for label in label_to_coords])
-        known_x: np.ndarray = known_coords[:, 0]
-        known_y: np.ndarray = known_coords[:, 1]
+        # Map input labels to their coordinates (last one wins for repeated labels)
+        label_to_row: Dict[str, int] = {str(label): row for row, label in enumerate(labels)}
+        if len(label_to_row) < 2:
+            raise ValueError("at least two distinct categories are needed")
 
-        # Create interpolation functions for x and y with extrapolation
-        interp_x_func = interp1d(known_indices, known_x, kind='linear', fill_value='extrapolate')
-        interp_y_func = interp1d(known_indices, known_y, kind='linear', fill_value='extrapolate')
+        # Known indices and coordinates, sorted by category index
+        known_indices = np.array([label_indices[label] for label in label_to_row], dtype=np.float64)
+        known_coords = centers[list(label_to_row.values())]
+        order = np.argsort(known_indices)
+        known_indices, known_coords = known_indices[order], known_coords[order]
 
-        # Generate coordinates for all labels using interpolation/extrapolation
-        full_list: List[Tuple[str, List[float]]] = []
-        for i, label in enumerate(cat_order):
-            x = float(interp_x_func(i))
-            y = float(interp_y_func(i))
-            full_list.append((label, [round(x, 2), round(y, 2)]))
+        # Piecewise linear through the known categories, extended with the outer segments
+        targets = np.arange(len(cat_order), dtype=np.float64)
+        segment = np.clip(np.searchsorted(known_indices, targets, side='right') - 1, 0, len(known_indices) - 2)
+        lo, hi = known_indices[segment], known_indices[segment + 1]
+        fraction = ((targets - lo) / (hi - lo))[:, None]
+        full = known_coords[segment] + (known_coords[segment + 1] - known_coords[segment]) * fraction
 
-        return full_list
+        return cat_order, np.round(full, 2)
 
     except Exception as e:
         raise RuntimeError(f"Error in complete_categories: {e}")
 
 
-def get_bias(category_list: List[Tuple[str, List[float]]], orientation: str) -> int:
+def get_bias(category_centers: np.ndarray, orientation: str) -> int:
     """
     Determines the directional bias of the category layout.
 
     Args:
-        category_list (List[Tuple[str, List[float]]]): List of vehicle categories with center coordinates.
+        category_centers (np.ndarray): Center coordinates of the vehicle categories in category order, shape (K, 2).
         orientation (str): Either 'portrait' or 'landscape'.
 
     Returns:
         int: 1 if increasing order along axis, else 0.
     """
     idx = 1 if orientation == 'landscape' else 0
-    return 1 if category_list[-1][1][idx] - category_list[0][1][idx] > 0 else 0
+    return 1 if category_centers[-1, idx] - category_centers[0, idx] > 0 else 0
 
 
-def get_dates_center(dates_centers_list: List[Tuple[str, List[float]]], orientation: str) -> float:
+def get_dates_center(date_centers: np.ndarray, orientation: str) -> float:
     """
     Calculates the mean center position of the date items.
 
     Args:
-        dates_centers_list (List[Tuple[str, List[float]]]): 
-            List of date text items with their center coordinates.
-        orientation (str): 
+        date_centers (np.ndarray):
+            Center coordinates of the dates, shape (N, 2).
+        orientation (str):
             Either 'portrait' or 'landscape'.
 
     Returns:
         float: Average coordinate along the relevant axis.
     """
     idx = 0 if orientation == 'landscape' else 1
-    total = sum(bbox[idx] for _, bbox in dates_centers_list)
-    return total / len(dates_centers_list) if dates_centers_list else 0.0
+    return float(date_centers[:, idx].mean()) if len(date_centers) else 0.0
 
 
-def categorize_dates(dates_centers_list: List[Tuple[str, List[float]]], dates_center: float, orientation: str, bias: int) -> Tuple[List[Tuple[str, List[float]]], List[Tuple[str, List[float]]]]:
+def categorize_dates(date_centers: np.ndarray, dates_center: float, orientation: str, bias: int) -> Tuple[np.ndarray, np.ndarray]:
     """
     Divides dates into two categories based on their position and orientation.
 
     Args:
-        dates_centers_list (List[Tuple[str, List[float]]]): 
-            List of date items and their center positions.
-        dates_center (float): 
+        date_centers (np.ndarray):
+            Center coordinates of the dates, shape (N, 2).
+        dates_center (float):
             Central position separating the two date groups.
-        orientation (str): 
+        orientation (str):
             'portrait' or 'landscape'.
-        bias (int): 
+        bias (int):
             Directional preference.
 
     Returns:
-        Tuple[List, List]: Two categorized date lists.
+        Tuple[np.ndarray, np.ndarray]: Indices of the issued and expiry dates.
     """
     idx = 0 if orientation == 'landscape' else 1
-    category1, category2 = [], []
-
-    for item in dates_centers_list:
-        if item[1][idx] >= dates_center:
-            category2.append(item)
-        else:
-            category1.append(item)
+    after = date_centers[:, idx] >= dates_center
+    category1, category2 = np.flatnonzero(~after), np.flatnonzero(after)
 
     if (bias == 1 and orientation == 'landscape') or (bias == 0 and orientation == 'portrait'):
         return category1, category2
@@ -211,70 +186,71 @@ def categorize_dates(dates_centers_list: List[Tuple[str, List[float]]], dates_ce
         return category2, category1
 
 
-def get_date_pairs(date_centers_list: List[Tuple[str, List[float]]], issued_dates: List[Tuple[str, List[float]]], expiry_dates: List[Tuple[str, List[float]]], orientation: str) -> Tuple[List[Tuple[Tuple[str, List[float]], Tuple[str, List[float]]]], List[Tuple[str, List[float]]]]:
+def get_date_pairs(date_centers: np.ndarray, issued_dates: np.ndarray, expiry_dates: np.ndarray, orientation: str) -> Tuple[np.ndarray, np.ndarray]:
     """
     Matches issued and expiry dates based on positional proximity.
 
     Args:
-        date_centers_list (List[Tuple[str, List[float]]]): 
-            All date items with centers.
-        issued_dates (List[Tuple[str, List[float]]]): 
-            Issued dates with centers.
-        expiry_dates (List[Tuple[str, List[float]]]): 
-            Expiry dates with centers.
-        orientation (str): 
+        date_centers (np.ndarray):
+            Center coordinates of all dates, shape (N, 2).
+        issued_dates (np.ndarray):
+            Indices of the issued dates.
+        expiry_dates (np.ndarray):
+            Indices of the expiry dates.
+        orientation (str):
             'portrait' or 'landscape'.
 
     Returns:
-        Tuple[List of matched pairs, List of unmatched items]
+        Tuple[np.ndarray, np.ndarray]: (issued, expiry) index pairs of shape (P, 2), and indices of the unmatched dates.
     """
     idx = 1 if orientation == 'landscape' else 0
-    pairs_dict: Dict[Tuple[str, Tuple[float, float]], Tuple[str, List[float]]] = {}
-    pairs_list = []
-    submitted_dates = []
+
+    if not len(issued_dates) or not len(expiry_dates):
+        return np.empty((0, 2), dtype=np.intp), np.arange(len(date_centers))
 
     # Ensure dates in pairs have closest neighbor in the pair
-    for issued_date in issued_dates:
-        pos_i = issued_date[1][idx]
-        closest = min(expiry_dates, key=lambda e: abs(e[1][idx] - pos_i))
-        pairs_dict[(issued_date[0], tuple(issued_date[1]))] = closest
-
-    for exp_date in expiry_dates:
-        pos_e = exp_date[1][idx]
-        closest_i = min(issued_dates, key=lambda i: abs(i[1][idx] - pos_e))
-        if pairs_dict.get((closest_i[0], tuple(closest_i[1]))) == exp_date:
-            pairs_list.append((closest_i, exp_date))
-            submitted_dates.extend([closest_i, exp_date])
+    distances = np.abs(date_centers[issued_dates, idx][:, None] - date_centers[expiry_dates, idx][None, :])
+    closest_expiry = np.argmin(distances, axis=1)
+    closest_issued = np.argmin(distances, axis=0)
+
+    mutual = np.flatnonzero(closest_expiry[closest_issued] == np.arange(len(expiry_dates)))
+    pairs = np.stack([issued_dates[closest_issued[mutual]], expiry_dates[mutual]], axis=1)
 
     # Get dates not in pairs
-    individual_dates = [item for item in date_centers_list if item not in submitted_dates]
-    return pairs_list, individual_dates
+    paired = np.zeros(len(date_centers), dtype=bool)
+    paired[pairs.ravel()] = True
+    return pairs, np.flatnonzero(~paired)
+
 
-    
-def get_approx_category_position(pair: Tuple[Tuple[str, List[float]], Tuple[str, List[float]]], orientation: str) -> Tuple[float, int]:
+def get_approx_category_position(date_centers: np.ndarray, pairs: np.ndarray, orientation: str) -> Tuple[np.ndarray, int]:
     """
-    Estimates category label position from date pair.
+    Estimates category label positions from date pairs.
 
     Args:
-        pair (Tuple): Issued and expiry date pair.
+        date_centers (np.ndarray): Center coordinates of all dates, shape (N, 2).
+        pairs (np.ndarray): Issued and expiry date index pairs, shape (P, 2).
         orientation (str): 'portrait' or 'landscape'.
 
     Returns:
-        Tuple[float, int]: Estimated position and axis index.
+        Tuple[np.ndarray, int]: Estimated position of each pair and axis index.
     """
     idx = 1 if orientation == 'landscape' else 0
-    difference = pair[1][1][idx] - pair[0][1][idx]
-    approx_pos = pair[0][1][idx] - difference
+    issued, expiry = date_centers[pairs[:, 0], idx], date_centers[pairs[:, 1], idx]
+    approx_pos = issued - (expiry - issued)
     return approx_pos, idx
 
 
-def get_rows(category_list: List[Tuple[str, List[float]]], pairs_list: List[Tuple[Tuple[str, List[float]], Tuple[str, List[float]]]], orientation: str) -> Dict[str, List[str]]:
+def get_rows(category_labels: Sequence[str], category_centers: np.ndarray, date_texts: np.ndarray, date_centers: np.ndarray,
+             pairs: np.ndarray, orientation: str) -> Dict[str, List[str]]:
     """
     Assigns each date pair to the closest category.
 
     Args:
-        category_list (List[Tuple[str, List[float]]]): List of category names with coordinates.
-        pairs_list (List[Tuple]): List of issued and expiry date pairs.
+        category_labels (Sequence[str]): Category names.
+        category_centers (np.ndarray): Category center coordinates, shape (K, 2).
+        date_texts (np.ndarray): Texts of all dates.
+        date_centers (np.ndarray): Center coordinates of all dates, shape (N, 2).
+        pairs (np.ndarray): Issued and expiry date index pairs, shape (P, 2).
         orientation (str): 'portrait' or 'landscape'.
 
     Returns:
@@ -282,10 +258,11 @@ def get_rows(category_list: List[Tuple[str, List[float]]], pairs_list: List[Tupl
     """
     rows_dict: Dict[str, List[str]] = {}
 
-    for pair in pairs_list:
-        approx_position, idx = get_approx_category_position(pair, orientation)
-        closest = min(category_list, key=lambda c: abs(c[1][idx] - approx_position))
-        rows_dict[closest[0]] = [pair[0][0], pair[1][0]]
+    approx_positions, idx = get_approx_category_position(date_centers, pairs, orientation)
+    closest = np.argmin(np.abs(category_centers[:, idx][None, :] - approx_positions[:, None]), axis=1)
+
+    for (issued, expiry), category in zip(pairs, closest):
+        rows_dict[category_labels[category]] = [str(date_texts[issued]), str(date_texts[expiry])]
 
     return rows_dict
 
@@ -302,5 +279,3 @@ def order_rows(rows: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """
     custom_order = load_vehicle_cat_config(True)
     return {key: rows[key] for key in custom_order if key in rows}
-
-    
@@ -0,0 +1,2 @@
+from .model_registry import ModelRegistry, get_model_registry
+from .scheduler import RequestScheduler, OVERLOADED_FEEDBACK
\ No newline at end of file
@@ -0,0 +1,179 @@
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+from pipeline import load_models
+from utils import load_runtime_config
+
+
+class ModelRegistry:
+    """
+    Bounded pool of (YOLO, OCR) model pairs shared by the threads of one process.
+
+    Neither ultralytics YOLO predictors nor PaddleOCR instances are safe to call from
+    several threads at once, so each pair is handed to exactly one thread at a time.
+    Pairs are created lazily up to 'pool_size' and each one is loaded with
+    'intra_op_threads' CPU threads, keeping pool_size * intra_op_threads within the
+    machine's cores.
+    """
+
+    def __init__(self, pool_size: Optional[int] = None, intra_op_threads: Optional[int] = None,
+                 loader: Callable[[Optional[int]], Tuple[Any, Any]] = load_models) -> None:
+        """
+        Args:
+            pool_size (Optional[int]): Maximum number of model pairs. Read from config.yaml if None.
+            intra_op_threads (Optional[int]): CPU threads per model pair. Defaults to cpu_count // pool_size.
+            loader (Callable): Function creating one model pair given the thread count.
+
+        Raises:
+            ValueError: If pool size or thread count is not positive.
+        """
+        runtime = load_runtime_config()
+        cpu_count = os.cpu_count() or 1
+
+        self.pool_size = pool_size or runtime.get('model_pool_size') or 1
+        self.intra_op_threads = intra_op_threads or runtime.get('intra_op_threads') or max(1, cpu_count // self.pool_size)
+
+        if self.pool_size < 1 or self.intra_op_threads < 1:
+            raise ValueError(f"Pool size and intra-op threads must be positive, got {self.pool_size} and {self.intra_op_threads}.")
+
+        self._loader = loader
+        self._idle: "queue.LifoQueue[Tuple[Any, Any]]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._local = threading.local()
+
+    @property
+    def created(self) -> int:
+        """Number of model pairs loaded so far."""
+        return self._created
+
+    @property
+    def in_use(self) -> int:
+        """Number of model pairs currently checked out."""
+        return self._in_use
+
+    def _acquire(self, timeout: Optional[float]) -> Tuple[Any, Any]:
+        """
+        Take an idle model pair, loading a new one while the pool is below its bound.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a pair once the pool is exhausted. Waits forever if None.
+
+        Returns:
+            Tuple[Any, Any]: YOLO model and OCR model.
+
+        Raises:
+            TimeoutError: If no pair became available in time.
+            RuntimeError: If loading a new pair fails.
+        """
+        models = None
+        try:
+            models = self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        if models is None:
+            with self._lock:
+                can_create = self._created < self.pool_size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                try:
+                    models = self._loader(self.intra_op_threads)
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    models = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"No model instance became available within {timeout} seconds.")
+
+        with self._lock:
+            self._in_use += 1
+        return models
+
+    def _release(self, models: Tuple[Any, Any]) -> None:
+        with self._lock:
+            self._in_use -= 1
+        self._idle.put(models)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Borrow a model pair for the duration of a 'with' block.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait when every pair is in use. Waits forever if None.
+
+        Yields:
+            Tuple[Any, Any]: YOLO model and OCR model, owned by the caller until the block exits.
+
+        Raises:
+            TimeoutError: If no pair became available in time.
+        """
+        models = self._acquire(timeout)
+        try:
+            yield models
+        finally:
+            self._release(models)
+
+    def thread_models(self, timeout: Optional[float] = None) -> Tuple[Any, Any]:
+        """
+        Return the model pair pinned to the calling thread, pinning one on first use.
+
+        Pinned pairs stay checked out until release_thread_models() is called from the same
+        thread, so use this only for long-lived worker threads no more numerous than the pool.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait when every pair is in use. Waits forever if None.
+
+        Returns:
+            Tuple[Any, Any]: YOLO model and OCR model.
+        """
+        models = getattr(self._local, 'models', None)
+        if models is None:
+            models = self._acquire(timeout)
+            self._local.models = models
+        return models
+
+    def release_thread_models(self) -> None:
+        """Return the calling thread's pinned pair, if any, to the pool."""
+        models = getattr(self._local, 'models', None)
+        if models is not None:
+            self._local.models = None
+            self._release(models)
+
+    def warm_up(self) -> None:
+        """Load every model pair up front so the first requests do not pay for loading."""
+        loaded = []
+        try:
+            while self._created < self.pool_size:
+                loaded.append(self._acquire(timeout=None))
+        finally:
+            for models in loaded:
+                self._release(models)
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Return the process-wide model registry, creating it from config.yaml on first use.
+
+    Returns:
+        ModelRegistry: Shared registry instance.
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
@@ -0,0 +1,231 @@
+import collections
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import numpy as np
+from pipeline import detail_extraction_pipeline
+from utils import load_scheduler_config
+from .model_registry import ModelRegistry, get_model_registry
+
+
+OVERLOADED_FEEDBACK = 'Overloaded.'
+
+DEFAULT_CLASSES = {
+    'interactive': {'weight': 8, 'max_queue': 16},
+    'batch': {'weight': 1, 'max_queue': 256},
+}
+
+
+class _Lane:
+    """
+    Bounded queue and metrics of one priority class.
+    """
+
+    def __init__(self, name: str, weight: float, max_queue: int, window: int) -> None:
+        self.name = name
+        self.weight = float(weight)
+        self.max_queue = int(max_queue)
+        self.queue: Deque[Tuple[float, Future, str, Dict[str, Any]]] = collections.deque()
+        self.virtual_time = 0.0
+        self.submitted = 0
+        self.completed = 0
+        self.shed = 0
+        self.waits: Deque[float] = collections.deque(maxlen=window)
+
+    def metrics(self) -> Dict[str, Any]:
+        waits = np.array(self.waits, dtype=np.float64)
+        return {
+            'queue_depth': len(self.queue),
+            'max_queue': self.max_queue,
+            'weight': self.weight,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'shed': self.shed,
+            'wait_ms_p50': round(1000 * float(np.percentile(waits, 50)), 2) if len(waits) else 0.0,
+            'wait_ms_p99': round(1000 * float(np.percentile(waits, 99)), 2) if len(waits) else 0.0,
+            'wait_ms_max': round(1000 * float(waits.max()), 2) if len(waits) else 0.0,
+        }
+
+
+class RequestScheduler:
+    """
+    Priority lanes with admission control in front of detail_extraction_pipeline.
+
+    Each priority class has its own bounded queue. Worker threads, each holding one model pair
+    from the registry, take the next request with weighted fair (stride) scheduling: a class is
+    served in proportion to its weight while it has work, and idle classes do not build up credit.
+    A request arriving at a full queue is shed at once with the 'Overloaded.' status instead of
+    waiting behind the backlog.
+    """
+
+    def __init__(self, registry: Optional[ModelRegistry] = None, classes: Optional[Dict[str, Dict[str, Any]]] = None,
+                 workers: Optional[int] = None, wait_window: int = 1000,
+                 pipeline: Callable[..., str] = detail_extraction_pipeline) -> None:
+        """
+        Args:
+            registry (Optional[ModelRegistry]): Source of model pairs. The process-wide registry if None.
+            classes (Optional[Dict[str, Dict[str, Any]]]): Priority class name -> {'weight', 'max_queue'}. Read from config.yaml if None.
+            workers (Optional[int]): Worker threads, at most the registry pool size (each pins one model pair). Defaults to the registry pool size.
+            wait_window (int): Number of recent queue wait times kept per class for the percentiles.
+            pipeline (Callable[..., str]): Function run for each request with (yolo_model, ocr_model, img_file_path, **kwargs).
+
+        Raises:
+            ValueError: If no class is configured, a weight or queue bound is not positive, or there are
+                more workers than model pairs in the registry.
+        """
+        scheduler_config = load_scheduler_config()
+        classes = classes or scheduler_config.get('classes') or DEFAULT_CLASSES
+
+        self.registry = registry or get_model_registry()
+        self.workers = workers or scheduler_config.get('workers') or self.registry.pool_size
+        self._pipeline = pipeline
+
+        # A worker without a model pair would take requests and block on them forever
+        if self.workers > self.registry.pool_size:
+            raise ValueError(f"Scheduler workers ({self.workers}) exceed the registry pool size ({self.registry.pool_size}).")
+
+        self._lanes: Dict[str, _Lane] = {}
+        for name, options in classes.items():
+            lane = _Lane(name, options.get('weight', 1), options.get('max_queue', 64), wait_window)
+            if lane.weight <= 0 or lane.max_queue <= 0:
+                raise ValueError(f"Weight and queue bound of class '{name}' must be positive.")
+            self._lanes[name] = lane
+
+        if not self._lanes:
+            raise ValueError("At least one priority class is required.")
+
+        self._condition = threading.Condition()
+        self._closed = False
+        self._threads: List[threading.Thread] = []
+
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"scheduler-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def classes(self) -> List[str]:
+        """Names of the priority classes."""
+        return list(self._lanes)
+
+    def submit(self, img_file_path: str, priority: str, deadline: Optional[float] = None, **kwargs: Any) -> Future:
+        """
+        Queue one request in its priority class.
+
+        Args:
+            img_file_path (str): Path to the image file.
+            priority (str): Priority class name.
+            deadline (Optional[float]): Time budget in seconds counted from submission; queue wait is
+                deducted before it is passed on to the pipeline.
+            **kwargs: Further detail_extraction_pipeline arguments (e.g. 'sink').
+
+        Returns:
+            Future: Resolves to the feedback message, or to 'Overloaded.' at once if the class queue is full.
+
+        Raises:
+            KeyError: If the priority class is unknown.
+            RuntimeError: If the scheduler is closed.
+        """
+        lane = self._lanes[priority]
+        future: Future = Future()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Scheduler is closed.")
+
+            lane.submitted += 1
+
+            if len(lane.queue) >= lane.max_queue:
+                lane.shed += 1
+                future.set_result(OVERLOADED_FEEDBACK)
+                return future
+
+            if not lane.queue:
+                # An idle class joins at the current virtual time instead of spending saved-up credit
+                busy = [other.virtual_time for other in self._lanes.values() if other.queue]
+                lane.virtual_time = max(lane.virtual_time, min(busy)) if busy else lane.virtual_time
+
+            if deadline is not None:
+                kwargs['deadline'] = deadline
+
+            lane.queue.append((time.perf_counter(), future, img_file_path, kwargs))
+            self._condition.notify()
+
+        return future
+
+    def _next_request(self) -> Optional[Tuple[_Lane, Tuple[float, Future, str, Dict[str, Any]]]]:
+        with self._condition:
+            while not any(lane.queue for lane in self._lanes.values()):
+                # Closing stops the workers only once the queues are drained
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+            lane = min((lane for lane in self._lanes.values() if lane.queue), key=lambda lane: lane.virtual_time)
+            lane.virtual_time += 1.0 / lane.weight
+            request = lane.queue.popleft()
+            lane.waits.append(time.perf_counter() - request[0])
+
+            return lane, request
+
+    def _work(self) -> None:
+        try:
+            while True:
+                next_request = self._next_request()
+                if next_request is None:
+                    return
+
+                lane, (queued_at, future, img_file_path, kwargs) = next_request
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                if 'deadline' in kwargs:
+                    kwargs['deadline'] -= time.perf_counter() - queued_at
+
+                try:
+                    yolo_model, ocr_model = self.registry.thread_models()
+                    future.set_result(self._pipeline(yolo_model, ocr_model, img_file_path, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+
+                with self._condition:
+                    lane.completed += 1
+
+        finally:
+            self.registry.release_thread_models()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            Dict[str, Dict[str, Any]]: Per class: queue depth and bound, weight, submitted, completed and
+            shed counts, and p50 / p99 / max queue wait over the recent requests.
+        """
+        with self._condition:
+            return {name: lane.metrics() for name, lane in self._lanes.items()}
+
+    def close(self, cancel_pending: bool = False) -> None:
+        """
+        Stop the workers after the queued requests are done.
+
+        Args:
+            cancel_pending (bool): Cancel queued requests instead of finishing them.
+        """
+        with self._condition:
+            self._closed = True
+
+            if cancel_pending:
+                for lane in self._lanes.values():
+                    while lane.queue:
+                        lane.queue.popleft()[1].cancel()
+
+            self._condition.notify_all()
+
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> 'RequestScheduler':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
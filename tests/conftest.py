@@ -0,0 +1,13 @@
+import os
+import sys
+import pytest
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    # Config paths such as configs/config.yaml are relative to the repository root
+    monkeypatch.chdir(REPO_ROOT)
@@ -0,0 +1,86 @@
+import io
+import os
+import tarfile
+import zipfile
+import cv2
+import numpy as np
+import pytest
+from inputs import decode_image, iter_archive_images, iter_inputs, MEMBER_SEPARATOR
+
+
+def _png(value):
+    ok, buffer = cv2.imencode('.png', np.full((6, 8, 3), value, dtype=np.uint8))
+    assert ok
+    return buffer.tobytes()
+
+
+def _touch(path, data=b'x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def _write_zip(path, members, compression=zipfile.ZIP_STORED):
+    with zipfile.ZipFile(path, 'w', compression=compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return path
+
+
+def _write_tar(path, members, mode='w'):
+    with tarfile.open(path, mode) as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_decode_image_rejects_empty_and_invalid_buffers():
+    assert decode_image(b'') is None
+    assert decode_image(memoryview(b'')) is None
+    assert decode_image(b'not an image') is None
+    assert decode_image(_png(5)).shape == (6, 8, 3)
+
+
+@pytest.mark.parametrize('name, write', [
+    ('stored.zip', lambda path, members: _write_zip(path, members)),
+    ('deflated.zip', lambda path, members: _write_zip(path, members, zipfile.ZIP_DEFLATED)),
+    ('plain.tar', lambda path, members: _write_tar(path, members)),
+    ('packed.tar.gz', lambda path, members: _write_tar(path, members, 'w:gz')),
+])
+def test_archive_members_are_decoded_and_keyed_by_archive(tmp_path, name, write):
+    path = write(str(tmp_path / name), {'dir/x.png': _png(10), 'y.jpg': b'', 'readme.txt': b'text'})
+
+    items = list(iter_archive_images(path))
+
+    assert [key for key, _ in items] == [f'{path}{MEMBER_SEPARATOR}dir/x.png', f'{path}{MEMBER_SEPARATOR}y.jpg']
+    assert int(items[0][1][0, 0, 0]) == 10
+    assert items[1][1] is None
+
+
+def test_same_member_name_in_two_archives_gives_distinct_keys(tmp_path):
+    first = _write_zip(str(tmp_path / 'a.zip'), {'x.png': _png(1)})
+    second = _write_tar(str(tmp_path / 'b.tar'), {'x.png': _png(2)})
+    plain = _touch(str(tmp_path / 'x.png'), _png(3))
+
+    items = list(iter_inputs([first, second, plain]))
+
+    assert len({key for key, _ in items}) == 3
+    assert items[2] == (plain, plain)
+
+
+def test_iter_inputs_memory_maps_plain_files(tmp_path):
+    image = _touch(str(tmp_path / 'x.png'), _png(7))
+    empty = _touch(str(tmp_path / 'empty.png'), b'')
+
+    items = dict(iter_inputs([image, empty], mmap_files=True))
+
+    assert int(items[image][0, 0, 0]) == 7
+    assert items[empty] is None
+
+
+def test_unsupported_archive(tmp_path):
+    with pytest.raises(ValueError):
+        list(iter_archive_images(_touch(str(tmp_path / 'x.rar'))))
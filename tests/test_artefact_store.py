@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from utils import ArtefactStore, OCRDetections
+
+
+def _detection_trace(key, value=0, found=True):
+    crop = np.full((12, 20), value, dtype=np.uint8)
+    box = [1.0, 2.0, 21.0, 14.0] if found else None
+    return {'key': key, 'yolo_box': box, 'yolo_conf': 0.75 if found else None, 'table_found': found, 'crop': crop}
+
+
+def _ocr_trace(key, texts):
+    lines = [[[[0.5, i], [10.25, i], [10.25, i + 5], [0.5, i + 5]], (text, 0.9)] for i, text in enumerate(texts)]
+    return {'key': key, 'ocr_results': [lines or None]}
+
+
+def test_detection_round_trip(tmp_path):
+    store = ArtefactStore(str(tmp_path))
+    store.write_detection([_detection_trace('a.jpg', 7), _detection_trace('b.jpg', 9, found=False), {'key': 'c.jpg', 'crop': None}])
+
+    records = dict(store.read('detection'))
+
+    assert list(records) == ['a.jpg', 'b.jpg']
+    assert records['a.jpg']['yolo_box'] == [1.0, 2.0, 21.0, 14.0]
+    assert records['a.jpg']['yolo_conf'] == pytest.approx(0.75)
+    assert records['a.jpg']['table_found'] is True
+    assert np.array_equal(records['a.jpg']['crop'], np.full((12, 20), 7, dtype=np.uint8))
+    assert records['b.jpg']['yolo_box'] is None and records['b.jpg']['table_found'] is False
+
+
+def test_ocr_round_trip(tmp_path):
+    store = ArtefactStore(str(tmp_path))
+    traces = [_ocr_trace('a.jpg', ['A1', '01.01.2020']), _ocr_trace('b.jpg', [])]
+    store.write_ocr(traces)
+
+    records = dict(store.read('ocr'))
+
+    assert isinstance(records['a.jpg']['ocr_results'], OCRDetections)
+    assert records['a.jpg']['ocr_results'].to_paddle() == OCRDetections.from_ocr_results(traces[0]['ocr_results']).to_paddle()
+    assert len(records['b.jpg']['ocr_results']) == 0
+
+
+def test_latest_shard_wins_and_order_is_kept(tmp_path):
+    store = ArtefactStore(str(tmp_path))
+    store.write_ocr([_ocr_trace('a.jpg', ['old']), _ocr_trace('b.jpg', ['B'])])
+    store.write_ocr([_ocr_trace('a.jpg', ['new'])])
+
+    assert store.keys('ocr') == ['a.jpg', 'b.jpg']
+    assert dict(store.read('ocr', ['a.jpg']))['a.jpg']['ocr_results'].texts.tolist() == ['new']
+
+
+def test_read_selected_keys_skips_unknown(tmp_path):
+    store = ArtefactStore(str(tmp_path))
+    store.write_ocr([_ocr_trace('a.jpg', ['A']), _ocr_trace('b.jpg', ['B'])])
+
+    assert [key for key, _ in store.read('ocr', ['b.jpg', 'missing.jpg'])] == ['b.jpg']
+
+
+def test_index_loads_only_new_shards(tmp_path, monkeypatch):
+    store = ArtefactStore(str(tmp_path))
+    for batch in range(3):
+        store.write_ocr([_ocr_trace(f'{batch}.jpg', ['A'])])
+
+    loaded = []
+    load_shard = store._load_shard
+    monkeypatch.setattr(store, '_load_shard', lambda stage, name: loaded.append(name) or load_shard(stage, name))
+
+    store.keys('ocr')
+    list(store.read('ocr'))
+    assert len(loaded) == 3
+
+    store.write_ocr([_ocr_trace('3.jpg', ['A'])])
+    assert store.keys('ocr') == ['0.jpg', '1.jpg', '2.jpg', '3.jpg']
+    assert len(loaded) == 4
+
+
+def test_store_opened_later_sees_existing_shards(tmp_path):
+    ArtefactStore(str(tmp_path)).write_ocr([_ocr_trace('a.jpg', ['A'])])
+
+    assert ArtefactStore(str(tmp_path)).keys('ocr') == ['a.jpg']
+
+
+def test_unknown_stage(tmp_path):
+    with pytest.raises(ValueError):
+        list(ArtefactStore(str(tmp_path)).read('postprocessing'))
@@ -0,0 +1,93 @@
+import multiprocessing as mp
+import os
+import shutil
+import time
+import pytest
+import yaml
+from benchmarks.autotune import build_grid, _collect
+from utils import save_runtime_config
+
+
+def test_save_runtime_config_keeps_the_rest_of_the_file(tmp_path):
+    config_path = str(tmp_path / 'config.yaml')
+    shutil.copyfile('configs/config.yaml', config_path)
+    with open(config_path) as f:
+        before = f.read().splitlines()
+
+    save_runtime_config({'torch_threads': 2, 'ocr_enable_mkldnn': False, 'new_key': 3}, config_path)
+
+    with open(config_path) as f:
+        after = f.read().splitlines()
+    with open(config_path) as f:
+        runtime = yaml.safe_load(f)['runtime']
+
+    assert runtime['torch_threads'] == 2
+    assert runtime['ocr_enable_mkldnn'] is False
+    assert runtime['new_key'] == 3
+
+    # The new key is appended to the runtime section; only the two existing keys change otherwise
+    after.remove('  new_key: 3')
+    changed = [(old, new) for old, new in zip(before, after) if old != new]
+    assert len(after) == len(before)
+    assert len(changed) == 2
+    for old, new in changed:
+        # Comments are kept
+        assert old.split('#', 1)[1] == new.split('#', 1)[1]
+
+
+def test_save_runtime_config_creates_the_section(tmp_path):
+    config_path = str(tmp_path / 'config.yaml')
+    with open(config_path, 'w') as f:
+        f.write("output:\n  save_dir: \"outputs/\"\n")
+
+    save_runtime_config({'ocr_cpu_threads': 4, 'ocr_enable_mkldnn': None}, config_path)
+
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    assert config == {'output': {'save_dir': 'outputs/'}, 'runtime': {'ocr_cpu_threads': 4, 'ocr_enable_mkldnn': None}}
+
+
+def test_build_grid_fits_the_machine():
+    grid = build_grid([1, 2, 4], [1, 2], [1, 4], [None], cpu_count=4)
+
+    assert grid
+    assert all(settings['workers'] * max(settings['torch_threads'], settings['ocr_cpu_threads']) <= 4 for settings in grid)
+    assert {'workers': 4, 'torch_threads': 1, 'ocr_cpu_threads': 1, 'ocr_enable_mkldnn': None} in grid
+    assert not any(settings['workers'] == 2 and settings['ocr_cpu_threads'] == 4 for settings in grid)
+
+
+def test_collect_reports_a_crashed_worker():
+    ctx = mp.get_context('spawn')
+    results = ctx.Queue()
+    processes = [ctx.Process(target=os._exit, args=(3,)), ctx.Process(target=time.sleep, args=(60,))]
+    for process in processes:
+        process.start()
+
+    start = time.monotonic()
+    outcomes = _collect(processes, results, timeout=30)
+
+    assert outcomes == [(0, 0.0, "A worker exited with code 3.")]
+    assert time.monotonic() - start < 30
+    assert not any(process.is_alive() for process in processes)
+
+
+def test_collect_times_out():
+    ctx = mp.get_context('spawn')
+    processes = [ctx.Process(target=time.sleep, args=(60,))]
+    processes[0].start()
+
+    outcomes = _collect(processes, ctx.Queue(), timeout=1)
+
+    assert outcomes[0][2].startswith("Workers did not finish")
+    assert not processes[0].is_alive()
+
+
+def test_tuned_threads_never_exceed_an_explicit_budget():
+    pytest.importorskip('ultralytics')
+    from pipeline import _thread_count
+
+    assert _thread_count(8, 2, 4) == 4
+    assert _thread_count(2, 8, 4) == 2
+    assert _thread_count(None, 8, 4) == 4
+    assert _thread_count(None, None, 4) is None
+    assert _thread_count(3, None, None) == 3
@@ -0,0 +1,64 @@
+import pytest
+from utils import DeadlinePlanner
+
+
+# 1000 x 1000 input: 1 megapixel, so the estimate in seconds equals seconds_per_megapixel
+SHAPE = (1000, 1000)
+
+
+@pytest.fixture
+def planner():
+    return DeadlinePlanner(seconds_per_megapixel=1.0, angle_cls_share=0.2, low_res_max_side=500)
+
+
+def test_estimates(planner):
+    assert planner.estimate(SHAPE) == pytest.approx(1.0)
+    assert planner.estimate(SHAPE, cls=False) == pytest.approx(0.8)
+    assert planner.low_res_scale(SHAPE) == pytest.approx(0.5)
+    assert planner.estimate(SHAPE, cls=False, scale=0.5) == pytest.approx(0.2)
+    assert planner.low_res_scale((100, 200)) == 1.0
+
+
+@pytest.mark.parametrize('remaining, level', [
+    (2.0, 'full'),
+    (1.0, 'full'),
+    (0.9, 'no_angle_cls'),
+    (0.3, 'low_res'),
+])
+def test_choose_most_thorough_level_that_fits(planner, remaining, level):
+    assert planner.choose(remaining, SHAPE, table_found=True) == level
+    assert planner.choose(remaining, SHAPE, table_found=False) == level
+
+
+def test_nothing_fits(planner):
+    assert planner.choose(0.1, SHAPE, table_found=True) == 'low_res'
+    assert planner.choose(0.1, SHAPE, table_found=False) == 'no_fallback'
+
+
+def test_spent_budget_is_partial(planner):
+    assert planner.choose(0.0, SHAPE, table_found=True) == 'partial'
+    assert planner.choose(-1.0, SHAPE, table_found=False) == 'partial'
+
+
+def test_observe_follows_measured_times(planner):
+    planner.observe(3.0, SHAPE)
+    assert planner.seconds_per_megapixel == pytest.approx(1.0 + 0.2 * (3.0 - 1.0))
+
+    # Without the angle classifier, the observation is scaled up to a with-classifier time
+    planner.observe(0.8 * 1.4, SHAPE, cls=False)
+    assert planner.seconds_per_megapixel == pytest.approx(1.4)
+
+    planner.observe(5.0, (0, 0))
+    assert planner.seconds_per_megapixel == pytest.approx(1.4)
+
+
+def test_stats(planner):
+    for level in ('full', 'full', 'low_res', 'partial'):
+        planner.record(level)
+
+    stats = planner.stats()
+
+    assert stats['requests'] == 4
+    assert stats['levels']['full'] == 2
+    assert stats['shares']['low_res'] == 0.25
+    assert stats['shares']['no_fallback'] == 0.0
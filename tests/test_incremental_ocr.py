@@ -0,0 +1,79 @@
+import numpy as np
+from ocr import OCRBackend, incremental_ocr
+from ocr.incremental import category_candidates
+
+
+class PaintedOCR(OCRBackend):
+    """
+    OCR stand-in over an image where every text box is painted with its own gray level,
+    so a cut box is recognized by reading the gray level back.
+    """
+
+    def __init__(self, lines, shape=(400, 700)):
+        self.lines = lines
+        self.image = np.zeros(shape + (3,), dtype=np.uint8)
+        for i, (box, _) in enumerate(lines):
+            (x0, y0), (x1, y1) = np.min(box, axis=0), np.max(box, axis=0)
+            self.image[int(y0):int(y1), int(x0):int(x1)] = 4 * (i + 1)
+        self.recognized = 0
+
+    def detect(self, image):
+        return [np.asarray(box, dtype=np.float32) for box, _ in self.lines]
+
+    def recognize(self, images):
+        self.recognized += len(images)
+        return [self.lines[int(round(np.median(image) / 4)) - 1][1] for image in images]
+
+
+def _box(x, y, w, h=18):
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+
+def _licence(x_offset=40):
+    lines = []
+    for i, category in enumerate(['A1', 'A', 'B1', 'B', 'C1', 'C']):
+        y = 40 + 32 * i
+        lines.append([_box(x_offset, y, 12 * len(category) + 6), (category, 0.95)])
+        lines.append([_box(x_offset + 160, y, 130), (f'0{i + 1}.01.2020', 0.95)])
+        lines.append([_box(x_offset + 350, y, 130), (f'0{i + 1}.01.2030', 0.95)])
+    return lines
+
+
+def test_candidates_are_short_boxes_nearest_an_edge():
+    boxes = [np.asarray(_box(300, 10, 20), np.float32), np.asarray(_box(10, 100, 200), np.float32),
+             np.asarray(_box(20, 200, 20), np.float32)]
+
+    assert category_candidates(boxes, (400, 700)) == [2, 0]
+
+
+def test_licence_output_matches_full_ocr():
+    model = PaintedOCR(_licence())
+
+    full = model.ocr(model.image, cls=False)
+    incremental, details = incremental_ocr(model, model.image, {'batch_size': 4}, cls=False)
+
+    assert sorted(map(str, incremental[0])) == sorted(map(str, full[0]))
+    assert details['aborted'] is False and details['categories'] >= 2
+
+
+def test_stops_early_without_categories():
+    lines = [[_box(10 + 150 * (i % 4), 20 + 40 * (i // 4), 24), ('xx', 0.9)] for i in range(8)]
+    lines += [[_box(10, 360, 400), ('DRIVING LICENCE OF SOMEWHERE', 0.9)]]
+    model = PaintedOCR(lines)
+
+    _, details = incremental_ocr(model, model.image, {'batch_size': 4}, cls=False)
+
+    assert details['aborted'] is True
+    assert details['read'] == 8 and model.recognized == 8
+
+
+def test_small_boxes_beyond_max_probe_fall_back_to_full_ocr():
+    # Thirty small noise boxes ahead of the category column
+    noise = [[_box(2, 10 + 12 * i, 8, 8), ('~', 0.9)] for i in range(30)]
+    model = PaintedOCR(noise + _licence(x_offset=60))
+
+    incremental, details = incremental_ocr(model, model.image, {'batch_size': 8, 'max_probe': 24}, cls=False)
+
+    assert details['aborted'] is False
+    assert details['read'] == details['boxes']
+    assert {'A1', 'C'} <= {text for _, (text, _) in incremental[0]}
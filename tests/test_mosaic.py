@@ -0,0 +1,66 @@
+import numpy as np
+from ocr.mosaic import pack_crops, build_canvas, split_canvas_results
+
+
+def _overlaps(a, b, gutter):
+    (ax, ay, aw, ah), (bx, by, bw, bh) = a, b
+    return ax < bx + bw + gutter and bx < ax + aw + gutter and ay < by + bh + gutter and by < ay + ah + gutter
+
+
+def test_every_crop_is_placed_once_with_gutters():
+    shapes = [(120, 300), (80, 500), (200, 200), (60, 90), (150, 400), (90, 310), (40, 40)]
+    gutter, max_side = 32, 960
+
+    canvases = pack_crops(shapes, max_side=max_side, gutter=gutter)
+
+    placed = sorted(index for placements in canvases for index, _, _ in placements)
+    assert placed == list(range(len(shapes)))
+
+    for placements in canvases:
+        rects = [(x, y, shapes[i][1], shapes[i][0]) for i, x, y in placements]
+        for x, y, w, h in rects:
+            assert x >= gutter and y >= gutter
+            assert x + w + gutter <= max_side and y + h + gutter <= max_side
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                assert not _overlaps(a, b, gutter)
+
+
+def test_oversized_crop_gets_its_own_canvas():
+    canvases = pack_crops([(100, 100), (2000, 500), (100, 100)], max_side=960, gutter=32)
+
+    assert [(1, 32, 32)] in canvases
+    assert len(canvases) == 2
+
+
+def test_max_crops_per_canvas():
+    canvases = pack_crops([(10, 10)] * 10, max_side=960, gutter=8, max_crops=4)
+
+    assert [len(placements) for placements in canvases] == [4, 4, 2]
+
+
+def test_split_routes_boxes_back_to_crop_coordinates():
+    crops = [np.zeros((100, 200), np.uint8), np.zeros((50, 80), np.uint8)]
+    placements = pack_crops([crop.shape for crop in crops], gutter=32)[0]
+    canvas = build_canvas(crops, placements, gutter=32)
+    origin = {index: (x, y) for index, x, y in placements}
+
+    def line(index, x, y, text):
+        ox, oy = origin[index]
+        return [[[ox + x, oy + y], [ox + x + 20, oy + y], [ox + x + 20, oy + y + 10], [ox + x, oy + y + 10]], (text, 0.9)]
+
+    gutter_line = [[[1, 1], [10, 1], [10, 8], [1, 8]], ('gutter', 0.9)]
+    results = [[line(0, 5, 5, 'first'), line(1, 30, 20, 'second'), gutter_line]]
+
+    split = split_canvas_results(results, crops, placements)
+
+    assert canvas.shape[0] >= 100 and canvas.shape[1] >= 280
+    assert split[0] == [[[[[5.0, 5.0], [25.0, 5.0], [25.0, 15.0], [5.0, 15.0]], ('first', 0.9)]]]
+    assert split[1] == [[[[[30.0, 20.0], [50.0, 20.0], [50.0, 30.0], [30.0, 30.0]], ('second', 0.9)]]]
+
+
+def test_split_gives_none_for_crops_without_text():
+    crops = [np.zeros((40, 40), np.uint8)]
+    placements = pack_crops([crops[0].shape])[0]
+
+    assert split_canvas_results([None], crops, placements) == {0: [None]}
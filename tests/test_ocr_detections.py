@@ -0,0 +1,65 @@
+import pickle
+import numpy as np
+from utils import OCRDetections
+
+
+def _line(x, y, text, confidence=0.9):
+    return [[[x, y], [x + 10.5, y], [x + 10.5, y + 4.25], [x, y + 4.25]], (text, confidence)]
+
+
+def test_paddle_round_trip_is_exact():
+    result = [[_line(1.1, 2.2, 'A1', 0.30000001), _line(100.0, 2.2, '01.02.2020', 0.987654321)]]
+
+    detections = OCRDetections.from_ocr_results(result)
+
+    assert len(detections) == 2
+    assert detections.boxes.dtype == np.float64
+    assert detections.to_paddle() == [[[box, tuple(rec)] for box, rec in result[0]]]
+
+
+def test_empty_result():
+    detections = OCRDetections.from_ocr_results([None])
+
+    assert len(detections) == 0
+    assert detections.to_paddle() == [None]
+
+
+def test_concat_and_image_views():
+    first = OCRDetections.from_ocr_results([[_line(0, 0, 'A'), _line(0, 10, 'B')]])
+    second = OCRDetections.from_ocr_results([None])
+    third = OCRDetections.from_ocr_results([[_line(5, 5, 'C')]])
+
+    joined = OCRDetections.concat([first, second, third])
+
+    assert joined.num_images == 3
+    assert joined.offsets.tolist() == [0, 2, 2, 3]
+    assert joined.image(0).texts.tolist() == ['A', 'B']
+    assert len(joined.image(1)) == 0
+    assert joined.image(2).texts.tolist() == ['C']
+    assert np.shares_memory(joined.image(2).boxes, joined.boxes)
+
+
+def test_take_replaces_texts():
+    detections = OCRDetections.from_ocr_results([[_line(0, 0, 'IA'), _line(0, 10, 'B'), _line(0, 20, 'C')]])
+
+    taken = detections.take([2, 0], texts=['C', 'A'])
+
+    assert taken.texts.tolist() == ['C', 'A']
+    assert taken.boxes.tolist() == [detections.boxes[2].tolist(), detections.boxes[0].tolist()]
+
+
+def test_centers_are_midway_between_extreme_corners():
+    detections = OCRDetections.from_ocr_results([[[[[0, 0], [10, 2], [9, 12], [-1, 10]], ('A', 0.9)]]])
+
+    assert detections.centers().tolist() == [[4.5, 6.0]]
+
+
+def test_pickle_protocol_5_round_trip():
+    detections = OCRDetections.concat([OCRDetections.from_ocr_results([[_line(0, 0, 'A'), _line(1, 1, 'B')]])] * 2)
+    buffers = []
+
+    restored = pickle.loads(pickle.dumps(detections, protocol=5, buffer_callback=buffers.append), buffers=buffers)
+
+    assert buffers
+    for name in ('boxes', 'texts', 'confidences', 'offsets'):
+        assert np.array_equal(getattr(restored, name), getattr(detections, name))
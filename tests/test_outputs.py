@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import pandas as pd
+import pytest
+from utils import CsvSink, JsonlSink, RunSummary, create_sink
+
+
+ROWS = {'A': ['01.01.2020', '01.01.2030'], 'B': ['02.02.2021', '02.02.2031']}
+
+
+def test_csv_sink_writes_rows(tmp_path):
+    sink = CsvSink(str(tmp_path))
+    sink.write('some/dir/licence.v2.jpg', ROWS, 'Detection Successful.')
+    sink.write('empty.jpg', {}, 'No output from OCR.')
+
+    assert os.listdir(tmp_path) == ['licence.v2.csv']
+    frame = pd.read_csv(tmp_path / 'licence.v2.csv', index_col=0)
+    assert frame.to_dict('list') == {'Vehicle Category': ['A', 'B'], 'Issued Date': [ROWS['A'][0], ROWS['B'][0]],
+                                     'Expiry Date': [ROWS['A'][1], ROWS['B'][1]]}
+
+
+def test_csv_sink_never_overwrites(tmp_path):
+    (tmp_path / 'x.csv').write_text('earlier run\n')
+    sink = CsvSink(str(tmp_path))
+
+    for key in ('d1/x.jpg', 'd2/x.jpg', 'a.zip::x.png', 'a.b.jpg', 'a.c.jpg'):
+        sink.write(key, ROWS, 'Detection Successful.')
+
+    assert sorted(os.listdir(tmp_path)) == ['a.b.csv', 'a.c.csv', 'x.csv', 'x_2.csv', 'x_3.csv', 'x_4.csv']
+    assert (tmp_path / 'x.csv').read_text() == 'earlier run\n'
+
+
+def test_csv_sink_names_are_unique_across_threads(tmp_path):
+    sink = CsvSink(str(tmp_path))
+    threads = [threading.Thread(target=sink.write, args=(f'dir{i}/x.jpg', ROWS, 'ok')) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(os.listdir(tmp_path)) == 16
+
+
+def test_jsonl_sink_appends_lines(tmp_path):
+    path = str(tmp_path / 'out' / 'rows.jsonl')
+    for key in ('a.jpg', 'b.jpg'):
+        sink = create_sink('jsonl', path)
+        sink.write(key, ROWS if key == 'a.jpg' else {}, 'feedback')
+        sink.close()
+
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+
+    assert isinstance(sink, JsonlSink)
+    assert lines == [{'file': 'a.jpg', 'feedback': 'feedback', 'rows': ROWS}, {'file': 'b.jpg', 'feedback': 'feedback', 'rows': {}}]
+
+
+def test_create_sink_errors():
+    with pytest.raises(ValueError):
+        create_sink('jsonl')
+    with pytest.raises(ValueError):
+        create_sink('parquet', 'out')
+
+
+def test_run_summary(tmp_path):
+    summary = RunSummary()
+    summary.add('a.jpg', {'feedback': 'Detection Successful.', 'timings': {'ocr': 1.0, 'detection': 0.5}})
+    summary.add('b.jpg', {'feedback': 'Detection Successful.', 'timings': {'ocr': 2.0}})
+    summary.add('c.jpg', {'error': 'broken', 'timings': {}})
+    summary.skip('d.jpg', 'No stored OCR output.')
+
+    path = str(tmp_path / 'summary' / 'run_summary.json')
+    summary.write(path)
+    with open(path) as f:
+        report = json.load(f)
+
+    assert report['images'] == 3
+    assert report['feedback'] == {'Detection Successful.': [2, ['a.jpg', 'b.jpg']]}
+    assert report['failures'] == {'c.jpg': 'broken'}
+    assert report['skipped'] == {'d.jpg': 'No stored OCR output.'}
+    assert report['stage_seconds'] == {'ocr': 3.0, 'detection': 0.5}
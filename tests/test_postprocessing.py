@@ -0,0 +1,52 @@
+import json
+import os
+from benchmarks.synthetic_ocr import generate_ocr_results
+from postprocessing import extract_required_text_fields, find_image_orientation, identify_rows
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'postprocessing_baseline.json')
+
+
+def _postprocess(result):
+    categories, dates = extract_required_text_fields(result)
+    orientation, sorted_categories = find_image_orientation(categories)
+    return (orientation,) + identify_rows(dates, orientation, sorted_categories)
+
+
+def _line(x, y, text, width=20.0):
+    return [[[x, y], [x + width, y], [x + width, y + 18], [x, y + 18]], (text, 0.95)]
+
+
+def test_matches_list_based_baseline():
+    # Orientation, feedback and rows of the nested-list postprocessing on the same synthetic samples
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    samples = generate_ocr_results(baseline['count'], seed=baseline['seed'])
+    for index, ((result, _, _), expected) in enumerate(zip(samples, baseline['expected'])):
+        assert list(_postprocess(result)) == expected, f"sample {index}"
+
+
+def test_clean_samples_are_read_completely():
+    for result, expected, orientation in generate_ocr_results(100, seed=7, missing_rate=0.0, misread_rate=0.0,
+                                                              duplicate_rate=0.0, noise_boxes=0):
+        assert _postprocess(result) == (orientation, 'Detection Successful.', expected)
+
+
+def test_repeated_single_label_is_a_category_failure():
+    result = [[_line(20, 40, 'G'), _line(20, 72, 'G'), _line(190, 40, '01.01.2020', 130), _line(380, 40, '01.01.2030', 130)]]
+
+    assert _postprocess(result)[1:] == ('Unable to identify categories properly.', {})
+
+
+def test_dates_on_one_side_are_a_date_failure():
+    result = [[_line(20, 40, 'A1'), _line(20, 72, 'A'), _line(20, 104, 'B1'),
+               _line(190, 40, '01.01.2020', 130), _line(190, 72, '02.02.2020', 130)]]
+
+    assert _postprocess(result)[1:] == ('Unable to identify dates properly.', {})
+
+
+def test_single_date_is_a_date_failure():
+    result = [[_line(20, 40, 'A1'), _line(20, 72, 'A'), _line(190, 40, '01.01.2020', 130)]]
+
+    assert _postprocess(result)[1:] == ('Unable to identify dates properly.', {})
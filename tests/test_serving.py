@@ -0,0 +1,122 @@
+import threading
+import pytest
+
+pytest.importorskip('ultralytics')
+
+from serving import ModelRegistry, RequestScheduler, OVERLOADED_FEEDBACK
+
+
+def _registry(pool_size):
+    count = iter(range(100))
+    return ModelRegistry(pool_size=pool_size, intra_op_threads=1, loader=lambda threads: ('yolo', next(count)))
+
+
+class BlockingPipeline:
+    """Pipeline stand-in that records the requests it runs and holds the first one until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, yolo_model, ocr_model, img_file_path, **kwargs):
+        with self._lock:
+            self.calls.append((img_file_path, kwargs))
+        self.started.set()
+        self.release.wait(10)
+        return f"done {img_file_path}"
+
+
+def test_registry_loads_at_most_pool_size_pairs():
+    registry = _registry(2)
+
+    with registry.checkout() as first, registry.checkout() as second:
+        assert first != second
+        assert registry.in_use == 2
+    with registry.checkout():
+        pass
+
+    assert registry.created == 2
+    assert registry.in_use == 0
+
+
+def test_more_workers_than_model_pairs_is_rejected():
+    with pytest.raises(ValueError):
+        RequestScheduler(_registry(2), workers=3, pipeline=BlockingPipeline())
+
+
+def test_full_queue_sheds_at_once():
+    pipeline = BlockingPipeline()
+    classes = {'batch': {'weight': 1, 'max_queue': 2}}
+
+    with RequestScheduler(_registry(1), classes=classes, workers=1, pipeline=pipeline) as scheduler:
+        running = scheduler.submit('running.jpg', 'batch')
+        assert pipeline.started.wait(10)
+
+        queued = [scheduler.submit(f'{i}.jpg', 'batch') for i in range(2)]
+        shed = scheduler.submit('shed.jpg', 'batch')
+
+        assert shed.done() and shed.result() == OVERLOADED_FEEDBACK
+        pipeline.release.set()
+
+        assert running.result(10) == 'done running.jpg'
+        assert [future.result(10) for future in queued] == ['done 0.jpg', 'done 1.jpg']
+
+    metrics = scheduler.metrics()['batch']
+    assert (metrics['submitted'], metrics['completed'], metrics['shed']) == (4, 3, 1)
+
+
+def test_busy_classes_are_served_in_proportion_to_their_weights():
+    pipeline = BlockingPipeline()
+    classes = {'interactive': {'weight': 3, 'max_queue': 16}, 'batch': {'weight': 1, 'max_queue': 16}}
+
+    with RequestScheduler(_registry(1), classes=classes, workers=1, pipeline=pipeline) as scheduler:
+        scheduler.submit('blocker', 'batch')
+        assert pipeline.started.wait(10)
+
+        futures = [scheduler.submit(f'batch-{i}', 'batch') for i in range(8)]
+        futures += [scheduler.submit(f'interactive-{i}', 'interactive') for i in range(8)]
+        pipeline.release.set()
+        for future in futures:
+            future.result(10)
+
+    served = [path.split('-')[0] for path, _ in pipeline.calls[1:]]
+    assert served[:8].count('interactive') == 6
+    assert served[-4:] == ['batch'] * 4
+
+
+def test_deadline_is_reduced_by_the_queue_wait():
+    pipeline = BlockingPipeline()
+
+    with RequestScheduler(_registry(1), classes={'batch': {'weight': 1, 'max_queue': 4}}, workers=1, pipeline=pipeline) as scheduler:
+        scheduler.submit('blocker', 'batch')
+        assert pipeline.started.wait(10)
+        future = scheduler.submit('late.jpg', 'batch', deadline=5.0, sink='sink')
+        threading.Timer(0.2, pipeline.release.set).start()
+        future.result(10)
+
+    _, kwargs = pipeline.calls[1]
+    assert kwargs['sink'] == 'sink'
+    assert kwargs['deadline'] <= 4.85
+
+
+def test_pipeline_errors_reach_the_future():
+    def failing(yolo_model, ocr_model, img_file_path, **kwargs):
+        raise RuntimeError("boom")
+
+    with RequestScheduler(_registry(1), workers=1, pipeline=failing) as scheduler:
+        future = scheduler.submit('a.jpg', scheduler.classes[0])
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result(10)
+
+
+def test_unknown_class_and_closed_scheduler():
+    scheduler = RequestScheduler(_registry(1), workers=1, pipeline=BlockingPipeline())
+
+    with pytest.raises(KeyError):
+        scheduler.submit('a.jpg', 'missing')
+
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.submit('a.jpg', scheduler.classes[0])
@@ -0,0 +1,33 @@
+import os
+import pytest
+from inputs import collect_image_paths, read_manifest
+
+
+def _touch(path, data=b'x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def test_collect_directories_globs_and_manifest(tmp_path):
+    root = str(tmp_path)
+    b = _touch(os.path.join(root, 'in', 'b.jpg'))
+    a = _touch(os.path.join(root, 'in', 'sub', 'a.PNG'))
+    _touch(os.path.join(root, 'in', 'notes.txt'))
+    archive = _touch(os.path.join(root, 'batch.zip'))
+    other = _touch(os.path.join(root, 'other', 'c.jpeg'))
+
+    manifest = os.path.join(root, 'manifest.txt')
+    with open(manifest, 'w') as f:
+        f.write(f"# more inputs\n\n{other}\n{b}\n")
+
+    paths = collect_image_paths([os.path.join(root, 'in'), os.path.join(root, '*.zip')], manifest=manifest)
+
+    assert paths == [b, a, archive, other]
+    assert read_manifest(manifest) == [other, b]
+
+
+def test_collect_unknown_input(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        collect_image_paths([str(tmp_path / 'missing' / '*.jpg')])
@@ -0,0 +1,40 @@
+import itertools
+import random
+from benchmarks.synthetic_ocr import generate_ocr_result, generate_ocr_results
+from utils import load_vehicle_cat_config
+
+
+def test_same_seed_gives_same_samples():
+    first = list(generate_ocr_results(20, seed=3))
+    second = list(generate_ocr_results(20, seed=3))
+
+    assert first == second
+    assert first != list(generate_ocr_results(20, seed=4))
+
+
+def test_sample_shape():
+    categories = load_vehicle_cat_config(is_to_sort=True)
+
+    for result, expected, orientation in generate_ocr_results(50, seed=0):
+        assert orientation in ('portrait', 'landscape')
+        assert len(result) == 1
+        for box, (text, confidence) in result[0]:
+            assert len(box) == 4 and all(len(point) == 2 for point in box)
+            assert isinstance(text, str)
+            assert 0.0 <= confidence <= 1.0
+
+        assert len(expected) >= 2
+        assert list(expected) == [category for category in categories if category in expected]
+
+
+def test_clean_sample_holds_every_expected_text():
+    rng = random.Random(0)
+    result, expected, _ = generate_ocr_result(rng, missing_rate=0.0, misread_rate=0.0, duplicate_rate=0.0, noise_boxes=0)
+
+    texts = [text for _, (text, _) in result[0]]
+    assert sorted(texts) == sorted(itertools.chain(load_vehicle_cat_config(is_to_sort=True), *expected.values()))
+
+
+def test_orientation_is_respected():
+    for orientation in ('portrait', 'landscape'):
+        assert {sample[2] for sample in generate_ocr_results(10, seed=1, orientation=orientation)} == {orientation}
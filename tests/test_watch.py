@@ -0,0 +1,85 @@
+import os
+import time
+import pytest
+from inputs import FolderWatcher, move_file
+
+
+def _write(path, data=b'data'):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def _wait_for(watcher, seconds):
+    # Collect everything reported within the given time
+    reported = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        reported += watcher.wait(timeout=0.05)
+    return reported
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    watcher = FolderWatcher(str(tmp_path), settle_seconds=0.3, poll_interval=0.05, use_inotify=False)
+    yield watcher
+    watcher.close()
+
+
+def test_missing_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FolderWatcher(str(tmp_path / 'missing'), use_inotify=False)
+
+
+def test_file_is_reported_once_after_settling(tmp_path, watcher):
+    path = _write(str(tmp_path / 'a.jpg'))
+    _write(str(tmp_path / 'notes.txt'))
+
+    assert watcher.wait(timeout=0.1) == []
+    assert _wait_for(watcher, 1.0) == [path]
+    assert _wait_for(watcher, 0.5) == []
+
+
+def test_growing_file_waits_until_unchanged(tmp_path, watcher):
+    path = str(tmp_path / 'a.jpg')
+    with open(path, 'wb') as f:
+        for _ in range(5):
+            f.write(b'chunk')
+            f.flush()
+            assert watcher.wait(timeout=0.1) == []
+
+    assert _wait_for(watcher, 1.0) == [path]
+
+
+def test_empty_file_is_not_reported(tmp_path, watcher):
+    _write(str(tmp_path / 'a.jpg'), b'')
+
+    assert _wait_for(watcher, 0.6) == []
+
+
+def test_name_reused_after_moving_out_is_reported_again(tmp_path, watcher):
+    path = _write(str(tmp_path / 'a.jpg'))
+    assert _wait_for(watcher, 1.0) == [path]
+
+    move_file(path, str(tmp_path / 'processed'))
+    _wait_for(watcher, 0.2)
+    _write(path, b'second image')
+
+    assert _wait_for(watcher, 1.0) == [path]
+
+
+def test_move_file_adds_suffix_when_taken(tmp_path):
+    target = str(tmp_path / 'processed')
+    first = move_file(_write(str(tmp_path / 'a.jpg'), b'1'), target)
+    second = move_file(_write(str(tmp_path / 'a.jpg'), b'2'), target)
+
+    assert first == os.path.join(target, 'a.jpg')
+    assert second == os.path.join(target, 'a_1.jpg')
+    with open(second, 'rb') as f:
+        assert f.read() == b'2'
+    assert not os.path.exists(tmp_path / 'a.jpg')
+
+
+def test_move_file_failure_raises_oserror(tmp_path):
+    with pytest.raises(OSError):
+        move_file(str(tmp_path / 'missing.jpg'), str(tmp_path / 'processed'))
@@ -1,3 +1,8 @@
-from .config_loader import load_yolo_weights_config, load_yolo_thresh_config, load_ocr_text_thresh_config, load_vehicle_cat_config, load_output_path_config
+from .config_loader import override_config, load_yolo_weights_config, load_yolo_thresh_config, load_yolo_cascade_config, load_ocr_backend_config, load_template_grid_config, load_rectify_config, load_row_refinement_config, load_mosaic_config, load_incremental_ocr_config, load_ocr_text_thresh_config, load_vehicle_cat_config, load_output_path_config, load_runtime_config, load_scheduler_config, load_watch_config, save_runtime_config, load_diagnostics_config, load_deadline_config
 from .bounding_box_utils import get_max_min_x_y_for_points_array, get_x_center, get_y_center
-from .save_csv import save_csv
\ No newline at end of file
+from .save_csv import save_csv
+from .output_sinks import CsvSink, JsonlSink, create_sink
+from .run_summary import RunSummary
+from .deadline import DEGRADATION_LEVELS, DeadlinePlanner, get_deadline_planner
+from .artefact_store import STORED_STAGES, ArtefactStore
+from .ocr_detections import OCRDetections
@@ -0,0 +1,201 @@
+import os
+import threading
+import time
+import cv2
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .ocr_detections import OCRDetections
+
+
+STORED_STAGES = ('detection', 'ocr')
+
+# Columns of the shards of each stage, one .npy file each
+DETECTION_COLUMNS = ('keys', 'boxes', 'confidences', 'table_found', 'crop_offsets', 'crop_bytes')
+OCR_COLUMNS = ('keys', 'offsets', 'boxes', 'texts', 'confidences')
+
+
+def _offsets(lengths: List[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _concat(parts: List[bytes]) -> np.ndarray:
+    return np.frombuffer(b''.join(parts), dtype=np.uint8)
+
+
+class ArtefactStore:
+    """
+    Per-image outputs of the detection and OCR stages, so later stages can be re-run without the models.
+
+    Each call to a write method adds one shard: a directory of .npy columns covering a batch of
+    images. Detection shards hold the table box, its confidence, whether the table was found and
+    the grayscale crop (PNG encoded); OCR shards hold the arrays of the batch's OCRDetections
+    (boxes, texts, confidences and per-image offsets). Columns are read through memory maps, so
+    only the images that are used are paged in, and stored OCR output is used without decoding. When an image is
+    stored more than once, its latest artefacts are used. The key index of each stage is built once and
+    only extended with the shards added since. Safe to share between threads.
+    """
+
+    def __init__(self, root: str) -> None:
+        """
+        Args:
+            root (str): Store directory, created if missing.
+        """
+        self.root = root
+        for stage in STORED_STAGES:
+            os.makedirs(os.path.join(root, stage), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._counter = 0
+        # stage -> (shard names indexed, key -> (shard columns, row)), in shard name order
+        self._indexes: Dict[str, Tuple[List[str], Dict[str, Tuple[Dict[str, np.ndarray], int]]]] = {}
+
+    def _write_shard(self, stage: str, columns: Dict[str, np.ndarray]) -> str:
+        with self._lock:
+            self._counter += 1
+            name = f"{time.time_ns():020d}-{os.getpid()}-{self._counter:06d}"
+
+        stage_dir = os.path.join(self.root, stage)
+        partial = os.path.join(stage_dir, f".{name}")
+        os.makedirs(partial)
+
+        for column, values in columns.items():
+            np.save(os.path.join(partial, f"{column}.npy"), values, allow_pickle=False)
+
+        # Readers only ever see complete shards
+        shard = os.path.join(stage_dir, name)
+        os.rename(partial, shard)
+        return shard
+
+    def write_detection(self, traces: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Store the detection outputs of a batch.
+
+        Args:
+            traces (List[Dict[str, Any]]): Traces with 'key', 'yolo_box', 'yolo_conf', 'table_found' and 'crop'.
+
+        Returns:
+            Optional[str]: Shard directory, or None if no trace has a crop.
+        """
+        traces = [trace for trace in traces if trace.get('crop') is not None]
+        if not traces:
+            return None
+
+        boxes = np.full((len(traces), 4), np.nan, dtype=np.float32)
+        confidences = np.full(len(traces), np.nan, dtype=np.float32)
+        encoded = []
+
+        for i, trace in enumerate(traces):
+            if trace.get('yolo_box') is not None:
+                boxes[i] = trace['yolo_box']
+                confidences[i] = trace['yolo_conf']
+
+            ok, buffer = cv2.imencode('.png', trace['crop'])
+            if not ok:
+                raise RuntimeError(f"Could not encode the crop of {trace['key']}")
+            encoded.append(buffer.tobytes())
+
+        return self._write_shard('detection', {
+            'keys': np.array([trace['key'] for trace in traces]),
+            'boxes': boxes,
+            'confidences': confidences,
+            'table_found': np.array([bool(trace.get('table_found')) for trace in traces]),
+            'crop_offsets': _offsets([len(buffer) for buffer in encoded]),
+            'crop_bytes': _concat(encoded),
+        })
+
+    def write_ocr(self, traces: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Store the raw OCR outputs of a batch.
+
+        Args:
+            traces (List[Dict[str, Any]]): Traces with 'key' and 'ocr_results' (PaddleOCR output or OCRDetections).
+
+        Returns:
+            Optional[str]: Shard directory, or None if no trace has OCR results.
+        """
+        traces = [trace for trace in traces if trace.get('ocr_results') is not None]
+        if not traces:
+            return None
+
+        detections = OCRDetections.concat([OCRDetections.from_ocr_results(trace['ocr_results']) for trace in traces])
+
+        return self._write_shard('ocr', {
+            'keys': np.array([trace['key'] for trace in traces]),
+            'offsets': detections.offsets,
+            'boxes': detections.boxes,
+            'texts': detections.texts,
+            'confidences': detections.confidences,
+        })
+
+    def _load_shard(self, stage: str, name: str) -> Dict[str, np.ndarray]:
+        shard = os.path.join(self.root, stage, name)
+        columns = DETECTION_COLUMNS if stage == 'detection' else OCR_COLUMNS
+        return {column: np.load(os.path.join(shard, f"{column}.npy"), mmap_mode='r') for column in columns}
+
+    def _index(self, stage: str, keys: Optional[List[str]] = None) -> List[Tuple[str, Dict[str, np.ndarray], int]]:
+        names = sorted(name for name in os.listdir(os.path.join(self.root, stage)) if not name.startswith('.'))
+
+        with self._lock:
+            indexed, latest = self._indexes.get(stage, ([], {}))
+
+            # Shards written by another process may sort before the indexed ones; rebuild then
+            if names[:len(indexed)] != indexed:
+                indexed, latest = [], {}
+
+            # Latest shard wins for images stored more than once; first-seen order otherwise
+            new_names = names[len(indexed):]
+            if new_names:
+                latest = dict(latest)
+            for name in new_names:
+                shard = self._load_shard(stage, name)
+                for i, key in enumerate(shard['keys']):
+                    latest[str(key)] = (shard, i)
+
+            self._indexes[stage] = (names, latest)
+
+        wanted = latest if keys is None else [key for key in keys if key in latest]
+        return [(key, *latest[key]) for key in wanted]
+
+    def keys(self, stage: str) -> List[str]:
+        """
+        Args:
+            stage (str): 'detection' or 'ocr'.
+
+        Returns:
+            List[str]: Keys of the images stored for the stage.
+        """
+        return [key for key, _, _ in self._index(stage)]
+
+    def read(self, stage: str, keys: Optional[List[str]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Load the stored outputs of a stage, one image at a time.
+
+        Args:
+            stage (str): 'detection' or 'ocr'.
+            keys (Optional[List[str]]): Images to load. All stored images if None.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: Image key and its artefacts: 'yolo_box', 'yolo_conf', 'table_found'
+            and 'crop' for detection, 'ocr_results' as OCRDetections (views of the memory-mapped columns) for OCR.
+
+        Raises:
+            ValueError: If the stage is not stored.
+        """
+        if stage not in STORED_STAGES:
+            raise ValueError(f"Unknown stored stage: {stage}")
+
+        for key, shard, i in self._index(stage, keys):
+            if stage == 'detection':
+                start, end = shard['crop_offsets'][i], shard['crop_offsets'][i + 1]
+                found_box = not np.isnan(shard['boxes'][i][0])
+                yield key, {
+                    'yolo_box': shard['boxes'][i].tolist() if found_box else None,
+                    'yolo_conf': float(shard['confidences'][i]) if found_box else None,
+                    'table_found': bool(shard['table_found'][i]),
+                    'crop': cv2.imdecode(np.asarray(shard['crop_bytes'][start:end]), cv2.IMREAD_UNCHANGED),
+                }
+            else:
+                start, end = shard['offsets'][i], shard['offsets'][i + 1]
+                yield key, {'ocr_results': OCRDetections(shard['boxes'][start:end], shard['texts'][start:end], shard['confidences'][start:end])}
@@ -1,20 +1,126 @@
+import os
+import re
 import yaml
+from contextlib import contextmanager
+
+# Parsed configurations keyed by path, with the file's (mtime, size) when parsed
+_config_cache = {}
+
+# Overrides layered on top of every loaded configuration by override_config, innermost last
+_config_overrides = []
+
+
+def _merge_config(base, overrides):
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@contextmanager
+def override_config(overrides):
+    """
+    Temporarily override configuration values for the whole process, e.g. to evaluate a setting without editing config.yaml.
+
+    Nested dictionaries are merged, so {'rectify': {'enabled': True}} keeps the other rectify settings.
+    Not meant for use while other threads are serving requests.
+
+    Args:
+        overrides (dict): Values in the layout of config.yaml.
+    """
+    _config_overrides.append(overrides)
+    try:
+        yield
+    finally:
+        _config_overrides.remove(overrides)
+
 
 def load_config(config_path="configs/config.yaml"):
     """
     Load configuration settings from a YAML file.
 
+    The parsed file is cached until its modification time or size changes, so the config
+    getters can be called per request without re-parsing YAML. Callers must not modify
+    the returned dictionary.
+
     Args:
         config_path (str): Path to the configuration file (default is "configs/config.yaml").
 
     Returns:
         config (dict): Parsed configuration settings from the YAML file.
     """
-    with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+    stat = os.stat(config_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == signature:
+        config = cached[1]
+    else:
+        with open(config_path, 'r') as file:
+            config = yaml.safe_load(file)
+        _config_cache[config_path] = (signature, config)
+
+    for overrides in _config_overrides:
+        config = _merge_config(config, overrides)
+
     return config
 
 
+def _format_yaml_scalar(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def save_runtime_config(settings, config_path="configs/config.yaml"):
+    """
+    Write runtime settings into the 'runtime' section of the configuration file.
+
+    Only the given keys are touched: existing values are replaced in place, keeping their
+    comments, and new keys are appended to the section. The rest of the file is unchanged.
+
+    Args:
+        settings (dict): Runtime keys and scalar values to write.
+        config_path (str): Path to the configuration file.
+    """
+    with open(config_path, 'r') as file:
+        lines = file.read().splitlines()
+
+    # Locate the runtime block (up to the next top-level key), creating it if missing
+    try:
+        start = lines.index('runtime:')
+    except ValueError:
+        lines += ['', 'runtime:']
+        start = len(lines) - 1
+
+    end = start + 1
+    while end < len(lines) and (not lines[end].strip() or lines[end].startswith((' ', '#'))):
+        end += 1
+    while end > start + 1 and not lines[end - 1].strip():
+        end -= 1
+
+    block = lines[start + 1:end]
+    for key, value in settings.items():
+        pattern = re.compile(rf'^(\s+{re.escape(key)}:\s*)([^#]*?)(\s*#.*)?$')
+        for i, line in enumerate(block):
+            match = pattern.match(line)
+            if match:
+                block[i] = match.group(1) + _format_yaml_scalar(value) + (match.group(3) or '')
+                break
+        else:
+            block.append(f'  {key}: {_format_yaml_scalar(value)}')
+
+    lines[start + 1:end] = block
+
+    with open(config_path, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
 def load_yolo_weights_config():
     """
     Load YOLO weights path.
@@ -41,6 +147,97 @@ def load_yolo_thresh_config():
     return confidence_threshold
 
 
+def load_yolo_cascade_config():
+    """
+    Load the two-tier detector cascade settings.
+
+    Returns:
+        cascade_config (dict): Cascade section of the YOLO configuration (disabled if missing).
+    """
+    config = load_config()
+    cascade_config = config['yolo_model'].get('cascade') or {'enabled': False}
+
+    return cascade_config
+
+
+def load_ocr_backend_config():
+    """
+    Load OCR engine selection and backend-specific settings.
+
+    Returns:
+        ocr_config (dict): OCR model section of the configuration ('backend' and per-backend options).
+    """
+    config = load_config()
+    ocr_config = config.get('ocr_model') or {'backend': 'paddle'}
+
+    return ocr_config
+
+
+def load_template_grid_config():
+    """
+    Load the table template used by the template-grid fast path.
+
+    Returns:
+        grid_config (dict): Template grid section of the configuration (disabled if missing).
+    """
+    config = load_config()
+    grid_config = config.get('template_grid') or {'enabled': False}
+
+    return grid_config
+
+
+def load_rectify_config():
+    """
+    Load the settings of the table perspective deskew stage.
+
+    Returns:
+        rectify_config (dict): Rectify section of the configuration (disabled if missing).
+    """
+    config = load_config()
+    rectify_config = config.get('rectify') or {'enabled': False}
+
+    return rectify_config
+
+
+def load_row_refinement_config():
+    """
+    Load the settings of the targeted re-OCR of missing rows.
+
+    Returns:
+        refine_config (dict): Row refinement section of the configuration (disabled if missing).
+    """
+    config = load_config()
+    refine_config = config.get('row_refinement') or {'enabled': False}
+
+    return refine_config
+
+
+def load_mosaic_config():
+    """
+    Load the settings of the batched mosaic OCR mode.
+
+    Returns:
+        mosaic_config (dict): Mosaic section of the configuration (disabled if missing).
+    """
+    config = load_config()
+    mosaic_config = config.get('mosaic') or {'enabled': False}
+
+    return mosaic_config
+
+
+def load_incremental_ocr_config():
+    """
+    Load the settings of the early-stopping incremental OCR mode.
+
+    Returns:
+        incremental_config (dict): Incremental OCR section of the configuration (disabled if missing).
+    """
+    config = load_config()
+    incremental_config = config.get('incremental_ocr') or {'enabled': False}
+
+    return incremental_config
+
+
 def load_vehicle_cat_config(is_to_sort):
     """
     Load vehicle category constraints from the configuration.
@@ -88,3 +285,66 @@ def load_output_path_config():
     return folder_path
 
 
+def load_runtime_config():
+    """
+    Load process runtime settings used when sharing models between threads.
+
+    Returns:
+        runtime (dict): Runtime section of the configuration ('model_pool_size', 'intra_op_threads').
+    """
+    config = load_config()
+    runtime = config.get('runtime') or {}
+
+    return runtime
+
+
+def load_scheduler_config():
+    """
+    Load the priority classes and worker count of the request scheduler.
+
+    Returns:
+        scheduler_config (dict): Scheduler section of the configuration ('workers', 'classes').
+    """
+    config = load_config()
+    scheduler_config = config.get('scheduler') or {}
+
+    return scheduler_config
+
+
+def load_watch_config():
+    """
+    Load the settings of the watch-folder ingestion mode.
+
+    Returns:
+        watch_config (dict): Watch section of the configuration ('settle_seconds', 'poll_interval', 'max_batch_wait', 'processed_dir', 'failed_dir').
+    """
+    config = load_config()
+    watch_config = config.get('watch') or {}
+
+    return watch_config
+
+
+def load_diagnostics_config():
+    """
+    Load slow-request capture settings from the configuration.
+
+    Returns:
+        diagnostics (dict): Diagnostics section of the configuration ('slow_request_threshold', 'capture_dir').
+    """
+    config = load_config()
+    diagnostics = config.get('diagnostics') or {}
+
+    return diagnostics
+
+
+def load_deadline_config():
+    """
+    Load the OCR cost estimates used to degrade requests that run under a deadline.
+
+    Returns:
+        deadline (dict): Deadline section of the configuration ('ocr_seconds_per_megapixel', 'angle_cls_share', 'low_res_max_side').
+    """
+    config = load_config()
+    deadline = config.get('deadline') or {}
+
+    return deadline
@@ -0,0 +1,147 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+from .config_loader import load_deadline_config
+
+
+# Cheapest last: each level drops one more expensive step; 'partial' means the budget was spent before OCR
+DEGRADATION_LEVELS = ('full', 'no_angle_cls', 'low_res', 'no_fallback', 'partial')
+
+
+class DeadlinePlanner:
+    """
+    Chooses how much OCR work a request can afford in its remaining time budget, and counts the levels used.
+
+    OCR time is estimated as seconds per megapixel of OCR input. The estimate starts from config.yaml
+    and follows the observed OCR stage times with an exponential moving average. Safe to share between threads.
+    """
+
+    def __init__(self, seconds_per_megapixel: Optional[float] = None, angle_cls_share: Optional[float] = None,
+                 low_res_max_side: Optional[int] = None, smoothing: float = 0.2) -> None:
+        """
+        Args:
+            seconds_per_megapixel (Optional[float]): Initial OCR time per megapixel, with the angle classifier. Read from config.yaml if None.
+            angle_cls_share (Optional[float]): Share of OCR time spent in the angle classifier. Read from config.yaml if None.
+            low_res_max_side (Optional[int]): Longest side of the OCR input at the 'low_res' level. Read from config.yaml if None.
+            smoothing (float): Weight of a new observation in the moving average.
+        """
+        deadline = load_deadline_config()
+
+        self.seconds_per_megapixel = seconds_per_megapixel or deadline.get('ocr_seconds_per_megapixel', 4.0)
+        self.angle_cls_share = angle_cls_share if angle_cls_share is not None else deadline.get('angle_cls_share', 0.15)
+        self.low_res_max_side = low_res_max_side or deadline.get('low_res_max_side', 640)
+        self.smoothing = smoothing
+        self.level_counts = {level: 0 for level in DEGRADATION_LEVELS}
+        self._lock = threading.Lock()
+
+    def low_res_scale(self, shape: Tuple[int, ...]) -> float:
+        """
+        Returns:
+            float: Resize factor of an image of the given shape at the 'low_res' level (at most 1).
+        """
+        return min(1.0, self.low_res_max_side / max(shape[:2]))
+
+    def estimate(self, shape: Tuple[int, ...], cls: bool = True, scale: float = 1.0) -> float:
+        """
+        Estimate the OCR time of an image.
+
+        Args:
+            shape (Tuple[int, ...]): Shape of the OCR input before resizing.
+            cls (bool): Whether the angle classifier runs.
+            scale (float): Resize factor applied before OCR.
+
+        Returns:
+            float: Estimated OCR seconds.
+        """
+        megapixels = shape[0] * shape[1] * scale * scale / 1e6
+        seconds = self.seconds_per_megapixel * megapixels
+        return seconds if cls else seconds * (1 - self.angle_cls_share)
+
+    def choose(self, remaining: float, shape: Tuple[int, ...], table_found: bool) -> str:
+        """
+        Pick the most thorough level whose estimated OCR time fits in the remaining budget.
+
+        When nothing fits, a detected table is still read at 'low_res' (its rows are worth the overrun),
+        while OCR of the whole image (the fallback when no table was found) is skipped.
+
+        Args:
+            remaining (float): Seconds left until the deadline.
+            shape (Tuple[int, ...]): Shape of the OCR input.
+            table_found (bool): Whether the OCR input is a detected table rather than the whole image.
+
+        Returns:
+            str: One of DEGRADATION_LEVELS.
+        """
+        if remaining <= 0:
+            return 'partial'
+
+        candidates = (
+            ('full', self.estimate(shape, cls=True)),
+            ('no_angle_cls', self.estimate(shape, cls=False)),
+            ('low_res', self.estimate(shape, cls=False, scale=self.low_res_scale(shape))),
+        )
+        for level, seconds in candidates:
+            if seconds <= remaining:
+                return level
+
+        return 'low_res' if table_found else 'no_fallback'
+
+    def observe(self, seconds: float, shape: Tuple[int, ...], cls: bool = True, scale: float = 1.0) -> None:
+        """
+        Update the OCR time estimate with an observed OCR stage time.
+
+        Args:
+            seconds (float): Observed OCR seconds.
+            shape (Tuple[int, ...]): Shape of the OCR input before resizing.
+            cls (bool): Whether the angle classifier ran.
+            scale (float): Resize factor applied before OCR.
+        """
+        megapixels = shape[0] * shape[1] * scale * scale / 1e6
+        if megapixels <= 0:
+            return
+
+        observed = seconds / megapixels
+        if not cls:
+            observed /= (1 - self.angle_cls_share)
+
+        with self._lock:
+            self.seconds_per_megapixel += self.smoothing * (observed - self.seconds_per_megapixel)
+
+    def record(self, level: str) -> None:
+        """
+        Count one request served at the given level.
+        """
+        with self._lock:
+            self.level_counts[level] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Requests per degradation level, their shares and the current OCR time estimate.
+        """
+        with self._lock:
+            total = sum(self.level_counts.values())
+            return {
+                'requests': total,
+                'levels': dict(self.level_counts),
+                'shares': {level: round(count / total, 3) if total else 0.0 for level, count in self.level_counts.items()},
+                'ocr_seconds_per_megapixel': round(self.seconds_per_megapixel, 3),
+            }
+
+
+_planner: Optional[DeadlinePlanner] = None
+_planner_lock = threading.Lock()
+
+
+def get_deadline_planner() -> DeadlinePlanner:
+    """
+    Return the process-wide deadline planner, creating it from config.yaml on first use.
+
+    Returns:
+        DeadlinePlanner: Shared planner instance.
+    """
+    global _planner
+
+    with _planner_lock:
+        if _planner is None:
+            _planner = DeadlinePlanner()
+        return _planner
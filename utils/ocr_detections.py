@@ -0,0 +1,147 @@
+import numpy as np
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+class OCRDetections:
+    """
+    Text detections of one or more images, held in flat arrays instead of nested lists.
+
+    'boxes' is a float64 array of shape (N, 4, 2), 'texts' a unicode array and 'confidences' a
+    float64 array of N entries, and the detections of image i are rows offsets[i]:offsets[i + 1].
+    Float64 keeps the coordinates and scores exactly as OCR returned them, so thresholds and
+    nearest-neighbour ties resolve as they do on the nested lists.
+    Selecting images or detections gives views or compact copies of these arrays, never per-box
+    Python lists. Pickling with protocol 5 passes the arrays as out-of-band buffers, so with a
+    buffer_callback (or multiprocessing shared memory) the detections cross processes without copies.
+    """
+
+    __slots__ = ('boxes', 'texts', 'confidences', 'offsets')
+
+    def __init__(self, boxes: np.ndarray, texts: np.ndarray, confidences: np.ndarray, offsets: Optional[np.ndarray] = None) -> None:
+        """
+        Args:
+            boxes (np.ndarray): Box corners, shape (N, 4, 2).
+            texts (np.ndarray): Recognized texts, shape (N,).
+            confidences (np.ndarray): Recognition confidences, shape (N,).
+            offsets (Optional[np.ndarray]): Start of each image's detections followed by N. One image if None.
+        """
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4, 2)
+        self.texts = np.asarray(texts, dtype=np.str_).reshape(-1)
+        self.confidences = np.asarray(confidences, dtype=np.float64).reshape(-1)
+        self.offsets = np.array([0, len(self.boxes)], dtype=np.int64) if offsets is None else np.asarray(offsets, dtype=np.int64)
+
+    @classmethod
+    def from_paddle(cls, results: Sequence[List[Any]]) -> 'OCRDetections':
+        """
+        Collect the PaddleOCR outputs of several images.
+
+        Args:
+            results (Sequence[List[Any]]): One PaddleOCR output ([[box, (text, confidence)], ...] wrapped in a list, or [None]) per image.
+
+        Returns:
+            OCRDetections: Detections of all images, in input order.
+        """
+        boxes, texts, confidences, counts = [], [], [], []
+        for result in results:
+            lines = result[0] or []
+            counts.append(len(lines))
+            for bbox, (text, confidence) in lines:
+                boxes.append(bbox)
+                texts.append(text)
+                confidences.append(confidence)
+
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # Flattened corner by corner: faster than building the (N, 4, 2) array from nested lists
+        corners = np.fromiter(chain.from_iterable(chain.from_iterable(boxes)), dtype=np.float64, count=8 * len(boxes))
+        return cls(corners.reshape(-1, 4, 2), np.array(texts, dtype=np.str_),
+                   np.array(confidences, dtype=np.float64), offsets)
+
+    @classmethod
+    def from_ocr_results(cls, ocr_results: Any) -> 'OCRDetections':
+        """
+        Args:
+            ocr_results (Any): PaddleOCR output of one image, or detections (returned as they are).
+
+        Returns:
+            OCRDetections: Detections of the image.
+        """
+        return ocr_results if isinstance(ocr_results, OCRDetections) else cls.from_paddle([ocr_results])
+
+    @classmethod
+    def concat(cls, items: Sequence['OCRDetections']) -> 'OCRDetections':
+        """
+        Args:
+            items (Sequence[OCRDetections]): Detections to join, each holding one or more images.
+
+        Returns:
+            OCRDetections: Detections of all their images, in order.
+        """
+        if not items:
+            return cls(np.empty((0, 4, 2), dtype=np.float64), np.empty(0, dtype=np.str_), np.empty(0, dtype=np.float64),
+                       np.zeros(1, dtype=np.int64))
+
+        starts = np.cumsum([0] + [len(item) for item in items[:-1]])
+        offsets = np.concatenate([[0]] + [item.offsets[1:] + start for item, start in zip(items, starts)])
+
+        return cls(np.concatenate([item.boxes for item in items]), np.concatenate([item.texts for item in items]),
+                   np.concatenate([item.confidences for item in items]), offsets)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    @property
+    def num_images(self) -> int:
+        """Number of images."""
+        return len(self.offsets) - 1
+
+    def image(self, index: int) -> 'OCRDetections':
+        """
+        Args:
+            index (int): Image index.
+
+        Returns:
+            OCRDetections: Detections of one image, as views of these arrays.
+        """
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return OCRDetections(self.boxes[start:end], self.texts[start:end], self.confidences[start:end])
+
+    def take(self, indices: Sequence[int], texts: Optional[Sequence[str]] = None) -> 'OCRDetections':
+        """
+        Select detections of a single-image container, optionally replacing their texts.
+
+        Args:
+            indices (Sequence[int]): Detection indices, in the wanted order.
+            texts (Optional[Sequence[str]]): New text of each selected detection (e.g. a cleaned label). Kept if None.
+
+        Returns:
+            OCRDetections: The selected detections as one image.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        return OCRDetections(self.boxes[indices], self.texts[indices] if texts is None else np.array(texts, dtype=np.str_),
+                             self.confidences[indices])
+
+    def centers(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Center (x, y) of each box, midway between its extreme corners, shape (N, 2).
+        """
+        return (self.boxes.min(axis=1) + self.boxes.max(axis=1)) / 2
+
+    def to_paddle(self, image: int = 0) -> List[Any]:
+        """
+        Args:
+            image (int): Image index.
+
+        Returns:
+            List[Any]: PaddleOCR output of the image.
+        """
+        start, end = self.offsets[image], self.offsets[image + 1]
+        lines = [[self.boxes[i].tolist(), (str(self.texts[i]), float(self.confidences[i]))] for i in range(start, end)]
+        return [lines or None]
+
+    def __reduce__(self) -> Tuple[Any, Tuple[np.ndarray, ...]]:
+        # The arrays pickle themselves, out-of-band under protocol 5
+        return OCRDetections, (self.boxes, self.texts, self.confidences, self.offsets)
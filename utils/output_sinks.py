@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from inputs.archives import MEMBER_SEPARATOR
+from .config_loader import load_output_path_config
+from .save_csv import save_csv
+
+
+class CsvSink:
+    """
+    Writes one CSV per image with detected rows into the output directory (the pipeline's default output).
+
+    Files are named after the image's base name without its extension (the member's, for archive members). Existing CSVs are never overwritten:
+    if the name is taken (same-named images in other directories or archives, a reused watch-folder name,
+    or an earlier run), a numeric suffix is added. Safe to share between threads.
+    """
+
+    def __init__(self, save_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            save_dir (Optional[str]): Output directory. Read from config.yaml if None.
+        """
+        self.save_dir = save_dir or load_output_path_config()
+        if not self.save_dir.endswith(('/', os.sep)):
+            self.save_dir += '/'
+        os.makedirs(self.save_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    def _claim_name(self, key: str) -> str:
+        member = key.rsplit(MEMBER_SEPARATOR, 1)[-1]
+        stem = os.path.splitext(os.path.basename(member))[0]
+        with self._lock:
+            name, count = stem, 1
+            while os.path.exists(self.save_dir + name + '.csv'):
+                count += 1
+                name = f'{stem}_{count}'
+            # Reserve the name until the rows are written
+            open(self.save_dir + name + '.csv', 'w').close()
+        return name
+
+    def write(self, key: str, rows: Dict[str, List[str]], feedback: str) -> None:
+        """
+        Store the rows of one image. Images without rows produce no file.
+
+        Args:
+            key (str): Image path or name; its base name names the CSV file.
+            rows (Dict[str, List[str]]): Category mapped to [issued, expiry] dates.
+            feedback (str): Feedback message of the pipeline.
+        """
+        if rows:
+            save_csv(rows, key, self.save_dir, self._claim_name(key))
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlSink:
+    """
+    Appends one JSON line per image ({"file", "feedback", "rows"}) to a single file. Safe to share between threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Output file, created or appended to.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write(self, key: str, rows: Dict[str, List[str]], feedback: str) -> None:
+        line = json.dumps({'file': key, 'feedback': feedback, 'rows': rows})
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def create_sink(kind: str, path: Optional[str] = None):
+    """
+    Create an output sink by name.
+
+    Args:
+        kind (str): 'csv' (one file per image in a directory) or 'jsonl' (one line per image in a file).
+        path (Optional[str]): Output directory for 'csv' (config.yaml default if None) or file for 'jsonl'.
+
+    Returns:
+        CsvSink or JsonlSink: The output sink.
+
+    Raises:
+        ValueError: If the sink kind is unknown or a 'jsonl' sink has no path.
+    """
+    if kind == 'csv':
+        return CsvSink(path)
+    if kind == 'jsonl':
+        if not path:
+            raise ValueError("A 'jsonl' sink needs an output file path.")
+        return JsonlSink(path)
+
+    raise ValueError(f"Unknown output sink: {kind}")
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict
+
+
+class RunSummary:
+    """
+    Accumulates the outcome of every image of a run: counts and file lists per feedback message
+    (the 'output.json' layout), failures, images skipped without being processed, per-stage time totals
+    and throughput. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self.feedback: Dict[str, list] = {}
+        self.failures: Dict[str, str] = {}
+        self.skipped: Dict[str, str] = {}
+        self.stage_seconds: Dict[str, float] = {}
+        self.images = 0
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, key: str, trace: Dict[str, Any]) -> None:
+        """
+        Record one processed image.
+
+        Args:
+            key (str): Image path or name.
+            trace (Dict[str, Any]): Pipeline trace with 'feedback' or 'error', and 'timings'.
+        """
+        with self._lock:
+            self.images += 1
+
+            if trace.get('error') is not None:
+                self.failures[key] = trace['error']
+            else:
+                entry = self.feedback.setdefault(trace['feedback'], [0, []])
+                entry[0] += 1
+                entry[1].append(key)
+
+            for stage, seconds in trace.get('timings', {}).items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def skip(self, key: str, reason: str) -> None:
+        """
+        Record an image that was not processed. It does not count towards the processed images.
+
+        Args:
+            key (str): Image path or name.
+            reason (str): Why the image was skipped.
+        """
+        with self._lock:
+            self.skipped[key] = reason
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Summary report of the run so far.
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._start
+            return {
+                'images': self.images,
+                'elapsed_seconds': round(elapsed, 3),
+                'images_per_second': round(self.images / elapsed, 3) if elapsed else 0.0,
+                'stage_seconds': {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+                'feedback': {message: [count, list(files)] for message, (count, files) in self.feedback.items()},
+                'failures': dict(self.failures),
+                'skipped': dict(self.skipped),
+            }
+
+    def write(self, path: str) -> None:
+        """
+        Write the summary report as JSON.
+
+        Args:
+            path (str): Output file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
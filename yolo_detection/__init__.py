@@ -1,2 +1,3 @@
 from .load_model import load_model
-from .detect_info_table import detect_info_table
\ No newline at end of file
+from .detect_info_table import detect_info_table, detect_info_tables, crop_info_table
+from .cascade import DetectorCascade, CascadeStats, load_cascade, get_cascade_stats
\ No newline at end of file
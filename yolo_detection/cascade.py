@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+from ultralytics import YOLO
+from .load_model import load_model
+from .utils import get_best_chart_box
+
+
+class CascadeStats:
+    """
+    Counts images, escalations and time per tier of detector cascades. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self.images = 0
+        self.escalations = 0
+        self.tier_seconds = {'cheap': 0.0, 'full': 0.0}
+        self._lock = threading.Lock()
+
+    def add(self, images: int, escalations: int, cheap_seconds: float, full_seconds: float) -> None:
+        with self._lock:
+            self.images += images
+            self.escalations += escalations
+            self.tier_seconds['cheap'] += cheap_seconds
+            self.tier_seconds['full'] += full_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Images, escalation rate and mean latency per image of each tier (full tier over escalated images only).
+        """
+        with self._lock:
+            return {
+                'images': self.images,
+                'escalations': self.escalations,
+                'escalation_rate': round(self.escalations / self.images, 3) if self.images else 0.0,
+                'cheap_ms_per_image': round(1000 * self.tier_seconds['cheap'] / self.images, 2) if self.images else 0.0,
+                'full_ms_per_image': round(1000 * self.tier_seconds['full'] / self.escalations, 2) if self.escalations else 0.0,
+            }
+
+
+_stats = CascadeStats()
+
+
+def get_cascade_stats() -> CascadeStats:
+    """
+    Returns:
+        CascadeStats: Process-wide statistics shared by all cascades created without their own.
+    """
+    return _stats
+
+
+class DetectorCascade:
+    """
+    Two-tier table detector called like a YOLO model.
+
+    Every image first goes through a cheap tier (a smaller model, or the full model at a lower
+    input size). Only images whose best class-0 confidence is below 'escalate_below' are run
+    again through the full model, in one batch.
+    """
+
+    def __init__(self, full_model: YOLO, cheap_model: Optional[YOLO] = None, cheap_imgsz: Optional[int] = 320,
+                 escalate_below: float = 0.85, stats: Optional[CascadeStats] = None) -> None:
+        """
+        Args:
+            full_model (YOLO): Fine-tuned model used at its default input size.
+            cheap_model (Optional[YOLO]): Smaller model for the first tier. The full model is used if None.
+            cheap_imgsz (Optional[int]): Input size of the first tier. Model default if None.
+            escalate_below (float): Best class-0 confidence under which an image is escalated to the full model.
+            stats (Optional[CascadeStats]): Statistics to update. The process-wide statistics if None.
+
+        Raises:
+            ValueError: If the first tier would be identical to the full model.
+        """
+        if cheap_model is None and cheap_imgsz is None:
+            raise ValueError("The cheap tier needs its own model or a lower input size.")
+
+        self.full_model = full_model
+        self.cheap_model = cheap_model if cheap_model is not None else full_model
+        self.cheap_options = {'imgsz': cheap_imgsz} if cheap_imgsz is not None else {}
+        self.escalate_below = escalate_below
+        self.stats = stats if stats is not None else get_cascade_stats()
+
+    def __call__(self, source: Union[str, np.ndarray, List[Union[str, np.ndarray]]]) -> List[Any]:
+        """
+        Detect tables in one image or a batch of images.
+
+        Args:
+            source (Union[str, np.ndarray, List[Union[str, np.ndarray]]]): Image path, BGR image, or a list of either.
+
+        Returns:
+            List[Results]: One YOLO result per image, in input order.
+        """
+        images = source if isinstance(source, list) else [source]
+
+        start = time.perf_counter()
+        results = list(self.cheap_model(images, **self.cheap_options))
+        cheap_seconds = time.perf_counter() - start
+
+        escalated = [i for i, result in enumerate(results) if get_best_chart_box([result])[1] < self.escalate_below]
+
+        start = time.perf_counter()
+        if escalated:
+            for i, result in zip(escalated, self.full_model([images[i] for i in escalated])):
+                results[i] = result
+        full_seconds = time.perf_counter() - start
+
+        self.stats.add(len(images), len(escalated), cheap_seconds, full_seconds)
+
+        return results
+
+
+def load_cascade(weights_path: str, cascade_config: Dict[str, Any], num_threads: Optional[int] = None) -> DetectorCascade:
+    """
+    Load the full model and, if configured, a smaller first-tier model into a detector cascade.
+
+    Args:
+        weights_path (str): Path to the fine-tuned YOLO weights.
+        cascade_config (Dict[str, Any]): 'cascade' section of the YOLO configuration.
+        num_threads (Optional[int]): Torch intra-op thread count.
+
+    Returns:
+        DetectorCascade: Cascade ready to be used in place of a YOLO model.
+    """
+    full_model = load_model(weights_path, num_threads=num_threads)
+
+    cheap_weights_path = cascade_config.get('cheap_weights_path')
+    cheap_model = load_model(cheap_weights_path, num_threads=num_threads) if cheap_weights_path else None
+
+    return DetectorCascade(full_model, cheap_model,
+                           cheap_imgsz=cascade_config.get('cheap_imgsz', 320),
+                           escalate_below=cascade_config.get('escalate_below', 0.85))
@@ -1,7 +1,8 @@
-from .utils import get_chart_bounding_box, crop_bounding_box
+from .utils import get_best_chart_box, crop_bounding_box
+import cv2
 import numpy as np
 from ultralytics import YOLO
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 
 # def detect_info_table(model, image_path):
@@ -31,7 +32,35 @@ from typing import List, Union
 #     return crops
 
 
-def detect_info_table(model: YOLO, image_path: str) -> Union[List[np.ndarray], np.ndarray]:
+def crop_info_table(result: Any, trace: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Crop the license data table out of one YOLO result if it was detected with a confidence score above .85,
+    else return the original image.
+
+    Args:
+        result (Results): YOLO result of one image.
+        trace (Optional[Dict[str, Any]]): If given, the best table box, its confidence and whether it was accepted are stored under 'yolo_box', 'yolo_conf' and 'table_found'.
+
+    Returns:
+        np.ndarray: Cropped region of the detected table or the original image.
+    """
+    # Get bounding box of the table 
+    bbox, conf, image_array = get_best_chart_box([result])
+
+    if trace is not None:
+        trace['yolo_box'] = None if bbox is None else [float(v) for v in bbox]
+        trace['yolo_conf'] = conf
+        trace['table_found'] = conf >= 0.85
+
+    # Crop or return full image
+    if conf >= 0.85:
+        crop = crop_bounding_box(image_array, bbox)
+        return crop
+    else:
+        return image_array
+
+
+def detect_info_table(model: YOLO, image_path: Union[str, np.ndarray], trace: Optional[Dict[str, Any]] = None) -> Union[List[np.ndarray], np.ndarray]:
     """
     Detects a license data table in an image using a YOLO model. If the model detects the table 
     with a confidence score above .85, it returns the cropped region. 
@@ -39,28 +68,58 @@ def detect_info_table(model: YOLO, image_path: str) -> Union[List[np.ndarray], n
 
     Args:
         model (YOLO): Loaded YOLO model.
-        image_path (str): Path to the input image.
+        image_path (Union[str, np.ndarray]): Path to the input image, or the decoded BGR image.
+        trace (Optional[Dict[str, Any]]): If given, the best table box, its confidence and whether it was accepted are stored under 'yolo_box', 'yolo_conf' and 'table_found'.
 
     Returns:
         np.ndarray: Cropped region of the detected table or the original image.
 
     Raises:
         FileNotFoundError: If the image is not in the given path.
+        RuntimeError: If detection fails on a decoded image.
     """
 
     try:
         # Run YOLO inference
         results = model(image_path)
 
-        # Get bounding box of the table 
-        bbox, image_array, is_bbox_available = get_chart_bounding_box(results)
+        return crop_info_table(results[0], trace)
+
+    except Exception as e:
+        if not isinstance(image_path, str):
+            raise RuntimeError(f"Table detection failed: {e}")
+        raise FileNotFoundError("Image not found at: " + image_path)
 
-        # Crop or return full image
-        if is_bbox_available:
-            crop = crop_bounding_box(image_array, bbox)
-            return crop
-        else:
-            return image_array
+
+def detect_info_tables(model: YOLO, image_paths: List[Union[str, np.ndarray]], traces: Optional[List[Dict[str, Any]]] = None) -> List[np.ndarray]:
+    """
+    Detects the license data tables of several images with one batched YOLO call.
+
+    Args:
+        model (YOLO): Loaded YOLO model.
+        image_paths (List[Union[str, np.ndarray]]): Paths to the input images or decoded BGR images.
+        traces (Optional[List[Dict[str, Any]]]): One trace per image, filled in as by detect_info_table.
+
+    Returns:
+        List[np.ndarray]: Cropped table or original image for each input, in input order.
+
+    Raises:
+        RuntimeError: If batched inference fails.
+    """
+    if not image_paths:
+        return []
+
+    # YOLO takes a batch of paths or a batch of arrays, not a mix of both
+    images = list(image_paths)
+    if not all(isinstance(image, str) for image in images):
+        images = [cv2.imread(image) if isinstance(image, str) else image for image in images]
+
+    try:
+        # Run YOLO inference on the whole batch
+        results = model(images)
 
     except Exception as e:
-        raise FileNotFoundError("Image not found at: " + image_path)
\ No newline at end of file
+        raise RuntimeError(f"Batched table detection failed: {e}")
+
+    traces = traces if traces is not None else [None] * len(image_paths)
+    return [crop_info_table(result, trace) for result, trace in zip(results, traces)]
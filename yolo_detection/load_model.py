@@ -1,4 +1,6 @@
 from ultralytics import YOLO
+from typing import Optional
+import torch
 import os
 
 # def load_model(weights_path):
@@ -18,12 +20,14 @@ import os
 
 
 
-def load_model(weights_path: str) -> YOLO:
+def load_model(weights_path: str, num_threads: Optional[int] = None) -> YOLO:
     """
     Load a YOLO model from the specified weights file.
 
     Args:
         weights_path (str): Path to the YOLO model weights file.
+        num_threads (Optional[int]): Torch intra-op thread count. Note that torch keeps a single
+            intra-op pool per process, so this applies to every model in the process. Unchanged if None.
    
     Returns:
         model (YOLO): Loaded YOLO model.
@@ -37,6 +41,10 @@ def load_model(weights_path: str) -> YOLO:
     
 
     try:
+        # Cap torch intra-op threads before the first inference
+        if num_threads is not None:
+            torch.set_num_threads(num_threads)
+
         #load yolo model
         model = YOLO(weights_path)
         return model
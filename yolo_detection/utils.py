@@ -51,20 +51,18 @@ def crop_bounding_box(image: np.ndarray, box: List[float]) -> np.ndarray:
 #     return crops
 
 
-def get_chart_bounding_box(results: List[Results]) -> Tuple[Union[np.ndarray, None], np.ndarray, bool]:
+def get_best_chart_box(results: List[Results]) -> Tuple[Union[np.ndarray, None], float, np.ndarray]:
     """
-    Extracts the highest-confidence bounding box for class ID 0 ('chart') from YOLO detection results.
-
-    A bounding box is only returned if its confidence score is greater than 0.85.
+    Extracts the highest-confidence bounding box for class ID 0 ('chart') from YOLO detection results, without thresholding.
 
     Args:
         results (List[Results]): YOLO detection results list.
 
     Returns:
         Tuple:
-            - Union[np.ndarray, None]: Bounding box [x1, y1, x2, y2] if found, else None.
+            - Union[np.ndarray, None]: Bounding box [x1, y1, x2, y2] of the best chart, None if no chart was predicted.
+            - float: Confidence of that box (0.0 if none).
             - np.ndarray: Original input image.
-            - bool: True if a valid bounding box was found, else False.
 
     Raises:
         ValueError: If detection processing fails unexpectedly.
@@ -78,7 +76,6 @@ def get_chart_bounding_box(results: List[Results]) -> Tuple[Union[np.ndarray, No
         # Get the bounding box with highest confidence (in more boxes are predicted)
         max_conf = 0.0
         max_conf_xyxy = None
-        is_bbox_available = True
 
         for box in boxes:
             xyxy = box.xyxy.cpu().numpy()[0]    # Bounding box [x1, y1, x2, y2]
@@ -89,18 +86,40 @@ def get_chart_bounding_box(results: List[Results]) -> Tuple[Union[np.ndarray, No
                 max_conf = conf
                 max_conf_xyxy = xyxy
 
-
-        # Check the confidence of best prediction
-        if max_conf < 0.85:
-            is_bbox_available = False
-            max_conf_xyxy = None
-
-        return max_conf_xyxy, img_np, is_bbox_available
+        return max_conf_xyxy, float(max_conf), img_np
 
     except Exception as e:
         raise ValueError(f"Chart bounding box detection failed: {e}")
 
 
+def get_chart_bounding_box(results: List[Results]) -> Tuple[Union[np.ndarray, None], np.ndarray, bool]:
+    """
+    Extracts the highest-confidence bounding box for class ID 0 ('chart') from YOLO detection results.
+
+    A bounding box is only returned if its confidence score is greater than 0.85.
+
+    Args:
+        results (List[Results]): YOLO detection results list.
+
+    Returns:
+        Tuple:
+            - Union[np.ndarray, None]: Bounding box [x1, y1, x2, y2] if found, else None.
+            - np.ndarray: Original input image.
+            - bool: True if a valid bounding box was found, else False.
+
+    Raises:
+        ValueError: If detection processing fails unexpectedly.
+    """
+
+    max_conf_xyxy, max_conf, img_np = get_best_chart_box(results)
+
+    # Check the confidence of best prediction
+    if max_conf < 0.85:
+        return None, img_np, False
+
+    return max_conf_xyxy, img_np, True
+
+
 
 # def get_chart_bounding_box(results):
 #     """